@@ -7,3 +7,9 @@ class AuthenticationConfig(AppConfig):
     """Authentication AppConfig"""
 
     name = "authentication"
+
+    def ready(self):
+        """
+        Ready handler. Import signals.
+        """
+        import authentication.signals  # noqa: F401
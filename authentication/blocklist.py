@@ -0,0 +1,85 @@
+"""
+Per-process probe of the email blocklist.
+
+Every signup and login checks the user's email against the BlockList, and almost every check comes back
+negative. Each process keeps the set of blocked email hashes in memory, tagged with a blocklist version
+stored in its own shared cache (separate from the catalog cache, so clearing that one never touches it). The version is bumped whenever the blocklist changes, and a process reloads
+its set when it sees a new version, so a check only costs a cache read instead of a database query.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from users.models import BlockList
+
+BLOCKLIST_VERSION_CACHE_KEY = "blocklist:version"
+
+_blocklist_lock = threading.Lock()
+_blocklist = {"version": None, "hashed_emails": frozenset()}
+
+
+def get_blocklist_cache():
+    """Returns the cache backend used for the blocklist version"""
+    return caches[settings.BLOCKLIST_CACHE_NAME]
+
+
+def _get_blocklist_version():
+    """Returns the current blocklist version"""
+    cache = get_blocklist_cache()
+    version = cache.get(BLOCKLIST_VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(BLOCKLIST_VERSION_CACHE_KEY, time.time_ns(), timeout=None)
+        version = cache.get(BLOCKLIST_VERSION_CACHE_KEY)
+    return version
+
+
+def _get_blocked_hashed_emails():
+    """Returns the blocked email hashes, reloading them if the blocklist has changed"""
+    version = _get_blocklist_version()
+    if _blocklist["version"] != version:
+        with _blocklist_lock:
+            if _blocklist["version"] != version:
+                # the version is read before the blocklist, so a change made during the load
+                # is picked up by the next check
+                _blocklist["hashed_emails"] = frozenset(
+                    BlockList.objects.values_list("hashed_email", flat=True).iterator()
+                )
+                _blocklist["version"] = version
+    return _blocklist["hashed_emails"]
+
+
+def is_hashed_email_blocked(hashed_email):
+    """
+    Returns True if an email hash is in the blocklist
+
+    Args:
+        hashed_email (str): The hex md5 hash of the lowercased email
+
+    Returns:
+        bool: True if the email is blocked
+    """
+    if not settings.BLOCKLIST_PROBE_ENABLED:
+        return BlockList.objects.filter(hashed_email=hashed_email).exists()
+    return hashed_email in _get_blocked_hashed_emails()
+
+
+def bump_blocklist_version():
+    """
+    Increments the blocklist version once the current transaction (if any) commits, which makes
+    every process reload its blocklist
+    """
+    if not settings.BLOCKLIST_PROBE_ENABLED:
+        return
+
+    def _bump():
+        cache = get_blocklist_cache()
+        try:
+            cache.incr(BLOCKLIST_VERSION_CACHE_KEY)
+        except ValueError:
+            cache.add(BLOCKLIST_VERSION_CACHE_KEY, time.time_ns(), timeout=None)
+
+    transaction.on_commit(_bump)
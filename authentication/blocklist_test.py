@@ -0,0 +1,59 @@
+"""Tests for the in-memory blocklist probe"""
+
+import pytest
+from django.core.cache import caches
+
+from authentication.utils import get_md5_hash, is_user_email_blocked
+from users.api import block_emails
+from users.models import BlockList
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def blocklist_probe(settings):
+    """Enable the blocklist probe with an empty local memory cache"""
+    settings.BLOCKLIST_PROBE_ENABLED = True
+    settings.BLOCKLIST_CACHE_NAME = "default"
+    cache = caches["default"]
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def test_blocklist_probe(
+    blocklist_probe,  # noqa: ARG001
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    """The blocklist should be loaded once, and reloaded after it changes"""
+    with django_capture_on_commit_callbacks(execute=True):
+        BlockList.objects.create(
+            hashed_email=get_md5_hash("blocked@example.com").hexdigest()
+        )
+
+    with django_assert_num_queries(1):
+        assert is_user_email_blocked("Blocked@example.com") is True
+        assert is_user_email_blocked("allowed@example.com") is False
+        assert is_user_email_blocked("other@example.com") is False
+
+    with django_capture_on_commit_callbacks(execute=True):
+        block_emails(["allowed@example.com"])
+    assert is_user_email_blocked("allowed@example.com") is True
+
+    with django_capture_on_commit_callbacks(execute=True):
+        BlockList.objects.filter(
+            hashed_email=get_md5_hash("blocked@example.com").hexdigest()
+        ).delete()
+    assert is_user_email_blocked("blocked@example.com") is False
+
+
+def test_blocklist_probe_disabled(django_assert_num_queries):
+    """The blocklist should be queried directly if the probe is disabled"""
+    BlockList.objects.create(
+        hashed_email=get_md5_hash("blocked@example.com").hexdigest()
+    )
+
+    with django_assert_num_queries(2):
+        assert is_user_email_blocked("blocked@example.com") is True
+        assert is_user_email_blocked("allowed@example.com") is False
@@ -1,9 +1,7 @@
 """Auth pipline functions for user authentication"""
 
-import json
 import logging
 
-import requests
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import IntegrityError
@@ -27,11 +25,16 @@ from authentication.exceptions import (
     UnexpectedExistingUserException,
     UserCreationFailedException,
 )
-from authentication.utils import SocialAuthState, is_user_email_blocked
+from authentication.utils import (
+    SocialAuthState,
+    get_md5_hash,
+    is_user_email_blocked,
+)
 from compliance import api as compliance_api
-from courseware import api as courseware_api
 from courseware import tasks as courseware_tasks
+from hubspot_xpro import tasks as hubspot_tasks
 from hubspot_xpro.task_helpers import sync_hubspot_user
+from mitxpro.outbox import enqueue_task
 from users.serializers import ProfileSerializer, UserSerializer
 from users.constants import USERNAME_MAX_LEN
 
@@ -39,7 +42,6 @@ log = logging.getLogger()
 
 User = get_user_model()
 
-CREATE_COURSEWARE_USER_RETRY_DELAY = 60
 NAME_MIN_LENGTH = 2
 
 
@@ -128,7 +130,7 @@ def create_user_via_email(
 
     data["email"] = kwargs.get("email", kwargs.get("details", {}).get("email"))
 
-    if User.objects.filter(email__iexact=data["email"]).exists():
+    if User.objects.by_email(data["email"]).exists():
         raise AuthAlreadyAssociated(backend)
 
     username = usernameify(data["name"], email=data["email"])
@@ -326,7 +328,7 @@ def create_courseware_user(
     **kwargs,  # noqa: ARG001
 ):
     """
-    Create a user in the courseware, deferring a retry via celery if it fails
+    Create a user in the courseware via the outbox, which retries it if it fails
 
     Args:
         user (users.models.User): the user that was just created
@@ -335,42 +337,36 @@ def create_courseware_user(
     if not is_new or not user.is_active:
         return {}
 
-    try:
-        courseware_api.create_user(user)
-    except Exception:
-        log.exception("Error creating courseware user records on User create")
-        # try again later
-        courseware_tasks.create_user_from_id.apply_async(
-            (user.id,), countdown=CREATE_COURSEWARE_USER_RETRY_DELAY
-        )
+    enqueue_task(
+        courseware_tasks.create_user_from_id,
+        args=(user.id,),
+        idempotency_key=f"create-courseware-user:{user.id}",
+    )
 
     return {}
 
 
 def send_user_to_hubspot(request, **kwargs):
     """
-    Create a hubspot contact using the hubspot Forms API
+    Create a hubspot contact using the hubspot Forms API, via the outbox
     Submit the user's email and optionally a hubspotutk cookie
     """
     portal_id = settings.HUBSPOT_CONFIG.get("HUBSPOT_PORTAL_ID")
     form_id = settings.HUBSPOT_CONFIG.get("HUBSPOT_CREATE_USER_FORM_ID")
 
-    if not (portal_id and form_id):
-        return {}
-
-    hutk = request.COOKIES.get("hubspotutk")
     email = kwargs.get("email", kwargs.get("details", {}).get("email"))
 
-    headers = {"Content-Type": "application/x-www-form-urlencoded"}
-
-    data = {"email": email}
-
-    if hutk:
-        data["hs_context"] = json.dumps({"hutk": hutk})
+    if not (portal_id and form_id and email):
+        return {}
 
-    url = f"https://forms.hubspot.com/uploads/form/v2/{portal_id}/{form_id}?&"
+    hutk = request.COOKIES.get("hubspotutk")
 
-    requests.post(url=url, data=data, headers=headers)  # noqa: S113
+    enqueue_task(
+        hubspot_tasks.submit_create_user_form,
+        args=(email,),
+        kwargs={"hutk": hutk},
+        idempotency_key=f"hubspot-create-user-form:{get_md5_hash(email).hexdigest()}",
+    )
 
     return {}
 
@@ -18,9 +18,11 @@ from authentication.exceptions import (
     UserCreationFailedException,
 )
 from authentication.pipeline import user as user_actions
-from authentication.utils import SocialAuthState
+from authentication.utils import SocialAuthState, get_md5_hash
 from compliance.constants import RESULT_DENIED, RESULT_SUCCESS, RESULT_UNKNOWN
 from compliance.factories import ExportsInquiryLogFactory
+from hubspot_xpro.tasks import submit_create_user_form, sync_contact_with_hubspot
+from mitxpro.models import OutboxTask
 from users.factories import UserFactory
 
 
@@ -447,7 +449,7 @@ def test_create_profile(
     """
     user = UserFactory.create(profile__incomplete=True)
     settings.MITOL_HUBSPOT_API_PRIVATE_TOKEN = hubspot_key
-    mock_user_sync = mocker.patch("hubspot_xpro.tasks.sync_contact_with_hubspot.delay")
+    mock_enqueue = mocker.patch("hubspot_xpro.task_helpers.enqueue_task")
     response = user_actions.create_profile(
         mock_create_profile_strategy,
         mock_email_backend,
@@ -463,9 +465,9 @@ def test_create_profile(
         "company"
     )
     if hubspot_key is not None:
-        mock_user_sync.assert_called_with(user.id)
+        mock_enqueue.assert_called_once_with(sync_contact_with_hubspot, args=(user.id,))
     else:
-        mock_user_sync.assert_not_called()
+        mock_enqueue.assert_not_called()
 
 
 @pytest.mark.django_db
@@ -508,7 +510,7 @@ def test_send_user_to_hubspot(mocker, settings):
     """
     Tests that send_user_to_hubspot sends the correct data
     """
-    mock_requests = mocker.patch("authentication.pipeline.user.requests")
+    mock_enqueue = mocker.patch("authentication.pipeline.user.enqueue_task")
 
     mock_request = mocker.Mock(COOKIES={"hubspotutk": "somefakedata"})
 
@@ -517,6 +519,7 @@ def test_send_user_to_hubspot(mocker, settings):
         mock_request, details={"email": "test@test.co"}
     )
     assert ret_val == {}
+    mock_enqueue.assert_not_called()
 
     # Test with appropriate settings set
     settings.HUBSPOT_CONFIG["HUBSPOT_PORTAL_ID"] = "123456"
@@ -526,10 +529,11 @@ def test_send_user_to_hubspot(mocker, settings):
     )
     assert ret_val == {}
 
-    mock_requests.post.assert_called_with(
-        data={"email": "test@test.co", "hs_context": '{"hutk": "somefakedata"}'},
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
-        url="https://forms.hubspot.com/uploads/form/v2/123456/abcdefg?&",
+    mock_enqueue.assert_called_once_with(
+        submit_create_user_form,
+        args=("test@test.co",),
+        kwargs={"hutk": "somefakedata"},
+        idempotency_key=f"hubspot-create-user-form:{get_md5_hash('test@test.co').hexdigest()}",
     )
 
 
@@ -580,7 +584,6 @@ def test_activate_user(  # noqa: PLR0913
         assert user.is_active is expected
 
 
-@pytest.mark.parametrize("raises_error", [True, False])
 @pytest.mark.parametrize(
     "is_active, is_new, creates_records",  # noqa: PT006
     [
@@ -590,37 +593,26 @@ def test_activate_user(  # noqa: PLR0913
         [False, False, False],  # noqa: PT007
     ],
 )
-def test_create_courseware_user(  # noqa: PLR0913
-    mocker, user, raises_error, is_active, is_new, creates_records
+def test_create_courseware_user(
+    mocker, django_capture_on_commit_callbacks, user, is_active, is_new, creates_records
 ):
-    """Test that activate_user takes the correct action"""
+    """Test that create_courseware_user creates the courseware user via the outbox once the pipeline commits"""
     user.is_active = is_active
 
-    mock_create_user_api = mocker.patch(
-        "authentication.pipeline.user.courseware_api.create_user"
-    )
-    if raises_error:
-        mock_create_user_api.side_effect = Exception("error")
-    mock_create_user_task = mocker.patch(
-        "authentication.pipeline.user.courseware_tasks.create_user_from_id"
-    )
+    mock_create_user_api = mocker.patch("courseware.tasks.api.create_user")
 
-    assert (
-        user_actions.create_courseware_user(None, None, user=user, is_new=is_new) == {}
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        assert (
+            user_actions.create_courseware_user(None, None, user=user, is_new=is_new)
+            == {}
+        )
+        mock_create_user_api.assert_not_called()
 
     if creates_records:
         mock_create_user_api.assert_called_once_with(user)
-
-        if raises_error:
-            mock_create_user_task.apply_async.assert_called_once_with(
-                (user.id,), countdown=60
-            )
-        else:
-            mock_create_user_task.apply_async.assert_not_called()
     else:
         mock_create_user_api.assert_not_called()
-        mock_create_user_task.apply_async.assert_not_called()
+    assert not OutboxTask.objects.exists()
 
 
 @pytest.mark.parametrize(
@@ -672,7 +664,7 @@ def test_create_user_when_email_blocked(mocker):
 def test_sync_user_profile_to_hubspot(
     mocker, user, is_active, mock_create_user_strategy
 ):
-    """sync_hubspot_user should be called for active users"""
+    """The hubspot contact sync should be triggered for active users"""
     mock_sync = mocker.patch("authentication.pipeline.user.sync_hubspot_user")
     user.is_active = is_active
     assert (
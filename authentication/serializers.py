@@ -97,7 +97,7 @@ class SocialAuthSerializer(serializers.Serializer):
                     and authentication_flow == SocialAuthState.FLOW_REGISTER
                 ):
                     email = partial.data.get("kwargs").get("details").get("email")
-                    user_exists = User.objects.filter(email__iexact=email).exists()
+                    user_exists = User.objects.by_email(email).exists()
 
                     if user_exists:
                         return SocialAuthState(SocialAuthState.STATE_EXISTING_ACCOUNT)
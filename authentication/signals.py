@@ -0,0 +1,14 @@
+"""Authentication signals"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from authentication.blocklist import bump_blocklist_version
+from users.models import BlockList
+
+
+@receiver(post_save, sender=BlockList, dispatch_uid="blocklist_post_save")
+@receiver(post_delete, sender=BlockList, dispatch_uid="blocklist_post_delete")
+def handle_blocklist_change(sender, **kwargs):  # noqa: ARG001
+    """Make every process reload the blocklist when it changes"""
+    bump_blocklist_version()
@@ -5,6 +5,7 @@ import hashlib
 from social_core.utils import get_strategy
 from social_django.utils import STORAGE
 
+from authentication.blocklist import is_hashed_email_blocked
 from users.models import BlockList
 
 
@@ -78,7 +79,7 @@ def get_md5_hash(value):
 def is_user_email_blocked(email):
     """Returns the user's email blocked status"""
     hash_object = get_md5_hash(email)
-    return BlockList.objects.filter(hashed_email=hash_object.hexdigest()).exists()
+    return is_hashed_email_blocked(hash_object.hexdigest())
 
 
 def block_user_email(email):
@@ -148,8 +148,7 @@ class AuthStateMachine(RuleBasedStateMachine):
         "users.serializers.validate_name_with_edx",
         return_value="",
     )
-    courseware_api_patcher = patch("authentication.pipeline.user.courseware_api")
-    courseware_tasks_patcher = patch("authentication.pipeline.user.courseware_tasks")
+    courseware_api_patcher = patch("courseware.tasks.api")
 
     def __init__(self):
         """Setup the machine"""
@@ -162,7 +161,6 @@ class AuthStateMachine(RuleBasedStateMachine):
         self.mock_email_send = self.email_send_patcher.start()
         self.mock_edx_name_api = self.mock_edx_name_patcher.start()
         self.mock_courseware_api = self.courseware_api_patcher.start()
-        self.mock_courseware_tasks = self.courseware_tasks_patcher.start()
 
         # django test client
         self.client = Client()
@@ -183,7 +181,6 @@ class AuthStateMachine(RuleBasedStateMachine):
         # stop the patches
         self.email_send_patcher.stop()
         self.courseware_api_patcher.stop()
-        self.courseware_tasks_patcher.stop()
         self.mock_edx_name_patcher.stop()
 
         # end the transaction with a rollback to cleanup any state
@@ -0,0 +1,75 @@
+# Generated by Django 5.2.17 on 2026-10-19 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("b2b_ecommerce", "0012_alter_b2bcoupon_coupon_code"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="b2bcouponaudit",
+            name="created_on",
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AddField(
+            model_name="b2bcouponaudit",
+            name="data_diff",
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="b2bcouponaudit",
+            name="data_hash",
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name="b2bcouponaudit",
+            name="checkpoint",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="b2b_ecommerce.b2bcouponaudit",
+            ),
+        ),
+        migrations.AddField(
+            model_name="b2bcouponaudit",
+            name="checkpoint_distance",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name="b2borderaudit",
+            name="created_on",
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AddField(
+            model_name="b2borderaudit",
+            name="data_diff",
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="b2borderaudit",
+            name="data_hash",
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name="b2borderaudit",
+            name="checkpoint",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="b2b_ecommerce.b2borderaudit",
+            ),
+        ),
+        migrations.AddField(
+            model_name="b2borderaudit",
+            name="checkpoint_distance",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
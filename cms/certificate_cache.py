@@ -0,0 +1,152 @@
+"""
+Cache for rendered certificate pages.
+
+Shared certificate links get bursty anonymous traffic (e.g. link previews from social networks), and
+rendering one means loading the certificate page revision, its parent product, its overrides and the
+signatory pages. The rendered certificate (the page's head tags and body, not the base template around
+them, which has per-request settings) is cached per certificate UUID, along with a fingerprint of
+everything that can change it (the certificate page revision, the learner name, the certificate dates,
+the request URL and a version that is bumped when a certificate or signatory page is published), so a
+stale entry is never served.
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.safestring import mark_safe
+
+from courses.catalog_cache import get_catalog_cache
+
+CERTIFICATE_PAGE_CACHE_KEY_PREFIX = "certificate-page"
+CERTIFICATE_PAGES_VERSION_CACHE_KEY = "certificate-page:version"
+
+
+def _get_certificate_page_cache_key(certificate_uuid):
+    """Returns the cache key for a rendered certificate page"""
+    return f"{CERTIFICATE_PAGE_CACHE_KEY_PREFIX}:{certificate_uuid}"
+
+
+def _get_certificate_pages_version():
+    """Returns the version of the certificate and signatory pages"""
+    cache = get_catalog_cache()
+    version = cache.get(CERTIFICATE_PAGES_VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(CERTIFICATE_PAGES_VERSION_CACHE_KEY, time.time_ns(), timeout=None)
+        version = cache.get(CERTIFICATE_PAGES_VERSION_CACHE_KEY)
+    return version
+
+
+def _get_certificate_page_fingerprint(request, certificate):
+    """
+    Returns a fingerprint of the inputs of a rendered certificate page, other than the certificate itself
+    """
+    return hashlib.md5(  # noqa: S324
+        "|".join(
+            [
+                str(certificate.certificate_page_revision_id),
+                str(_get_certificate_pages_version()),
+                request.build_absolute_uri(),
+                certificate.user.get_full_name(),
+                # course run dates, or the dates of the user's course certificates for a program
+                *[str(date) for date in certificate.start_end_dates],
+            ]
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def _is_cacheable_request(request, certificate):
+    """
+    Only anonymous views are cached, since the certificate shows sharing options to its owner.
+    Certificates which aren't pinned to a page revision yet are rendered from the live page, so they
+    aren't cached either.
+    """
+    return (
+        settings.CERTIFICATE_PAGE_CACHE_ENABLED
+        and request.user.is_anonymous
+        and certificate.certificate_page_revision_id is not None
+    )
+
+
+def get_cached_certificate_page(request, certificate):
+    """
+    Returns the cached rendered certificate for a certificate page, if there is a current one
+
+    Args:
+        request (HttpRequest): The request for the certificate page
+        certificate (CourseRunCertificate or ProgramCertificate): The certificate
+
+    Returns:
+        dict or None: The certificate page template context for the rendered certificate
+    """
+    if not _is_cacheable_request(request, certificate):
+        return None
+    cached = get_catalog_cache().get(_get_certificate_page_cache_key(certificate.uuid))
+    if cached is None or cached["fingerprint"] != _get_certificate_page_fingerprint(
+        request, certificate
+    ):
+        return None
+    return {
+        "product_name": cached["product_name"],
+        "certificate_head": mark_safe(cached["head"]),  # noqa: S308
+        "certificate_body": mark_safe(cached["body"]),  # noqa: S308
+    }
+
+
+def set_cached_certificate_page(request, certificate, context):
+    """
+    Caches the rendered certificate for a certificate page
+
+    Args:
+        request (HttpRequest): The request for the certificate page
+        certificate (CourseRunCertificate or ProgramCertificate): The certificate
+        context (dict): The certificate page template context, with the rendered certificate
+    """
+    if not _is_cacheable_request(request, certificate):
+        return
+    get_catalog_cache().set(
+        _get_certificate_page_cache_key(certificate.uuid),
+        {
+            "fingerprint": _get_certificate_page_fingerprint(request, certificate),
+            "product_name": context["product_name"],
+            "head": str(context["certificate_head"]),
+            "body": str(context["certificate_body"]),
+        },
+        timeout=settings.CERTIFICATE_PAGE_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_certificate_pages(certificate_uuids):
+    """
+    Clears the cached pages for some certificates once the current transaction (if any) commits
+
+    Args:
+        certificate_uuids (iterable of UUID): The certificate UUIDs
+    """
+    if not settings.CERTIFICATE_PAGE_CACHE_ENABLED:
+        return
+    cache_keys = [
+        _get_certificate_page_cache_key(certificate_uuid)
+        for certificate_uuid in certificate_uuids
+    ]
+    if cache_keys:
+        transaction.on_commit(lambda: get_catalog_cache().delete_many(cache_keys))
+
+
+def bump_certificate_pages_version():
+    """
+    Increments the certificate pages version once the current transaction (if any) commits, which
+    invalidates every cached certificate page
+    """
+    if not settings.CERTIFICATE_PAGE_CACHE_ENABLED:
+        return
+
+    def _bump():
+        cache = get_catalog_cache()
+        try:
+            cache.incr(CERTIFICATE_PAGES_VERSION_CACHE_KEY)
+        except ValueError:
+            cache.add(CERTIFICATE_PAGES_VERSION_CACHE_KEY, time.time_ns(), timeout=None)
+
+    transaction.on_commit(_bump)
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cms", "0084_convert_other_format_to_online"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="externalcoursepage",
+            name="external_content_hash",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=64
+            ),
+        ),
+    ]
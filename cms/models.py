@@ -17,6 +17,8 @@ from django.db import models
 from django.db.models import Prefetch, Q, prefetch_related_objects
 from django.http.response import Http404
 from django.shortcuts import reverse
+from django.template.loader import render_to_string
+from django.template.response import TemplateResponse
 from django.templatetags.static import static
 from django.utils.functional import cached_property
 from django.utils.text import slugify
@@ -48,6 +50,10 @@ from wagtail.api import APIField
 
 from blog.api import fetch_blog
 from cms.api import filter_and_sort_catalog_pages
+from cms.certificate_cache import (
+    get_cached_certificate_page,
+    set_cached_certificate_page,
+)
 from cms.blocks import (
     BannerHeadingBlock,
     CourseRunCertificateOverrides,
@@ -714,10 +720,16 @@ class CertificateIndexPage(DisableSitemapURLMixin, RoutablePageMixin, Page):
         """
         # Try to fetch a certificate by the uuid passed in the URL
         try:
-            certificate = ProgramCertificate.objects.get(uuid=uuid)
+            certificate = ProgramCertificate.objects.select_related("user").get(
+                uuid=uuid
+            )
         except ProgramCertificate.DoesNotExist:
             raise Http404  # noqa: B904
 
+        cached_context = get_cached_certificate_page(request, certificate)
+        if cached_context is not None:
+            return self._serve_cached_certificate_page(request, cached_context)
+
         # Get a CertificatePage to serve this request
         certificate_page = (
             certificate.certificate_page_revision.as_object()
@@ -737,7 +749,7 @@ class CertificateIndexPage(DisableSitemapURLMixin, RoutablePageMixin, Page):
             certificate.save()
 
         certificate_page.certificate = certificate
-        return certificate_page.serve(request)
+        return self._serve_certificate_page(request, certificate, certificate_page)
 
     @route(r"^([A-Fa-f0-9-]{36})/?$")
     def course_certificate(
@@ -752,10 +764,16 @@ class CertificateIndexPage(DisableSitemapURLMixin, RoutablePageMixin, Page):
         """
         # Try to fetch a certificate by the uuid passed in the URL
         try:
-            certificate = CourseRunCertificate.objects.get(uuid=uuid)
+            certificate = CourseRunCertificate.objects.select_related(
+                "user", "course_run"
+            ).get(uuid=uuid)
         except CourseRunCertificate.DoesNotExist:
             raise Http404  # noqa: B904
 
+        cached_context = get_cached_certificate_page(request, certificate)
+        if cached_context is not None:
+            return self._serve_cached_certificate_page(request, cached_context)
+
         # Get a CertificatePage to serve this request
         certificate_page = (
             certificate.certificate_page_revision.as_object()
@@ -773,7 +791,32 @@ class CertificateIndexPage(DisableSitemapURLMixin, RoutablePageMixin, Page):
             certificate.save()
 
         certificate_page.certificate = certificate
-        return certificate_page.serve(request)
+        return self._serve_certificate_page(request, certificate, certificate_page)
+
+    def _serve_certificate_page(self, request, certificate, certificate_page):
+        """
+        Renders a certificate page, and caches the certificate for later anonymous views of it
+        """
+        response = certificate_page.serve(request)
+        response.render()
+        if response.status_code == 200:  # noqa: PLR2004
+            set_cached_certificate_page(request, certificate, response.context_data)
+        return response
+
+    def _serve_cached_certificate_page(self, request, cached_context):
+        """
+        Renders a certificate page from a cached certificate, with the per-request parts of the base
+        template rendered for this request
+        """
+        return TemplateResponse(
+            request,
+            CertificatePage.template,
+            {
+                "site_name": settings.SITE_NAME,
+                **get_base_context(request),
+                **cached_context,
+            },
+        )
 
     @route(r"^$")
     def index_route(self, request, *args, **kwargs):  # noqa: ARG002
@@ -1626,6 +1669,11 @@ class ExternalCoursePage(CourseProductPage):
 
     template = "product_page.html"
 
+    # Fingerprint of the vendor data the page was last synced from, see ExternalCourse.page_content_hash
+    external_content_hash = models.CharField(
+        max_length=64, blank=True, default="", editable=False
+    )
+
 
 class ExternalProgramPage(ProgramProductPage):
     """
@@ -2525,8 +2573,9 @@ class CertificatePage(CourseProgramChildPage):
             raise Http404
 
         # The share image url needs to be absolute
-        return {
+        context = {
             "site_name": settings.SITE_NAME,
+            "product_name": self.product_name,
             "share_image_url": urljoin(
                 request.build_absolute_uri("///"),
                 static("images/certificates/share-image.png"),
@@ -2539,6 +2588,17 @@ class CertificatePage(CourseProgramChildPage):
             **preview_context,
             **context,
         }
+        # The certificate itself is rendered separately from the base template, so that it can be cached
+        # without the per-request parts of the base template (see cms.certificate_cache)
+        return {
+            **context,
+            "certificate_head": render_to_string(
+                "partials/certificate-head.html", context, request=request
+            ),
+            "certificate_body": render_to_string(
+                "partials/certificate-body.html", context, request=request
+            ),
+        }
 
 
 @register_snippet
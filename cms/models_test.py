@@ -7,9 +7,12 @@ from decimal import Decimal
 import factory
 import pytest
 from django.conf import settings
+from django.core.cache import caches
 from django.core.exceptions import ValidationError
+from django.template.defaultfilters import date as date_filter
 from django.test.client import RequestFactory
 from django.urls import resolve, reverse
+from django.utils.timezone import localtime
 from wagtail import hooks
 from wagtail.coreutils import WAGTAIL_APPEND_SLASH
 from wagtail.test.utils.form_data import querydict_from_html
@@ -82,6 +85,7 @@ from cms.models import (
     UserTestimonialsPage,
     WhoShouldEnrollPage,
 )
+from cms.certificate_cache import bump_certificate_pages_version
 from cms.wagtail_hooks import create_product_and_versions_for_courseware_pages
 from courses.factories import (
     CourseFactory,
@@ -90,7 +94,7 @@ from courses.factories import (
     CourseRunFactory,
     ProgramCertificateFactory,
 )
-from courses.models import CourseLanguage
+from courses.models import CourseLanguage, CourseRun
 from ecommerce.factories import ProductFactory, ProductVersionFactory
 from mitxpro.utils import now_in_utc
 
@@ -2003,6 +2007,94 @@ def test_certificate_request_with_valid_uuid(user_client):
     assert resp.status_code == 200
 
 
+def test_certificate_request_cached(
+    settings, mocker, client, django_capture_on_commit_callbacks
+):
+    """
+    Test that anonymous certificate views are served from the rendered certificate cache until the
+    certificate, the learner name or the certificate pages change
+    """
+    settings.CERTIFICATE_PAGE_CACHE_ENABLED = True
+    settings.CATALOG_API_CACHE_NAME = "default"
+    caches["default"].clear()
+    serve_spy = mocker.spy(CertificatePage, "serve")
+    course_run_certificate = CourseRunCertificateFactory.create()
+    path = f"/certificate/{course_run_certificate.uuid}/"
+
+    # A certificate is only cached once it's pinned to a page revision, which the first view ensures
+    client.get(path)
+    rendered_resp = client.get(path)
+    assert rendered_resp.status_code == 200
+    serve_spy.reset_mock()
+
+    resp = client.get(path)
+    assert resp.status_code == 200
+    assert resp.context["certificate_body"] == rendered_resp.context["certificate_body"]
+    assert serve_spy.call_count == 0
+
+    user = course_run_certificate.user
+    user.name = "Renamed Learner"
+    user.save()
+    resp = client.get(path)
+    assert "Renamed Learner" in resp.content.decode()
+    assert serve_spy.call_count == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        bump_certificate_pages_version()
+    assert client.get(path).status_code == 200
+    assert serve_spy.call_count == 2
+
+    with django_capture_on_commit_callbacks(execute=True):
+        course_run_certificate.is_revoked = True
+        course_run_certificate.save()
+    assert client.get(path).status_code == 404
+    caches["default"].clear()
+
+
+def test_certificate_request_cached_dates(settings, client):
+    """
+    Test that a cached certificate isn't served once its course run dates change, even if the run was
+    updated without sending signals
+    """
+    settings.CERTIFICATE_PAGE_CACHE_ENABLED = True
+    settings.CATALOG_API_CACHE_NAME = "default"
+    caches["default"].clear()
+    course_run_certificate = CourseRunCertificateFactory.create()
+    course_run = course_run_certificate.course_run
+    path = f"/certificate/{course_run_certificate.uuid}/"
+    client.get(path)
+    client.get(path)
+
+    new_end_date = course_run.end_date + timedelta(days=10)
+    CourseRun.objects.filter(id=course_run.id).update(end_date=new_end_date)
+    resp = client.get(path)
+    assert resp.status_code == 200
+    assert date_filter(localtime(new_end_date)) in resp.context["certificate_body"]
+    caches["default"].clear()
+
+
+def test_certificate_request_cached_js_settings(settings, mocker, client):
+    """
+    Test that the JS settings of a cached certificate page are rendered for each request
+    """
+    settings.CERTIFICATE_PAGE_CACHE_ENABLED = True
+    settings.CATALOG_API_CACHE_NAME = "default"
+    caches["default"].clear()
+    course_run_certificate = CourseRunCertificateFactory.create()
+    path = f"/certificate/{course_run_certificate.uuid}/"
+    client.get(path)
+    client.get(path)
+
+    mocker.patch(
+        "mitxpro.templatetags.js_interop.get_js_settings",
+        return_value={"request_setting": "per-request value"},
+    )
+    resp = client.get(path)
+    assert resp.status_code == 200
+    assert "per-request value" in resp.content.decode()
+    caches["default"].clear()
+
+
 @pytest.mark.parametrize(
     "uuid_string",
     [
@@ -1,14 +1,21 @@
 """Compliance API"""
 
 import logging
+import threading
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
 
+import requests
 from django.conf import settings
+from django.db.models import prefetch_related_objects
 from lxml import etree
 from nacl.encoding import Base64Encoder
 from nacl.public import PublicKey, SealedBox
 from zeep import Client
-from zeep.plugins import HistoryPlugin
+from zeep.cache import SqliteCache
+from zeep.plugins import HistoryPlugin, Plugin
+from zeep.transports import Transport
 from zeep.wsse.username import UsernameToken
 
 from compliance.constants import (
@@ -20,6 +27,7 @@ from compliance.constants import (
     TEMPORARY_FAILURE_REASON_CODES,
 )
 from compliance.models import ExportsInquiryLog
+from mitxpro.utils import now_in_utc
 
 log = logging.getLogger()
 
@@ -39,20 +47,129 @@ def is_exports_verification_enabled():
     return all(getattr(settings, key) for key in EXPORTS_REQUIRED_KEYS)
 
 
-def get_cybersource_client():
+class ThreadLocalHistoryPlugin(Plugin):
+    """
+    A zeep plugin which records each thread's requests into the HistoryPlugin that thread last started,
+    so a single client can be shared while every call still captures its own request and response
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def start(self):
+        """
+        Starts capturing the requests and responses of the current thread into a new history
+
+        Returns:
+            zeep.plugins.HistoryPlugin: the history for the current thread
+        """
+        self._local.history = HistoryPlugin()
+        return self._local.history
+
+    def ingress(self, envelope, http_headers, operation):
+        history = getattr(self._local, "history", None)
+        if history is not None:
+            history.ingress(envelope, http_headers, operation)
+        return envelope, http_headers
+
+    def egress(self, envelope, http_headers, operation, binding_options):
+        history = getattr(self._local, "history", None)
+        if history is not None:
+            history.egress(envelope, http_headers, operation, binding_options)
+        return envelope, http_headers
+
+
+_cybersource_clients = {}
+_cybersource_clients_lock = threading.Lock()
+
+
+def _build_cybersource_client():
     """
-    Configures and authenticates a CyberSource client
+    Builds a CyberSource client which keeps its HTTP connections open between calls,
+    and caches the WSDL and XSD definitions on disk if CYBERSOURCE_WSDL_CACHE_PATH is set
 
     Returns:
-        (zeep.Client, zeep.plugins.HistoryPlugin):
-            a tuple of the configured client and the history plugin instance
+        (zeep.Client, ThreadLocalHistoryPlugin):
+            a tuple of the configured client and its history plugin
     """
+    cache = (
+        SqliteCache(
+            path=settings.CYBERSOURCE_WSDL_CACHE_PATH,
+            timeout=settings.CYBERSOURCE_WSDL_CACHE_TIMEOUT,
+        )
+        if settings.CYBERSOURCE_WSDL_CACHE_PATH
+        else None
+    )
+    transport = Transport(
+        session=requests.Session(),
+        cache=cache,
+        operation_timeout=settings.CYBERSOURCE_REQUEST_TIMEOUT,
+    )
     wsse = UsernameToken(
         settings.CYBERSOURCE_MERCHANT_ID, settings.CYBERSOURCE_TRANSACTION_KEY
     )
-    history = HistoryPlugin()
-    client = Client(settings.CYBERSOURCE_WSDL_URL, wsse=wsse, plugins=[history])
-    return client, history
+    history_plugin = ThreadLocalHistoryPlugin()
+    client = Client(
+        settings.CYBERSOURCE_WSDL_URL,
+        wsse=wsse,
+        transport=transport,
+        plugins=[history_plugin],
+    )
+    return client, history_plugin
+
+
+def _get_cached_cybersource_client():
+    """
+    Returns the CyberSource client for the current settings, building it the first time it's needed in this process
+
+    Returns:
+        (zeep.Client, ThreadLocalHistoryPlugin):
+            a tuple of the configured client and its history plugin
+    """
+    key = (
+        settings.CYBERSOURCE_WSDL_URL,
+        settings.CYBERSOURCE_MERCHANT_ID,
+        settings.CYBERSOURCE_TRANSACTION_KEY,
+    )
+    client_and_plugin = _cybersource_clients.get(key)
+    if client_and_plugin is None:
+        with _cybersource_clients_lock:
+            client_and_plugin = _cybersource_clients.get(key)
+            if client_and_plugin is None:
+                client_and_plugin = _build_cybersource_client()
+                _cybersource_clients[key] = client_and_plugin
+    return client_and_plugin
+
+
+def clear_cybersource_client_cache():
+    """Discards the CyberSource clients built by this process"""
+    with _cybersource_clients_lock:
+        _cybersource_clients.clear()
+
+
+def warm_cybersource_client():
+    """
+    Builds the CyberSource client ahead of the first exports check, if exports verification is configured
+    """
+    if not is_exports_verification_enabled():
+        return
+    try:
+        _get_cached_cybersource_client()
+    except Exception:
+        log.exception("Unable to load the CyberSource WSDL")
+
+
+def get_cybersource_client():
+    """
+    Returns the authenticated CyberSource client, which is shared within the process,
+    and a history of the requests it makes from the current thread until the next call
+
+    Returns:
+        (zeep.Client, zeep.plugins.HistoryPlugin):
+            a tuple of the configured client and the history plugin instance
+    """
+    client, history_plugin = _get_cached_cybersource_client()
+    return client, history_plugin.start()
 
 
 def compute_result_from_codes(reason_code, info_code):
@@ -91,9 +208,9 @@ def get_encryption_public_key():
     )
 
 
-def log_exports_inquiry(user, response, last_sent, last_received):
+def build_exports_inquiry_log(user, response, last_sent, last_received):
     """
-    Log a request/response for an export inquiry for a given user
+    Builds an unsaved log of a request/response for an export inquiry for a given user
 
     Args:
         user (users.models.User): the user that was checked for exports compliance
@@ -102,7 +219,7 @@ def log_exports_inquiry(user, response, last_sent, last_received):
         last_received (dict): the raw response received for this call
 
     Returns:
-        ExportsInquiryLog: the generated log record of the exports inquiry
+        ExportsInquiryLog: the unsaved log record of the exports inquiry, or None if there's nothing to record
     """
     # render lxml data structures into a string so we can encrypt it
     xml_request = etree.tostring(last_sent["envelope"])
@@ -132,7 +249,7 @@ def log_exports_inquiry(user, response, last_sent, last_received):
         "ascii"
     )
 
-    return ExportsInquiryLog.objects.create(
+    return ExportsInquiryLog(
         user=user,
         computed_result=compute_result_from_codes(reason_code, info_code),
         reason_code=reason_code,
@@ -142,6 +259,27 @@ def log_exports_inquiry(user, response, last_sent, last_received):
     )
 
 
+def log_exports_inquiry(user, response, last_sent, last_received):
+    """
+    Log a request/response for an export inquiry for a given user
+
+    Args:
+        user (users.models.User): the user that was checked for exports compliance
+        response (etree.Element): the root response node from the API call
+        last_sent (dict): the raw request sent for this call
+        last_received (dict): the raw response received for this call
+
+    Returns:
+        ExportsInquiryLog: the generated log record of the exports inquiry
+    """
+    exports_inquiry = build_exports_inquiry_log(
+        user, response, last_sent, last_received
+    )
+    if exports_inquiry is not None:
+        exports_inquiry.save()
+    return exports_inquiry
+
+
 def decrypt_exports_inquiry(exports_inquiry_log, private_key):
     """
     Decrypts an exports inquiry log given a private key
@@ -206,8 +344,16 @@ def get_bill_to_address(user):
     return billing_address
 
 
-def verify_user_with_exports(user):
-    """Verify the user against the CyberSource exports service"""
+def _request_exports_inquiry(user):
+    """
+    Runs the CyberSource exports check for a user
+
+    Args:
+        user (users.models.User): the user to check, with their legal_address loaded
+
+    Returns:
+        ExportsInquiryLog: the unsaved log record of the exports inquiry, or None if there's nothing to record
+    """
     client, history = get_cybersource_client()
 
     payload = {
@@ -229,7 +375,100 @@ def verify_user_with_exports(user):
 
     response = client.service.runTransaction(**payload)
 
-    return log_exports_inquiry(user, response, history.last_sent, history.last_received)
+    return build_exports_inquiry_log(
+        user, response, history.last_sent, history.last_received
+    )
+
+
+def verify_user_with_exports(user):
+    """Verify the user against the CyberSource exports service"""
+    exports_inquiry = _request_exports_inquiry(user)
+    if exports_inquiry is not None:
+        exports_inquiry.save()
+    return exports_inquiry
+
+
+def get_recent_exports_inquiries(users):
+    """
+    Returns the exports inquiries for users who were screened within CYBERSOURCE_EXPORTS_RECENT_VERIFICATION_TTL
+    seconds and haven't changed their legal address since
+
+    Args:
+        users (list of users.models.User): the users to look up, with their legal_address loaded
+
+    Returns:
+        dict: the latest recent ExportsInquiryLog for each user id which has one
+    """
+    ttl = settings.CYBERSOURCE_EXPORTS_RECENT_VERIFICATION_TTL
+    if not ttl or not users:
+        return {}
+    users_by_id = {user.id: user for user in users}
+    recent_inquiries = {}
+    for exports_inquiry in (
+        ExportsInquiryLog.objects.filter(
+            user_id__in=users_by_id.keys(),
+            created_on__gte=now_in_utc() - timedelta(seconds=ttl),
+        )
+        .exclude(computed_result=RESULT_UNKNOWN)
+        .order_by("user_id", "-created_on")
+    ):
+        if exports_inquiry.user_id in recent_inquiries:
+            continue
+        legal_address = getattr(
+            users_by_id[exports_inquiry.user_id], "legal_address", None
+        )
+        if (
+            legal_address is not None
+            and legal_address.updated_on <= exports_inquiry.created_on
+        ):
+            recent_inquiries[exports_inquiry.user_id] = exports_inquiry
+    return recent_inquiries
+
+
+def verify_users_with_exports(users):
+    """
+    Verify a batch of users against the CyberSource exports service. Users who were screened recently and
+    haven't changed their legal address since aren't screened again. The rest are checked concurrently,
+    encrypting each request/response in the worker that ran it, and the results are saved in bulk.
+
+    Args:
+        users (iterable of users.models.User): the users to check
+
+    Returns:
+        dict: the ExportsInquiryLog for each user id, or None if the check failed or there was nothing to record
+    """
+    users = list(users)
+    prefetch_related_objects(users, "legal_address")
+
+    results = get_recent_exports_inquiries(users)
+    users_to_verify = [user for user in users if user.id not in results]
+    new_inquiries = []
+
+    if users_to_verify:
+        with ThreadPoolExecutor(
+            max_workers=settings.CYBERSOURCE_EXPORTS_MAX_CONCURRENT_REQUESTS
+        ) as executor:
+            futures = {
+                executor.submit(_request_exports_inquiry, user): user
+                for user in users_to_verify
+            }
+            for future in as_completed(futures):
+                user = futures[future]
+                try:
+                    exports_inquiry = future.result()
+                except Exception:
+                    log.exception(
+                        "Unable to verify exports compliance for user %s", user.id
+                    )
+                    exports_inquiry = None
+                results[user.id] = exports_inquiry
+                if exports_inquiry is not None:
+                    new_inquiries.append(exports_inquiry)
+
+    ExportsInquiryLog.objects.bulk_create(
+        new_inquiries, batch_size=settings.CYBERSOURCE_EXPORTS_BATCH_SIZE
+    )
+    return results
 
 
 def get_latest_exports_inquiry(user):
@@ -16,6 +16,7 @@ from compliance.constants import (
 )
 from compliance.factories import ExportsInquiryLogFactory
 from compliance.models import ExportsInquiryLog
+from users.factories import UserFactory
 
 
 @pytest.mark.usefixtures("cybersource_settings")
@@ -155,3 +156,84 @@ def test_get_latest_export_inquiry(user):
 
     assert log2.created_on > log1.created_on
     assert api.get_latest_exports_inquiry(user) == log2
+
+
+@pytest.mark.parametrize(
+    "cybersource_mock_client_responses", ["100_success"], indirect=True
+)
+def test_get_cybersource_client_cached(user, cybersource_mock_client_responses):
+    """Test that the client is built once per process and each call gets its own history"""
+    client, history = api.get_cybersource_client()
+    other_client, other_history = api.get_cybersource_client()
+
+    assert other_client is client
+    assert other_history is not history
+
+    api.verify_user_with_exports(user)
+    api.verify_user_with_exports(user)
+
+    methods = [call.request.method for call in cybersource_mock_client_responses.calls]
+    # the WSDL and its XSD are only loaded once
+    assert methods == ["GET", "GET", "POST", "POST"]
+    assert ExportsInquiryLog.objects.filter(user=user).count() == 2
+
+
+def test_warm_cybersource_client_disabled(mocker, settings):
+    """Test that warm_cybersource_client does nothing if exports verification isn't configured"""
+    settings.CYBERSOURCE_WSDL_URL = None
+    mock_build = mocker.patch("compliance.api._build_cybersource_client")
+    api.warm_cybersource_client()
+    mock_build.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "cybersource_mock_client_responses", ["100_success"], indirect=True
+)
+@pytest.mark.django_db
+def test_verify_users_with_exports(settings, cybersource_mock_client_responses):
+    """Test that verify_users_with_exports screens users concurrently and skips recently screened ones"""
+    settings.CYBERSOURCE_EXPORTS_RECENT_VERIFICATION_TTL = 60
+    users = UserFactory.create_batch(3)
+    recent_inquiry = ExportsInquiryLogFactory.create(
+        user=users[0], computed_result=RESULT_SUCCESS
+    )
+    stale_inquiry = ExportsInquiryLogFactory.create(
+        user=users[1], computed_result=RESULT_SUCCESS
+    )
+    users[1].legal_address.save()
+
+    results = api.verify_users_with_exports(users)
+
+    assert results[users[0].id] == recent_inquiry
+    for user in users[1:]:
+        assert results[user.id].computed_result == RESULT_SUCCESS
+        assert results[user.id].pk is not None
+    assert results[users[1].id] != stale_inquiry
+    assert ExportsInquiryLog.objects.count() == 4
+    assert (
+        len(
+            [
+                call
+                for call in cybersource_mock_client_responses.calls
+                if call.request.method == "POST"
+            ]
+        )
+        == 2
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("cybersource_settings")
+def test_verify_users_with_exports_errors(mocker):
+    """Test that verify_users_with_exports records nothing for users whose check failed"""
+    users = UserFactory.create_batch(2)
+    mocker.patch(
+        "compliance.api._request_exports_inquiry",
+        side_effect=[Exception("error"), None],
+    )
+
+    assert api.verify_users_with_exports(users) == {
+        users[0].id: None,
+        users[1].id: None,
+    }
+    assert not ExportsInquiryLog.objects.exists()
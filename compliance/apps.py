@@ -7,3 +7,9 @@ class ComplianceConfig(AppConfig):
     """Compliance AppConfig"""
 
     name = "compliance"
+
+    def ready(self):
+        """
+        Ready handler. Import signals.
+        """
+        import compliance.signals  # noqa: F401
@@ -0,0 +1,11 @@
+"""Compliance signals"""
+
+from celery.signals import worker_process_init
+
+from compliance.api import warm_cybersource_client
+
+
+@worker_process_init.connect
+def handle_worker_process_init(**kwargs):  # noqa: ARG001
+    """Loads the CyberSource client before a worker process handles any exports checks"""
+    warm_cybersource_client()
@@ -0,0 +1,58 @@
+"""
+Tasks for the compliance app
+"""
+
+import logging
+
+import celery
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from mitol.common.utils import chunks
+
+from compliance import api
+from mitxpro.celery import app
+
+log = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+@app.task(bind=True)
+def verify_users_with_exports(self, user_ids):
+    """
+    Screens users for exports compliance in batches of CYBERSOURCE_EXPORTS_BATCH_SIZE
+
+    Args:
+        user_ids (list of int): the ids of the users to screen
+    """
+    chunked_tasks = [
+        verify_users_with_exports_chunked.s(chunk)
+        for chunk in chunks(
+            sorted(user_ids), chunk_size=settings.CYBERSOURCE_EXPORTS_BATCH_SIZE
+        )
+    ]
+    raise self.replace(celery.group(chunked_tasks))
+
+
+@app.task
+def verify_users_with_exports_chunked(user_ids):
+    """
+    Screens a batch of users for exports compliance
+
+    Args:
+        user_ids (list of int): the ids of the users to screen
+
+    Returns:
+        list of int: the ids of the users who couldn't be screened
+    """
+    if not api.is_exports_verification_enabled():
+        log.warning("Export compliance checks are disabled")
+        return []
+    results = api.verify_users_with_exports(
+        User.objects.filter(id__in=user_ids).select_related("legal_address")
+    )
+    return sorted(
+        user_id
+        for user_id, exports_inquiry in results.items()
+        if exports_inquiry is None
+    )
@@ -0,0 +1,52 @@
+"""Tests for compliance tasks"""
+
+import pytest
+
+from compliance import tasks
+from users.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_verify_users_with_exports(settings, mocker):
+    """Test that verify_users_with_exports screens users in batches"""
+    settings.CYBERSOURCE_EXPORTS_BATCH_SIZE = 2
+    mock_replace = mocker.patch(
+        "celery.app.task.Task.replace", autospec=True, side_effect=TabError
+    )
+    mock_group = mocker.patch("celery.group", autospec=True)
+    mock_chunked = mocker.patch("compliance.tasks.verify_users_with_exports_chunked")
+
+    with pytest.raises(TabError):
+        tasks.verify_users_with_exports.delay([5, 1, 3, 2, 4])
+
+    mock_replace.assert_called_once()
+    assert [call.args for call in mock_chunked.s.call_args_list] == [
+        ([1, 2],),
+        ([3, 4],),
+        ([5],),
+    ]
+    mock_group.assert_called_once_with([mock_chunked.s.return_value] * 3)
+
+
+@pytest.mark.usefixtures("cybersource_settings")
+def test_verify_users_with_exports_chunked(mocker):
+    """Test that verify_users_with_exports_chunked returns the users who couldn't be screened"""
+    users = UserFactory.create_batch(2)
+    mock_verify = mocker.patch(
+        "compliance.api.verify_users_with_exports",
+        return_value={users[0].id: mocker.Mock(), users[1].id: None},
+    )
+
+    assert tasks.verify_users_with_exports_chunked([user.id for user in users]) == [
+        users[1].id
+    ]
+    assert set(mock_verify.call_args[0][0]) == set(users)
+
+
+def test_verify_users_with_exports_chunked_disabled(mocker):
+    """Test that verify_users_with_exports_chunked does nothing if exports verification isn't configured"""
+    mock_verify = mocker.patch("compliance.api.verify_users_with_exports")
+
+    assert tasks.verify_users_with_exports_chunked([1]) == []
+    mock_verify.assert_not_called()
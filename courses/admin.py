@@ -8,7 +8,11 @@ from django.contrib import admin
 from django.db import models
 from django.forms import TextInput
 
-from mitxpro.admin import AuditableModelAdmin, TimestampedModelAdmin
+from mitxpro.admin import (
+    AuditableModelAdmin,
+    AuditModelAdmin,
+    TimestampedModelAdmin,
+)
 from mitxpro.utils import get_field_names, now_in_utc
 
 from .models import (
@@ -173,7 +177,7 @@ class ProgramEnrollmentAdmin(AuditableModelAdmin):
 
 
 @admin.register(ProgramEnrollmentAudit)
-class ProgramEnrollmentAuditAdmin(TimestampedModelAdmin):
+class ProgramEnrollmentAuditAdmin(AuditModelAdmin):
     """Admin for ProgramEnrollmentAudit"""
 
     model = ProgramEnrollmentAudit
@@ -250,7 +254,7 @@ class CourseRunEnrollmentAdmin(AuditableModelAdmin):
 
 
 @admin.register(CourseRunEnrollmentAudit)
-class CourseRunEnrollmentAuditAdmin(TimestampedModelAdmin):
+class CourseRunEnrollmentAuditAdmin(AuditModelAdmin):
     """Admin for CourseRunEnrollmentAudit"""
 
     model = CourseRunEnrollmentAudit
@@ -312,7 +316,7 @@ class CourseRunGradeAdmin(admin.ModelAdmin):
 
 
 @admin.register(CourseRunGradeAudit)
-class CourseRunGradeAuditAdmin(TimestampedModelAdmin):
+class CourseRunGradeAuditAdmin(AuditModelAdmin):
     """Admin for CourseRunGradeAudit"""
 
     model = CourseRunGradeAudit
@@ -2,15 +2,27 @@
 
 import itertools
 import logging
+import operator
 from collections import namedtuple
+from functools import reduce
 from traceback import format_exc
 
+from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Q
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import HTTPError
 
 from courses.constants import ENROLL_CHANGE_STATUS_DEFERRED
-from courses.models import CourseRun, CourseRunEnrollment, ProgramEnrollment
+from courses.catalog_cache import get_catalog_cache, get_catalog_version
+from courses.models import (
+    CourseRun,
+    CourseRunCertificate,
+    CourseRunEnrollment,
+    ProgramCertificate,
+    ProgramEnrollment,
+)
 from courseware.api import enroll_in_edx_course_runs, unenroll_edx_course_run
 from courseware.exceptions import (
     EdxApiEnrollErrorException,
@@ -45,9 +57,11 @@ def get_user_enrollments(user):
         UserEnrollments: An object representing a user's program and course run enrollments
     """
     program_enrollments = (
-        ProgramEnrollment.objects.select_related("program__programpage")
+        ProgramEnrollment.objects.select_related(
+            "program__programpage", "program__externalprogrampage"
+        )
         .prefetch_related("program__courses")
-        .select_related("user", "company")
+        .select_related("user", "company", "order")
         .filter(user=user)
         .all()
     )
@@ -59,7 +73,12 @@ def get_user_enrollments(user):
     )
     program_course_ids = {course.id for course in program_courses}
     course_run_enrollments = (
-        CourseRunEnrollment.objects.select_related("run__course__coursepage", "company")
+        CourseRunEnrollment.objects.select_related(
+            "run__course__coursepage",
+            "run__course__externalcoursepage",
+            "company",
+            "order",
+        )
         .filter(user=user)
         .order_by("run__start_date")
         .all()
@@ -87,6 +106,150 @@ def get_user_enrollments(user):
     )
 
 
+def _get_page_ids_with_certificate_page(pages):
+    """
+    Returns the ids of the given product pages which have a live certificate child page, in one query
+
+    Args:
+        pages (iterable of cms.models.ProductPage or None): Product pages
+    Returns:
+        set of int: Ids of the pages which have a certificate page
+    """
+    from cms.models import CertificatePage
+
+    pages = {page.path: page for page in pages if page is not None}
+    if not pages:
+        return set()
+    certificate_page_paths = (
+        CertificatePage.objects.live()
+        .filter(
+            reduce(
+                operator.or_,
+                (
+                    Q(path__startswith=page.path, depth=page.depth + 1)
+                    for page in pages.values()
+                ),
+            )
+        )
+        .values_list("path", flat=True)
+    )
+    return {
+        pages[path[: -CertificatePage.steplen]].id for path in certificate_page_paths
+    }
+
+
+def get_enrollment_certificates(user, run_enrollments, program_enrollments):
+    """
+    Fetches the certificates for a user's enrollments with a constant number of queries. Like the
+    enrollment serializers, a certificate is only included if the course or program page has a
+    certificate page to render it.
+
+    Args:
+        user (User): A user
+        run_enrollments (iterable of CourseRunEnrollment): The user's course run enrollments
+        program_enrollments (iterable of ProgramEnrollment): The user's program enrollments
+    Returns:
+        tuple of (dict, dict):
+            Course run certificates and program certificates, keyed by the enrollment id
+    """
+    run_enrollments = list(run_enrollments)
+    program_enrollments = list(program_enrollments)
+    run_certificates = {
+        certificate.course_run_id: certificate
+        for certificate in CourseRunCertificate.objects.filter(
+            user=user,
+            course_run_id__in=[enrollment.run_id for enrollment in run_enrollments],
+        )
+    }
+    program_certificates = {
+        certificate.program_id: certificate
+        for certificate in ProgramCertificate.objects.filter(
+            user=user,
+            program_id__in=[
+                enrollment.program_id for enrollment in program_enrollments
+            ],
+        )
+    }
+    certified_run_enrollments = [
+        enrollment
+        for enrollment in run_enrollments
+        if enrollment.run_id in run_certificates
+    ]
+    certified_program_enrollments = [
+        enrollment
+        for enrollment in program_enrollments
+        if enrollment.program_id in program_certificates
+    ]
+    page_ids_with_certificate_page = _get_page_ids_with_certificate_page(
+        [enrollment.run.course.page for enrollment in certified_run_enrollments]
+        + [enrollment.program.page for enrollment in certified_program_enrollments]
+    )
+    return (
+        {
+            enrollment.id: run_certificates[enrollment.run_id]
+            for enrollment in certified_run_enrollments
+            if getattr(enrollment.run.course.page, "id", None)
+            in page_ids_with_certificate_page
+        },
+        {
+            enrollment.id: program_certificates[enrollment.program_id]
+            for enrollment in certified_program_enrollments
+            if getattr(enrollment.program.page, "id", None)
+            in page_ids_with_certificate_page
+        },
+    )
+
+
+def _get_user_enrollments_cache_key(user_id):
+    """Returns the cache key for a user's serialized enrollments"""
+    return f"user-enrollments:{user_id}:{get_catalog_version()}"
+
+
+def get_cached_user_enrollments_data(user_id):
+    """
+    Returns a user's cached serialized enrollments, or None if they aren't cached
+
+    Args:
+        user_id (int): A user id
+    Returns:
+        dict or None: The serialized enrollments
+    """
+    if not settings.USER_ENROLLMENTS_CACHE_ENABLED:
+        return None
+    return get_catalog_cache().get(_get_user_enrollments_cache_key(user_id))
+
+
+def set_cached_user_enrollments_data(user_id, data):
+    """
+    Caches a user's serialized enrollments
+
+    Args:
+        user_id (int): A user id
+        data (dict): The serialized enrollments
+    """
+    if not settings.USER_ENROLLMENTS_CACHE_ENABLED:
+        return
+    get_catalog_cache().set(
+        _get_user_enrollments_cache_key(user_id),
+        data,
+        timeout=settings.USER_ENROLLMENTS_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_user_enrollments_cache(user_id):
+    """
+    Clears a user's cached serialized enrollments once the current transaction (if any) commits
+
+    Args:
+        user_id (int): A user id
+    """
+    if not settings.USER_ENROLLMENTS_CACHE_ENABLED or user_id is None:
+        return
+    transaction.on_commit(
+        lambda: get_catalog_cache().delete(_get_user_enrollments_cache_key(user_id))
+    )
+
+
 def create_run_enrollments(
     user,
     runs,
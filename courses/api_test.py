@@ -17,7 +17,11 @@ from courses.api import (
     deactivate_run_enrollment,
     defer_enrollment,
     generate_course_readable_id,
+    get_cached_user_enrollments_data,
+    get_enrollment_certificates,
     get_user_enrollments,
+    invalidate_user_enrollments_cache,
+    set_cached_user_enrollments_data,
 )
 from courses.constants import (
     ENROLL_CHANGE_STATUS_DEFERRED,
@@ -25,8 +29,10 @@ from courses.constants import (
 )
 from courses.factories import (
     CourseFactory,
+    CourseRunCertificateFactory,
     CourseRunEnrollmentFactory,
     CourseRunFactory,
+    ProgramCertificateFactory,
     ProgramEnrollmentFactory,
     ProgramFactory,
 )
@@ -121,6 +127,62 @@ def test_get_user_enrollments(user):
     )
 
 
+@pytest.mark.django_db
+def test_get_enrollment_certificates(user, django_assert_max_num_queries):
+    """
+    get_enrollment_certificates should return the certificates keyed by enrollment id with a constant
+    number of queries, skipping any whose page has no certificate page
+    """
+    run_enrollments = CourseRunEnrollmentFactory.create_batch(4, user=user)
+    certified_enrollment, no_cert_page_enrollment, _, other_user_enrollment = (
+        run_enrollments
+    )
+    run_certificate = CourseRunCertificateFactory.create(
+        user=user, course_run=certified_enrollment.run
+    )
+    CourseRunCertificateFactory.create(
+        user=user, course_run=no_cert_page_enrollment.run
+    )
+    no_cert_page_enrollment.run.course.page.certificate_page.delete()
+    CourseRunCertificateFactory.create(course_run=other_user_enrollment.run)
+    program_enrollment = ProgramEnrollmentFactory.create(user=user)
+    program_certificate = ProgramCertificateFactory.create(
+        user=user, program=program_enrollment.program
+    )
+    run_enrollments = list(
+        CourseRunEnrollment.objects.filter(user=user).select_related(
+            "run__course__coursepage"
+        )
+    )
+    program_enrollments = list(
+        ProgramEnrollment.objects.filter(user=user).select_related(
+            "program__programpage"
+        )
+    )
+
+    with django_assert_max_num_queries(3):
+        run_certificates, program_certificates = get_enrollment_certificates(
+            user, run_enrollments, program_enrollments
+        )
+    assert run_certificates == {certified_enrollment.id: run_certificate}
+    assert program_certificates == {program_enrollment.id: program_certificate}
+
+
+@pytest.mark.django_db
+def test_invalidate_user_enrollments_cache(
+    settings, user, django_capture_on_commit_callbacks
+):
+    """invalidate_user_enrollments_cache should clear the user's cached enrollments on commit"""
+    settings.USER_ENROLLMENTS_CACHE_ENABLED = True
+    settings.CATALOG_API_CACHE_NAME = "default"
+    set_cached_user_enrollments_data(user.id, {"program_enrollments": []})
+    assert get_cached_user_enrollments_data(user.id) == {"program_enrollments": []}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        invalidate_user_enrollments_cache(user.id)
+    assert get_cached_user_enrollments_data(user.id) is None
+
+
 @pytest.mark.django_db
 def test_create_run_enrollments(mocker, user):
     """
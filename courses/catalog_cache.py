@@ -0,0 +1,150 @@
+"""
+Versioned response cache for the public catalog APIs.
+
+Catalog data (courses, runs, programs, products and their CMS pages) only changes when one of those
+records is saved or a page is published, so rather than expiring cached responses on a timer we keep a
+single catalog content version and include it in every cache key and ETag. Bumping the version
+invalidates every cached response at once. Responses also depend on the time (runs start and enrollment
+closes without any record being saved), so the keys and ETags include a time bucket as well, which
+bounds how long a response can outlive a passed deadline.
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+CATALOG_VERSION_CACHE_KEY = "catalog-api:version"
+CATALOG_RESPONSE_CACHE_KEY_PREFIX = "catalog-api:response"
+
+
+def get_catalog_cache():
+    """Returns the cache backend used for catalog API responses"""
+    return caches[settings.CATALOG_API_CACHE_NAME]
+
+
+def get_catalog_version():
+    """
+    Returns the current catalog content version
+
+    Returns:
+        int: The catalog content version
+    """
+    cache = get_catalog_cache()
+    version = cache.get(CATALOG_VERSION_CACHE_KEY)
+    if version is None:
+        # Seed with a timestamp rather than a small constant so that responses cached under a version
+        # that was evicted can never be served again once the counter is recreated.
+        cache.add(CATALOG_VERSION_CACHE_KEY, time.time_ns(), timeout=None)
+        version = cache.get(CATALOG_VERSION_CACHE_KEY)
+    return version
+
+
+def bump_catalog_version():
+    """
+    Increments the catalog content version once the current transaction (if any) commits, which
+    invalidates every cached catalog API response
+    """
+    if not settings.CATALOG_API_CACHE_ENABLED:
+        return
+
+    def _bump():
+        cache = get_catalog_cache()
+        try:
+            cache.incr(CATALOG_VERSION_CACHE_KEY)
+        except ValueError:
+            cache.add(CATALOG_VERSION_CACHE_KEY, time.time_ns(), timeout=None)
+
+    transaction.on_commit(_bump)
+
+
+def _get_catalog_etag(cache_key):
+    """
+    Returns the ETag for a catalog response cache key. The key already identifies the exact
+    content (request path, catalog version and time bucket), so the response body doesn't need to
+    be hashed.
+    """
+    _, version, path_hash = cache_key.rsplit(":", 2)
+    return quote_etag(f"{version}-{path_hash}")
+
+
+class CatalogCacheMixin:
+    """
+    Viewset mixin that caches the rendered JSON for anonymous list/retrieve requests per
+    (path and query params, catalog version, time bucket) and answers matching If-None-Match headers with a 304
+    """
+
+    _catalog_cache_key = None
+
+    def _get_catalog_cache_key(self, request):
+        """
+        Returns the cache key for this request, or None if the response should not be cached
+        """
+        if (
+            not settings.CATALOG_API_CACHE_ENABLED
+            or request.method != "GET"
+            or request.user.is_authenticated
+            or request.accepted_renderer.format != "json"
+        ):
+            return None
+        path_hash = hashlib.md5(  # noqa: S324
+            request.get_full_path().encode("utf-8")
+        ).hexdigest()
+        time_bucket = int(time.time() // settings.CATALOG_API_CACHE_TIME_BUCKET)
+        return f"{CATALOG_RESPONSE_CACHE_KEY_PREFIX}:{get_catalog_version()}-{time_bucket}:{path_hash}"
+
+    def _get_cached_catalog_response(self, request):
+        """
+        Returns a 304 or cached response for this request if one is available, otherwise None
+        """
+        self._catalog_cache_key = self._get_catalog_cache_key(request)
+        if self._catalog_cache_key is None:
+            return None
+
+        etag = _get_catalog_etag(self._catalog_cache_key)
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponseNotModified()
+            response["ETag"] = etag
+            return response
+
+        content = get_catalog_cache().get(self._catalog_cache_key)
+        if content is None:
+            return None
+        response = HttpResponse(content, content_type="application/json")
+        response["ETag"] = etag
+        return response
+
+    def list(self, request, *args, **kwargs):
+        """List, served from the catalog cache when possible"""
+        return self._get_cached_catalog_response(request) or super().list(
+            request, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve, served from the catalog cache when possible"""
+        return self._get_cached_catalog_response(request) or super().retrieve(
+            request, *args, **kwargs
+        )
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """Store freshly rendered responses in the catalog cache"""
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if (
+            self._catalog_cache_key is not None
+            and isinstance(response, Response)
+            and response.status_code == status.HTTP_200_OK
+        ):
+            response.render()
+            get_catalog_cache().set(
+                self._catalog_cache_key,
+                response.content,
+                timeout=settings.CATALOG_API_CACHE_TIMEOUT,
+            )
+            response["ETag"] = _get_catalog_etag(self._catalog_cache_key)
+        return response
@@ -0,0 +1,110 @@
+"""Tests for the catalog API response cache"""
+
+from datetime import timedelta
+
+import pytest
+from django.core.cache import caches
+from freezegun import freeze_time
+from django.urls import reverse
+from rest_framework import status
+
+from courses.catalog_cache import bump_catalog_version, get_catalog_version
+from courses.factories import CourseFactory
+from courses.models import Course
+from mitxpro.utils import now_in_utc
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def catalog_cache(settings):
+    """Enable the catalog API cache with an empty local memory backend"""
+    settings.CATALOG_API_CACHE_ENABLED = True
+    settings.CATALOG_API_CACHE_NAME = "default"
+    cache = caches["default"]
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def test_bump_catalog_version(catalog_cache, django_capture_on_commit_callbacks):  # noqa: ARG001
+    """bump_catalog_version should increment the version once the transaction commits"""
+    version = get_catalog_version()
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        bump_catalog_version()
+        assert get_catalog_version() == version
+    assert len(callbacks) == 1
+    assert get_catalog_version() == version + 1
+
+
+def test_catalog_version_bumped_on_save(
+    catalog_cache,  # noqa: ARG001
+    django_capture_on_commit_callbacks,
+):
+    """Saving a catalog record should bump the catalog version"""
+    version = get_catalog_version()
+    with django_capture_on_commit_callbacks(execute=True):
+        CourseFactory.create()
+    assert get_catalog_version() > version
+
+
+def test_catalog_api_cached_response(
+    catalog_cache,  # noqa: ARG001
+    client,
+    django_capture_on_commit_callbacks,
+):
+    """Anonymous catalog responses should be cached until the catalog version changes"""
+    course = CourseFactory.create(title="Original")
+    url = reverse("courses_api-list")
+
+    resp = client.get(url)
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()[0]["title"] == "Original"
+    etag = resp["ETag"]
+
+    # An update that bypasses signals is not visible until the version changes
+    Course.objects.filter(id=course.id).update(title="Updated")
+    resp = client.get(url)
+    assert resp.json()[0]["title"] == "Original"
+    assert resp["ETag"] == etag
+
+    resp = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == status.HTTP_304_NOT_MODIFIED
+
+    with django_capture_on_commit_callbacks(execute=True):
+        bump_catalog_version()
+    resp = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()[0]["title"] == "Updated"
+    assert resp["ETag"] != etag
+
+
+def test_catalog_api_not_cached_for_authenticated_users(
+    catalog_cache,  # noqa: ARG001
+    user_client,
+):
+    """Responses for authenticated users should not be cached"""
+    course = CourseFactory.create(title="Original")
+    url = reverse("courses_api-list")
+
+    resp = user_client.get(url)
+    assert "ETag" not in resp
+    Course.objects.filter(id=course.id).update(title="Updated")
+    assert user_client.get(url).json()[0]["title"] == "Updated"
+
+
+def test_catalog_api_cached_response_time_bucket(catalog_cache, client, settings):  # noqa: ARG001
+    """Cached catalog responses should be recomputed once the time bucket changes"""
+    settings.CATALOG_API_CACHE_TIME_BUCKET = 60
+    course = CourseFactory.create(title="Original")
+    url = reverse("courses_api-list")
+    now = now_in_utc()
+
+    with freeze_time(now):
+        etag = client.get(url)["ETag"]
+    Course.objects.filter(id=course.id).update(title="Updated")
+    with freeze_time(now + timedelta(seconds=61)):
+        resp = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()[0]["title"] == "Updated"
+    assert resp["ETag"] != etag
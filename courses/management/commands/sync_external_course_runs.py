@@ -1,10 +1,12 @@
 """Management command to sync external course runs"""
 
+from django.conf import settings
 from django.core.management.base import BaseCommand
 
 from courses.models import Platform
 from courses.sync_external_courses.external_course_sync_api import (
     EXTERNAL_COURSE_VENDOR_KEYMAPS,
+    bulk_update_external_course_runs,
     fetch_external_courses,
     update_external_course_runs,
 )
@@ -30,6 +32,13 @@ class Command(BaseCommand):
             dest="force",
             help="Sync courses even if the daily sync is off.",
         )
+        parser.add_argument(
+            "--bulk",
+            action="store_true",
+            dest="bulk",
+            default=settings.EXTERNAL_COURSE_SYNC_BULK_MODE,
+            help="Apply the changes with bulk operations instead of row by row.",
+        )
         super().add_arguments(parser)
 
     def handle(self, *args, **options):  # noqa: ARG002
@@ -59,7 +68,12 @@ class Command(BaseCommand):
         self.stdout.write(f"Starting course sync for {vendor_name}.")
         keymap = keymap()
         external_course_runs = fetch_external_courses(keymap)
-        stats_collector = update_external_course_runs(external_course_runs, keymap)
+        update_func = (
+            bulk_update_external_course_runs
+            if options["bulk"]
+            else update_external_course_runs
+        )
+        stats_collector = update_func(external_course_runs, keymap)
 
         email_stats = stats_collector.get_email_stats()
 
@@ -7,8 +7,12 @@ import logging
 from django.core.management.base import BaseCommand, CommandError
 
 from cms.models import ExternalCoursePage
-from courses.models import CourseRun
-from courses.utils import ensure_course_run_grade, process_course_run_grade_certificate
+from courses.models import CourseRun, CourseRunGrade
+from courses.utils import (
+    batch_program_certificate_generation,
+    ensure_course_run_grade,
+    process_course_run_grade_certificate,
+)
 from courseware.api import get_edx_grades_with_users
 from mitxpro.utils import now_in_utc
 from users.api import fetch_user
@@ -106,64 +110,70 @@ class Command(BaseCommand):
             raise CommandError(f"Course run {run} has no certificate page.")
 
         results = []
-        for edx_grade, user in edx_grade_user_iter:
-            try:
-                (
-                    course_run_grade,
-                    created_grade,
-                    updated_grade,
-                ) = ensure_course_run_grade(
-                    user=user,
-                    course_run=run,
-                    edx_grade=edx_grade,
-                    should_update=should_update,
-                )
+        overridden_grades = []
+        with batch_program_certificate_generation():
+            for edx_grade, user in edx_grade_user_iter:
+                try:
+                    (
+                        course_run_grade,
+                        created_grade,
+                        updated_grade,
+                    ) = ensure_course_run_grade(
+                        user=user,
+                        course_run=run,
+                        edx_grade=edx_grade,
+                        should_update=should_update,
+                    )
+
+                    if override_grade is not None:
+                        course_run_grade.grade = override_grade
+                        course_run_grade.passed = bool(override_grade)
+                        course_run_grade.letter_grade = None
+                        course_run_grade.set_by_admin = True
+                        overridden_grades.append(course_run_grade)
+
+                    _, created_cert, deleted_cert = (
+                        process_course_run_grade_certificate(
+                            course_run_grade=course_run_grade
+                        )
+                    )
+                except Exception as e:  # noqa: BLE001
+                    self.stdout.write(
+                        self.style.ERROR(
+                            f"Course certificate creation failed for {user} due to following reason(s),\n{e}"
+                        )
+                    )
+                    continue
 
+                if created_grade:
+                    grade_status = "created"
+                elif updated_grade:
+                    grade_status = "updated"
+                else:
+                    grade_status = "already exists"
+
+                grade_summary = [f"passed: {course_run_grade.passed}"]
                 if override_grade is not None:
-                    course_run_grade.grade = override_grade
-                    course_run_grade.passed = bool(override_grade)
-                    course_run_grade.letter_grade = None
-                    course_run_grade.set_by_admin = True
-                    course_run_grade.save_and_log(None)
-
-                _, created_cert, deleted_cert = process_course_run_grade_certificate(
-                    course_run_grade=course_run_grade
+                    grade_summary.append(f"value override: {course_run_grade.grade}")
+
+                if created_cert:
+                    cert_status = "created"
+                elif deleted_cert:
+                    cert_status = "deleted"
+                elif course_run_grade.passed:
+                    cert_status = "already exists"
+                else:
+                    cert_status = "ignored"
+
+                result_summary = "Grade: {} ({}), Certificate: {}".format(
+                    grade_status, ", ".join(grade_summary), cert_status
                 )
-            except Exception as e:  # noqa: BLE001
-                self.stdout.write(
-                    self.style.ERROR(
-                        f"Course certificate creation failed for {user} due to following reason(s),\n{e}"
-                    )
+
+                results.append(
+                    f"Processed {user} in course run {run.courseware_id}. Result - {result_summary}"
                 )
-                continue
-
-            if created_grade:
-                grade_status = "created"
-            elif updated_grade:
-                grade_status = "updated"
-            else:
-                grade_status = "already exists"
-
-            grade_summary = [f"passed: {course_run_grade.passed}"]
-            if override_grade is not None:
-                grade_summary.append(f"value override: {course_run_grade.grade}")
-
-            if created_cert:
-                cert_status = "created"
-            elif deleted_cert:
-                cert_status = "deleted"
-            elif course_run_grade.passed:
-                cert_status = "already exists"
-            else:
-                cert_status = "ignored"
-
-            result_summary = "Grade: {} ({}), Certificate: {}".format(
-                grade_status, ", ".join(grade_summary), cert_status
-            )
 
-            results.append(
-                f"Processed {user} in course run {run.courseware_id}. Result - {result_summary}"
-            )
+            CourseRunGrade.save_and_log_many(overridden_grades, None)
 
         for result in results:
             self.stdout.write(self.style.SUCCESS(result))
@@ -0,0 +1,106 @@
+# Generated by Django 5.2.17 on 2026-10-19 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("courses", "0044_add_language_is_active"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="courserunenrollmentaudit",
+            name="created_on",
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AddField(
+            model_name="courserunenrollmentaudit",
+            name="data_diff",
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="courserunenrollmentaudit",
+            name="data_hash",
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name="courserunenrollmentaudit",
+            name="checkpoint",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="courses.courserunenrollmentaudit",
+            ),
+        ),
+        migrations.AddField(
+            model_name="courserunenrollmentaudit",
+            name="checkpoint_distance",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name="programenrollmentaudit",
+            name="created_on",
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AddField(
+            model_name="programenrollmentaudit",
+            name="data_diff",
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="programenrollmentaudit",
+            name="data_hash",
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name="programenrollmentaudit",
+            name="checkpoint",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="courses.programenrollmentaudit",
+            ),
+        ),
+        migrations.AddField(
+            model_name="programenrollmentaudit",
+            name="checkpoint_distance",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name="courserungradeaudit",
+            name="created_on",
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AddField(
+            model_name="courserungradeaudit",
+            name="data_diff",
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="courserungradeaudit",
+            name="data_hash",
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name="courserungradeaudit",
+            name="checkpoint",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="courses.courserungradeaudit",
+            ),
+        ),
+        migrations.AddField(
+            model_name="courserungradeaudit",
+            name="checkpoint_distance",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -30,7 +30,11 @@ from courses.factories import (
     ProgramRunFactory,
 )
 from cms.models import CoursePage, CertificatePage, ProgramPage
-from courses.models import CourseRunEnrollment, limit_to_certificate_pages
+from courses.models import (
+    CourseRunEnrollment,
+    CourseRunEnrollmentAudit,
+    limit_to_certificate_pages,
+)
 from courses.sync_external_courses.external_course_sync_api import (
     EMERITUS_PLATFORM_NAME,
 )
@@ -872,6 +876,35 @@ def test_audit(user, is_program, has_company):
     )
 
 
+def test_save_and_log_many(user, django_assert_max_num_queries):
+    """save_and_log_many should update the enrollments and audit each change with a query per step"""
+    enrollment_ids = [
+        enrollment.id
+        for enrollment in CourseRunEnrollmentFactory.create_batch(3, edx_enrolled=False)
+    ]
+    enrollments = list(
+        CourseRunEnrollment.all_objects.select_related("user", "run", "company").filter(
+            id__in=enrollment_ids
+        )
+    )
+    before = {enrollment.id: enrollment.to_dict() for enrollment in enrollments}
+    for enrollment in enrollments:
+        enrollment.edx_enrolled = True
+
+    # the savepoint, the read, the update, the read of the previous audits, the audit insert and the
+    # savepoint release
+    with django_assert_max_num_queries(6):
+        audits = CourseRunEnrollment.save_and_log_many(enrollments, user)
+
+    assert len(audits) == len(enrollments)
+    for enrollment in CourseRunEnrollment.all_objects.filter(id__in=enrollment_ids):
+        assert enrollment.edx_enrolled is True
+        audit = CourseRunEnrollmentAudit.objects.get(enrollment=enrollment)
+        assert audit.acting_user == user
+        assert audit.data_before == before[enrollment.id]
+        assert audit.data_after == enrollment.to_dict()
+
+
 def test_enrollment_is_ended():
     """Verify that is_ended returns True, if all of course runs in a program/course are ended."""
     past_date = now_in_utc() - timedelta(days=1)
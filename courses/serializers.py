@@ -118,6 +118,17 @@ class BaseProductSerializer(serializers.ModelSerializer):
     prerequisites = serializers.SerializerMethodField()
     language = serializers.SerializerMethodField()
 
+    def __init__(self, *args, **kwargs):
+        """
+        Accepts an optional `fields` iterable of field names. When given, only those fields are
+        serialized, so the method fields for everything else are never evaluated.
+        """
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
     class Meta:
         model = "cms.ProductPage"
         fields = [
@@ -446,6 +457,16 @@ class CourseRunEnrollmentSerializer(serializers.ModelSerializer):
         """
         Resolve a certificate for this enrollment if it exists
         """
+        # Certificates may have been fetched up front for a batch of enrollments
+        # (see courses.api.get_enrollment_certificates)
+        if "course_run_certificates" in self.context:
+            certificate = self.context["course_run_certificates"].get(enrollment.id)
+            return (
+                CourseRunCertificateSerializer(certificate).data
+                if certificate
+                else None
+            )
+
         # No need to include a certificate if there is no corresponding wagtail page
         # to support the render
         if (
@@ -495,6 +516,14 @@ class ProgramEnrollmentSerializer(serializers.ModelSerializer):
         """
         Resolve a certificate for this enrollment if it exists
         """
+        # Certificates may have been fetched up front for a batch of enrollments
+        # (see courses.api.get_enrollment_certificates)
+        if "program_certificates" in self.context:
+            certificate = self.context["program_certificates"].get(enrollment.id)
+            return (
+                ProgramCertificateSerializer(certificate).data if certificate else None
+            )
+
         # No need to include a certificate if there is no corresponding wagtail page
         # to support the render
         if not enrollment.program.page or not enrollment.program.page.certificate_page:
@@ -544,6 +573,7 @@ class ProgramEnrollmentSerializer(serializers.ModelSerializer):
                 key=lambda enrollment: enrollment.run.course.position_in_program,
             ),
             many=True,
+            context=self.context,
         ).data
 
     class Meta:
@@ -3,11 +3,34 @@ Signals for micromasters course certificates
 """
 
 from django.db import transaction
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from wagtail.signals import page_published, page_unpublished
 
-from courses.models import CourseRunCertificate
-from courses.utils import generate_program_certificate
+from cms.certificate_cache import (
+    bump_certificate_pages_version,
+    invalidate_certificate_pages,
+)
+from cms.models import CertificatePage, SignatoryPage
+from courses.api import invalidate_user_enrollments_cache
+from courses.catalog_cache import bump_catalog_version
+from courses.models import (
+    Course,
+    CourseRun,
+    CourseRunCertificate,
+    CourseRunEnrollment,
+    CourseTopic,
+    Program,
+    ProgramCertificate,
+    ProgramEnrollment,
+)
+from courses.utils import (
+    defer_program_certificate_generation,
+    generate_program_certificate,
+)
+from ecommerce.models import Order, Product, ProductVersion
+
+CATALOG_MODELS = (Course, CourseRun, Program, CourseTopic, Product, ProductVersion)
 
 
 @receiver(
@@ -27,5 +50,74 @@ def handle_create_course_run_certificate(
     if created:
         user = instance.user
         program = instance.course_run.course.program
-        if program:
+        if program and not defer_program_certificate_generation(user.id, program.id):
             transaction.on_commit(lambda: generate_program_certificate(user, program))
+
+
+def handle_catalog_change(sender, **kwargs):  # noqa: ARG001
+    """
+    When a record that is exposed through the catalog APIs changes or a CMS page is (un)published,
+    invalidate the cached catalog API responses
+    """
+    bump_catalog_version()
+
+
+for catalog_model in CATALOG_MODELS:
+    post_save.connect(
+        handle_catalog_change,
+        sender=catalog_model,
+        dispatch_uid=f"catalog_{catalog_model.__name__.lower()}_post_save",
+    )
+    post_delete.connect(
+        handle_catalog_change,
+        sender=catalog_model,
+        dispatch_uid=f"catalog_{catalog_model.__name__.lower()}_post_delete",
+    )
+page_published.connect(handle_catalog_change, dispatch_uid="catalog_page_published")
+page_unpublished.connect(handle_catalog_change, dispatch_uid="catalog_page_unpublished")
+
+
+@receiver(post_save, sender=CourseRunCertificate, dispatch_uid="run_cert_page_save")
+@receiver(post_save, sender=ProgramCertificate, dispatch_uid="program_cert_page_save")
+def handle_certificate_change(sender, instance, **kwargs):  # noqa: ARG001
+    """
+    When a certificate changes (e.g. it is revoked), clear its cached certificate page
+    """
+    invalidate_certificate_pages([instance.uuid])
+
+
+@receiver(page_published, sender=CertificatePage, dispatch_uid="cert_page_published")
+@receiver(
+    page_unpublished, sender=CertificatePage, dispatch_uid="cert_page_unpublished"
+)
+@receiver(page_published, sender=SignatoryPage, dispatch_uid="signatory_published")
+@receiver(page_unpublished, sender=SignatoryPage, dispatch_uid="signatory_unpublished")
+def handle_certificate_page_change(sender, **kwargs):  # noqa: ARG001
+    """
+    When a certificate or signatory page is (un)published, clear all cached certificate pages
+    """
+    bump_certificate_pages_version()
+
+
+@receiver(post_save, sender=CourseRunEnrollment, dispatch_uid="enrollments_run_save")
+@receiver(post_save, sender=ProgramEnrollment, dispatch_uid="enrollments_program_save")
+@receiver(
+    post_save, sender=CourseRunCertificate, dispatch_uid="enrollments_run_cert_save"
+)
+@receiver(
+    post_save, sender=ProgramCertificate, dispatch_uid="enrollments_program_cert_save"
+)
+def handle_user_enrollment_change(sender, instance, **kwargs):  # noqa: ARG001
+    """
+    When one of a user's enrollments or certificates changes, clear their cached dashboard enrollments
+    """
+    invalidate_user_enrollments_cache(instance.user_id)
+
+
+@receiver(post_save, sender=Order, dispatch_uid="enrollments_order_save")
+def handle_order_change(sender, instance, **kwargs):  # noqa: ARG001
+    """
+    When an order changes (e.g. it is fulfilled or refunded), clear the purchaser's cached dashboard
+    enrollments since the enrollment receipts depend on the order status
+    """
+    invalidate_user_enrollments_cache(instance.purchaser_id)
@@ -12,6 +12,7 @@ from courses.factories import (
     CourseRunFactory,
     UserFactory,
 )
+from courses.utils import batch_program_certificate_generation
 
 pytestmark = pytest.mark.django_db
 
@@ -50,3 +51,28 @@ def test_generate_program_certificate_not_called(
     cert = CourseRunCertificateFactory.create(user=user, course_run=course_run)
     cert.save()
     generate_program_cert_mock.assert_not_called()
+
+
+@patch("courses.signals.generate_program_certificate", autospec=True)
+def test_create_course_certificate_batched(
+    generate_program_cert_mock, mocker, django_capture_on_commit_callbacks
+):
+    """
+    Test that the program certificates for course certificates created inside
+    batch_program_certificate_generation are evaluated together when it exits
+    """
+    generate_program_certs_mock = mocker.patch(
+        "courses.utils.generate_program_certificates"
+    )
+    users = UserFactory.create_batch(2)
+    course_run = CourseRunFactory.create()
+    with django_capture_on_commit_callbacks(execute=True):
+        with batch_program_certificate_generation():
+            for user in users:
+                CourseRunCertificateFactory.create(user=user, course_run=course_run)
+            generate_program_certs_mock.assert_not_called()
+
+    generate_program_cert_mock.assert_not_called()
+    generate_program_certs_mock.assert_called_once_with(
+        {(user.id, course_run.course.program_id) for user in users}
+    )
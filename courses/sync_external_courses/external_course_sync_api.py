@@ -1,5 +1,6 @@
 """API for external course sync"""
 
+import hashlib
 import json
 import logging
 import re
@@ -9,7 +10,9 @@ from decimal import Decimal
 from enum import Enum
 from pathlib import Path
 
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.db.models import Prefetch
 from wagtail.images.models import Image
@@ -26,12 +29,15 @@ from cms.models import (
 )
 from cms.wagtail_hooks import create_common_child_pages_for_external_courses
 from courses.api import generate_course_readable_id
+from courses.catalog_cache import bump_catalog_version
 from courses.models import Course, CourseLanguage, CourseRun, CourseTopic, Platform
 from courses.sync_external_courses.utils import StatsCollector
 from courses.sync_external_courses.external_course_sync_api_client import (
     ExternalCourseSyncAPIClient,
 )
-from ecommerce.models import Product, ProductVersion
+from ecommerce.api import update_sellability_for_objects
+from ecommerce.models import CouponEligibility, Product, ProductVersion
+from hubspot_xpro.task_helpers import sync_hubspot_product
 from mitxpro.utils import (
     clean_url,
     now_in_utc,
@@ -43,6 +49,8 @@ log = logging.getLogger(__name__)
 
 EMERITUS_PLATFORM_NAME = "Emeritus"
 GLOBAL_ALUMNI_PLATFORM_NAME = "Global Alumni"
+# Bump this when the page sync changes how it uses the External course data, so that every page is synced again
+EXTERNAL_COURSE_PAGE_CONTENT_HASH_VERSION = 1
 
 
 class ExternalCourseVendorBaseKeyMap:
@@ -189,6 +197,32 @@ class ExternalCourse:
             else []
         )
 
+    @property
+    def page_content_hash(self):
+        """
+        Returns a fingerprint of the fields that the course page and its child pages are synced from.
+        Course run fields (dates, prices) are left out since they don't affect the pages.
+        """
+        page_content = {
+            "version": EXTERNAL_COURSE_PAGE_CONTENT_HASH_VERSION,
+            "course_title": self.course_title,
+            "marketing_url": self.marketing_url,
+            "duration": self.duration,
+            "min_weeks": self.min_weeks,
+            "max_weeks": self.max_weeks,
+            "language": self.language,
+            "description": self.description,
+            "format": self.format,
+            "category": self.category,
+            "image_name": self.image_name,
+            "CEUs": str(self.CEUs) if self.CEUs else None,
+            "learning_outcomes_list": self.learning_outcomes_list,
+            "who_should_enroll_list": self.who_should_enroll_list,
+        }
+        return hashlib.sha256(
+            json.dumps(page_content, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
     def validate_required_fields(self, keymap):
         """
         Validates the course data.
@@ -215,21 +249,22 @@ class ExternalCourse:
         return True, None
 
 
-def fetch_external_courses(keymap):
+def request_external_course_report(keymap, client):
     """
-    Fetches external courses data.
+    Requests the report data for an External course vendor.
+
     Args:
         keymap(ExternalCourseVendorBaseKeyMap): An ExternalCourseVendorBaseKeyMap object
+        client(ExternalCourseSyncAPIClient): An ExternalCourseSyncAPIClient object
 
-    Makes a request to get the list of available queries and then queries the required reports.
+    Returns:
+        dict or None: The query response, which holds either a `query_result` if the results are ready,
+            or a `job` to poll until they are. None if none of the vendor's reports are available.
     """
     end_date = now_in_utc()
     start_date = end_date - timedelta(days=1)
 
-    external_course_sync_api_client = ExternalCourseSyncAPIClient()
-    queries = external_course_sync_api_client.get_queries_list()
-
-    for query in queries:  # noqa: RET503
+    for query in client.get_queries_list():
         # Check if query is in list of desired reports
         if query["name"] not in keymap.report_names:
             log.info(
@@ -238,75 +273,118 @@ def fetch_external_courses(keymap):
             continue
 
         log.info("Requesting data for {}...".format(query["name"]))  # noqa: G001
-        query_response = external_course_sync_api_client.get_query_response(
-            query["id"], start_date, end_date
-        )
-        if "job" in query_response:
-            # If a job is returned, we will poll until status = 3 (Success)
-            # Status values 1 and 2 correspond to in-progress,
-            # while 4 and 5 correspond to Failed, and Canceled, respectively.
-            job_id = query_response["job"]["id"]
-            log.info(
-                f"Job id: {job_id} found... waiting for completion..."  # noqa: G004
-            )
-            while True:
-                job_status = external_course_sync_api_client.get_job_status(job_id)
-                if (
-                    job_status["job"]["status"]
-                    == ExternalCourseSyncAPIJobStatus.READY.value
-                ):
-                    # If true, the query_result is ready to be collected.
-                    log.info("Job complete... requesting results...")
-                    query_response = external_course_sync_api_client.get_query_result(
-                        job_status["job"]["query_result_id"]
-                    )
-                    break
-                elif job_status["job"]["status"] in [
-                    ExternalCourseSyncAPIJobStatus.FAILED.value,
-                    ExternalCourseSyncAPIJobStatus.CANCELLED.value,
-                ]:
-                    log.error("Job failed!")
-                    break
-                else:
-                    # Continue waiting until complete.
-                    log.info("Job not yet complete... sleeping for 2 seconds...")
-                    time.sleep(2)
-
-        if "query_result" in query_response:
-            # Check that query_result is in the data payload.
-            # Return result as json
-            return dict(query_response["query_result"]["data"]).get("rows", [])
-        log.error("Something unexpected happened!")
+        return client.get_query_response(query["id"], start_date, end_date)
+    return None
 
 
-def update_external_course_runs(external_courses, keymap):  # noqa: C901, PLR0915
+def get_external_course_job_result(client, job_id):
     """
-    Updates or creates the required course data i.e. Course, CourseRun,
-    ExternalCoursePage, CourseTopic, WhoShouldEnrollPage, and LearningOutcomesPage
+    Checks the status of an External course report job once.
+
+    Status values 1 and 2 correspond to in-progress, 3 to success,
+    while 4 and 5 correspond to Failed, and Canceled, respectively.
 
     Args:
-        external_courses(list[dict]): A list of External Courses as a dict.
-        keymap(ExternalCourseVendorBaseKeyMap): An ExternalCourseVendorBaseKeyMap object
+        client(ExternalCourseSyncAPIClient): An ExternalCourseSyncAPIClient object
+        job_id(int): The id of the report job
+
     Returns:
-        StatsCollector: A StatsCollector object with collected stats
+        tuple(bool, dict or None): Whether the job is finished, and the query response if it is
     """
-    stats_collector = StatsCollector()
-    platform, _ = Platform.objects.get_or_create(
-        name__iexact=keymap.platform_name,
-        defaults={"name": keymap.platform_name},
+    job_status = client.get_job_status(job_id)
+    if job_status["job"]["status"] == ExternalCourseSyncAPIJobStatus.READY.value:
+        # If true, the query_result is ready to be collected.
+        log.info("Job complete... requesting results...")
+        return True, client.get_query_result(job_status["job"]["query_result_id"])
+    elif job_status["job"]["status"] in [
+        ExternalCourseSyncAPIJobStatus.FAILED.value,
+        ExternalCourseSyncAPIJobStatus.CANCELLED.value,
+    ]:
+        log.error("Job failed!")
+        return True, {}
+    return False, None
+
+
+def get_external_course_job_poll_delay(attempt):
+    """
+    Returns the number of seconds to wait before checking a report job again, backing off exponentially
+
+    Args:
+        attempt(int): The number of times the job status was already checked
+    """
+    return min(
+        settings.EXTERNAL_COURSE_SYNC_JOB_POLL_INITIAL_DELAY * 2**attempt,
+        settings.EXTERNAL_COURSE_SYNC_JOB_POLL_MAX_DELAY,
     )
-    course_index_page = Page.objects.get(id=CourseIndexPage.objects.first().id).specific
 
-    external_course_run_codes = [
-        course_run.get("course_run_code")
-        for course_run in external_courses
-        if "course_run_code" in course_run
-    ]
-    deactivated_course_run_codes = deactivate_missing_course_runs(
-        external_course_run_codes, platform
+
+def get_external_course_query_rows(query_response):
+    """
+    Returns the External course rows from a query response
+
+    Args:
+        query_response(dict): A query response from the External course sync API
+
+    Returns:
+        list or None: The External course rows, or None if the response has no results
+    """
+    if "query_result" in query_response:
+        # Check that query_result is in the data payload.
+        return dict(query_response["query_result"]["data"]).get("rows", [])
+    log.error("Something unexpected happened!")
+    return None
+
+
+def fetch_external_courses(keymap):
+    """
+    Fetches external courses data, waiting for the report job to complete if the results aren't cached.
+    Args:
+        keymap(ExternalCourseVendorBaseKeyMap): An ExternalCourseVendorBaseKeyMap object
+
+    Makes a request to get the list of available queries and then queries the required reports.
+    """
+    external_course_sync_api_client = ExternalCourseSyncAPIClient()
+    query_response = request_external_course_report(
+        keymap, external_course_sync_api_client
     )
-    stats_collector.add_bulk("course_runs_deactivated", deactivated_course_run_codes)
+    if query_response is None:
+        return None
+
+    if "job" in query_response:
+        job_id = query_response["job"]["id"]
+        log.info(
+            f"Job id: {job_id} found... waiting for completion..."  # noqa: G004
+        )
+        attempt = 0
+        while True:
+            is_finished, job_query_response = get_external_course_job_result(
+                external_course_sync_api_client, job_id
+            )
+            if is_finished:
+                query_response = job_query_response
+                break
+            delay = get_external_course_job_poll_delay(attempt)
+            log.info(
+                f"Job not yet complete... sleeping for {delay} seconds..."  # noqa: G004
+            )
+            time.sleep(delay)
+            attempt += 1
+
+    return get_external_course_query_rows(query_response)
 
+
+def get_valid_external_courses(external_courses, keymap, stats_collector):
+    """
+    Parses the External course data, skipping (and collecting stats for) rows with invalid data
+
+    Args:
+        external_courses(list[dict]): A list of External Courses as a dict.
+        keymap(ExternalCourseVendorBaseKeyMap): An ExternalCourseVendorBaseKeyMap object
+        stats_collector(StatsCollector): A StatsCollector object
+
+    Yields:
+        ExternalCourse: The valid External courses
+    """
     for external_course_json in external_courses:
         external_course = ExternalCourse(external_course_json, keymap)
 
@@ -350,6 +428,224 @@ def update_external_course_runs(external_courses, keymap):  # noqa: C901, PLR091
             )
             continue
 
+        yield external_course
+
+
+def get_external_course_image(external_course):
+    """
+    Returns the image for an External course, matched by its image name with or without the extension
+
+    Args:
+        external_course(ExternalCourse): A ExternalCourse object.
+
+    Returns:
+        Image or None: The latest image with a matching title, if there is one
+    """
+    if not external_course.image_name:
+        return None
+    image = (
+        Image.objects.filter(title=external_course.image_name)
+        .order_by("-created_at")
+        .first()
+    )
+    if not image:
+        image_title = Path(external_course.image_name).stem
+        image = Image.objects.filter(title=image_title).order_by("-created_at").first()
+    return image
+
+
+def get_external_course_page_sync_hash(course_page, external_course):
+    """
+    Returns the fingerprint stored on an ExternalCoursePage once it's synced. Along with the External
+    course data, it covers the image that the data resolves to and which child pages the page has, since
+    the sync also sets the image and recreates missing child pages.
+
+    Args:
+        course_page(ExternalCoursePage): An ExternalCoursePage object.
+        external_course(ExternalCourse): A ExternalCourse object.
+
+    Returns:
+        str: The fingerprint
+    """
+    image = get_external_course_image(external_course)
+    child_page_types = sorted(
+        set(course_page.get_children().values_list("content_type__model", flat=True))
+    )
+    return hashlib.sha256(
+        json.dumps(
+            {
+                "content": external_course.page_content_hash,
+                "image_id": image.id if image else None,
+                "child_page_types": child_page_types,
+            },
+            sort_keys=True,
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def sync_external_course_pages(  # noqa: C901
+    course_index_page, course, external_course, keymap, stats_collector
+):
+    """
+    Creates or updates the ExternalCoursePage for a course, along with its topic and child pages.
+    Courses whose page was already synced from the same External course data, image and child pages
+    are skipped.
+
+    Args:
+        course_index_page(CourseIndexPage): A course index page object.
+        course(Course): A course object.
+        external_course(ExternalCourse): A ExternalCourse object.
+        keymap(ExternalCourseVendorBaseKeyMap): An ExternalCourseVendorBaseKeyMap object
+        stats_collector(StatsCollector): A StatsCollector object
+    """
+    course_page = ExternalCoursePage.objects.filter(course=course).first()
+    if (
+        course_page is not None
+        and course_page.external_content_hash
+        == get_external_course_page_sync_hash(course_page, external_course)
+    ):
+        stats_collector.add_stat(
+            "course_pages_unchanged",
+            external_course.course_code,
+            external_course.course_title,
+        )
+        log.info(
+            f"External course data unchanged, skipping course page for course title: {external_course.course_title}"  # noqa: G004
+        )
+        return
+
+    log.info(
+        f"Creating or Updating course page, title: {external_course.course_title}, course_code: {external_course.course_run_code}"  # noqa: G004
+    )
+    (
+        course_page,
+        course_page_created,
+        course_page_updated,
+        course_page_published,
+    ) = create_or_update_external_course_page(
+        course_index_page, course, external_course, keymap
+    )
+
+    if course_page_created:
+        stats_collector.add_stat(
+            "course_pages_created",
+            external_course.course_code,
+            external_course.course_title,
+        )
+        log.info(
+            f"Created external course page for course title: {external_course.course_title}"  # noqa: G004
+        )
+    elif course_page_updated and course_page_published:
+        stats_collector.add_stat(
+            "course_pages_updated",
+            external_course.course_code,
+            external_course.course_title,
+        )
+        log.info(
+            f"Updated external course page for course title: {external_course.course_title}"  # noqa: G004
+        )
+    elif course_page_updated:
+        stats_collector.add_stat(
+            "course_pages_kept_as_draft",
+            external_course.course_code,
+            external_course.course_title,
+        )
+        log.info(
+            "Updated external course page kept as draft (page has unpublished changes)"
+        )
+
+    if external_course.category:
+        topic = CourseTopic.objects.filter(
+            name__iexact=external_course.category
+        ).first()
+        if topic and not course_page.topics.filter(id=topic.id).exists():
+            course_page.topics.add(topic)
+            course_page.save()
+            log.info(
+                f"Added topic {topic.name} for {external_course.course_title}"  # noqa: G004
+            )
+
+    outcomes_page = course_page.get_child_page_of_type_including_draft(
+        LearningOutcomesPage
+    )
+    if not outcomes_page and external_course.learning_outcomes_list:
+        create_learning_outcomes_page(
+            course_page, external_course.learning_outcomes_list, keymap
+        )
+        log.info("Created LearningOutcomesPage.")
+
+    who_should_enroll_page = course_page.get_child_page_of_type_including_draft(
+        WhoShouldEnrollPage
+    )
+    if not who_should_enroll_page and external_course.who_should_enroll_list:
+        create_who_should_enroll_in_page(
+            course_page, external_course.who_should_enroll_list, keymap
+        )
+        log.info("Created WhoShouldEnrollPage.")
+
+    if external_course.CEUs:
+        log.info(
+            f"Creating or Updating Certificate Page for title: {external_course.course_title}, course_code: {course.readable_id}, CEUs: {external_course.CEUs}"  # noqa: G004
+        )
+        _, is_certificatepage_created, is_certificatepage_updated = (
+            create_or_update_certificate_page(course_page, external_course)
+        )
+
+        if is_certificatepage_created:
+            log.info("Certificate Page Created")
+            stats_collector.add_stat("certificates_created", course.readable_id)
+        elif is_certificatepage_updated:
+            stats_collector.add_stat("certificates_updated", course.readable_id)
+            log.info("Certificate Page Updated")
+
+    overview_page = course_page.get_child_page_of_type_including_draft(
+        CourseOverviewPage
+    )
+    if not overview_page and external_course.description:
+        create_course_overview_page(course_page, external_course)
+        log.info("Created CourseOverviewPage.")
+
+    create_common_child_pages_for_external_courses(None, course_page)
+
+    # Update the column directly, so that storing the fingerprint doesn't create a page revision
+    ExternalCoursePage.objects.filter(id=course_page.id).update(
+        external_content_hash=get_external_course_page_sync_hash(
+            course_page, external_course
+        )
+    )
+
+
+def update_external_course_runs(external_courses, keymap):  # noqa: C901, PLR0915
+    """
+    Updates or creates the required course data i.e. Course, CourseRun,
+    ExternalCoursePage, CourseTopic, WhoShouldEnrollPage, and LearningOutcomesPage
+
+    Args:
+        external_courses(list[dict]): A list of External Courses as a dict.
+        keymap(ExternalCourseVendorBaseKeyMap): An ExternalCourseVendorBaseKeyMap object
+    Returns:
+        StatsCollector: A StatsCollector object with collected stats
+    """
+    stats_collector = StatsCollector()
+    platform, _ = Platform.objects.get_or_create(
+        name__iexact=keymap.platform_name,
+        defaults={"name": keymap.platform_name},
+    )
+    course_index_page = Page.objects.get(id=CourseIndexPage.objects.first().id).specific
+
+    external_course_run_codes = [
+        course_run.get("course_run_code")
+        for course_run in external_courses
+        if "course_run_code" in course_run
+    ]
+    deactivated_course_run_codes = deactivate_missing_course_runs(
+        external_course_run_codes, platform
+    )
+    stats_collector.add_bulk("course_runs_deactivated", deactivated_course_run_codes)
+
+    for external_course in get_valid_external_courses(
+        external_courses, keymap, stats_collector
+    ):
         with transaction.atomic():
             course, course_created = Course.objects.get_or_create(
                 external_course_id=external_course.course_code,
@@ -447,106 +743,443 @@ def update_external_course_runs(external_courses, keymap):  # noqa: C901, PLR091
                     external_course.course_title,
                 )
 
-            log.info(
-                f"Creating or Updating course page, title: {external_course.course_title}, course_code: {external_course.course_run_code}"  # noqa: G004
-            )
-            (
-                course_page,
-                course_page_created,
-                course_page_updated,
-                course_page_published,
-            ) = create_or_update_external_course_page(
-                course_index_page, course, external_course, keymap
+            sync_external_course_pages(
+                course_index_page, course, external_course, keymap, stats_collector
             )
 
-            if course_page_created:
-                stats_collector.add_stat(
-                    "course_pages_created",
-                    external_course.course_code,
-                    external_course.course_title,
-                )
+    # As we get the API data for course runs, we can have duplicate course codes in course created and updated,
+    # so, we are removing the courses created from the updated courses list.
+    stats_collector.remove_duplicates("existing_courses", "courses_created")
+    stats_collector.remove_duplicates("course_pages_updated", "course_pages_created")
+    stats_collector.remove_duplicates("course_pages_unchanged", "course_pages_created")
+    stats_collector.remove_duplicates("course_pages_unchanged", "course_pages_updated")
+    stats_collector.remove_duplicates(
+        "course_pages_kept_as_draft", "course_pages_created"
+    )
+    stats_collector.remove_duplicates(
+        "course_pages_unchanged", "course_pages_kept_as_draft"
+    )
+
+    return stats_collector
+
+
+def _bulk_get_or_create_external_courses(external_courses, platform, stats_collector):
+    """
+    Fetches the courses for the External course data in one query and bulk creates the missing ones.
+    Rows for a new course that fails validation are skipped (and collected in the stats).
+
+    Args:
+        external_courses(list[ExternalCourse]): Valid External courses
+        platform(Platform): The platform of the External courses
+        stats_collector(StatsCollector): A StatsCollector object
+
+    Returns:
+        dict: Courses keyed by external course code, without the courses which failed validation
+    """
+    courses_by_code = {
+        course.external_course_id: course
+        for course in Course.objects.filter(
+            platform=platform,
+            is_external=True,
+            external_course_id__in={
+                external_course.course_code for external_course in external_courses
+            },
+        )
+    }
+    new_courses, invalid_course_messages = {}, {}
+    for external_course in external_courses:
+        if external_course.course_code in invalid_course_messages:
+            stats_collector.add_stat(
+                "course_runs_skipped",
+                external_course.course_run_code,
+                external_course.course_title,
+                invalid_course_messages[external_course.course_code],
+            )
+            continue
+        if external_course.course_code in courses_by_code:
+            stats_collector.add_stat(
+                "existing_courses",
+                external_course.course_code,
+                external_course.course_title,
+            )
+            continue
+        if external_course.course_code not in new_courses:
+            course = Course(
+                external_course_id=external_course.course_code,
+                platform=platform,
+                is_external=True,
+                title=external_course.course_title,
+                readable_id=external_course.course_readable_id,
+                # All new courses are live by default, we will change the status manually
+                live=True,
+            )
+            try:
+                course.full_clean()
+            except ValidationError as exc:
                 log.info(
-                    f"Created external course page for course title: {external_course.course_title}"  # noqa: G004
-                )
-            elif course_page_updated and course_page_published:
-                stats_collector.add_stat(
-                    "course_pages_updated",
-                    external_course.course_code,
-                    external_course.course_title,
+                    f"Skipping due to invalid course data... course_code: {external_course.course_code} Error message: {exc}"  # noqa: G004
                 )
-                log.info(
-                    f"Updated external course page for course title: {external_course.course_title}"  # noqa: G004
+                invalid_course_messages[external_course.course_code] = (
+                    f"Invalid course: {exc}"
                 )
-            elif course_page_updated:
                 stats_collector.add_stat(
-                    "course_pages_kept_as_draft",
-                    external_course.course_code,
+                    "course_runs_skipped",
+                    external_course.course_run_code,
                     external_course.course_title,
+                    invalid_course_messages[external_course.course_code],
                 )
-                log.info(
-                    "Updated external course page kept as draft (page has unpublished changes)"
-                )
+                continue
+            new_courses[external_course.course_code] = course
+            stats_collector.add_stat(
+                "courses_created",
+                external_course.course_code,
+                external_course.course_title,
+            )
+    Course.objects.bulk_create(new_courses.values())
+    log.info("Created %d courses for platform %s", len(new_courses), platform.name)
+    return {**courses_by_code, **new_courses}
 
-            if external_course.category:
-                topic = CourseTopic.objects.filter(
-                    name__iexact=external_course.category
-                ).first()
-                if topic:
-                    course_page.topics.add(topic)
-                    course_page.save()
-                    log.info(
-                        f"Added topic {topic.name} for {external_course.course_title}"  # noqa: G004
-                    )
 
-            outcomes_page = course_page.get_child_page_of_type_including_draft(
-                LearningOutcomesPage
+def _bulk_create_or_update_external_course_runs(
+    external_courses, courses_by_code, stats_collector
+):
+    """
+    Fetches the course runs for the External course data in one query, then bulk creates the missing
+    runs and bulk updates the runs whose dates or live status changed
+
+    Args:
+        external_courses(list[ExternalCourse]): Valid External courses
+        courses_by_code(dict): Courses keyed by external course code
+        stats_collector(StatsCollector): A StatsCollector object
+
+    Returns:
+        dict: Course runs keyed by (course id, external course run code), without the runs which failed
+            validation
+    """
+    # If a run appears more than once, the last row wins (as it would if the rows were synced one by one)
+    external_courses_by_run_key = {
+        (
+            courses_by_code[external_course.course_code].id,
+            external_course.course_run_code,
+        ): external_course
+        for external_course in external_courses
+    }
+    existing_runs = {
+        (course_run.course_id, course_run.external_course_run_id): course_run
+        for course_run in CourseRun.objects.filter(
+            course__in=courses_by_code.values(),
+            external_course_run_id__in={
+                run_code for _, run_code in external_courses_by_run_key
+            },
+        )
+    }
+    now = now_in_utc()
+    new_runs, updated_runs, invalid_run_keys = [], [], set()
+    for run_key, external_course in external_courses_by_run_key.items():
+        course_run = existing_runs.get(run_key)
+        if course_run is None:
+            course = courses_by_code[external_course.course_code]
+            course_run = CourseRun(
+                external_course_run_id=external_course.course_run_code,
+                course=course,
+                title=external_course.course_title,
+                courseware_id=generate_external_course_run_courseware_id(
+                    external_course.course_run_tag, course.readable_id
+                ),
+                run_tag=external_course.course_run_tag,
+                start_date=external_course.start_date,
+                end_date=external_course.end_date,
+                enrollment_end=external_course.enrollment_end,
+                live=True,
             )
-            if not outcomes_page and external_course.learning_outcomes_list:
-                create_learning_outcomes_page(
-                    course_page, external_course.learning_outcomes_list, keymap
-                )
-                log.info("Created LearningOutcomesPage.")
+            run_list = new_runs
+        elif external_course_run_needs_update(course_run, external_course):
+            course_run.start_date = external_course.start_date
+            course_run.end_date = external_course.end_date
+            course_run.enrollment_end = external_course.enrollment_end
+            course_run.live = True
+            course_run.updated_on = now
+            run_list = updated_runs
+        else:
+            continue
 
-            who_should_enroll_page = course_page.get_child_page_of_type_including_draft(
-                WhoShouldEnrollPage
+        try:
+            # Bulk writes skip CourseRun.save, so validate the dates here
+            course_run.clean()
+        except ValidationError as exc:
+            log.info(
+                f"Course run has invalid dates, Skipping... course_run_code: {external_course.course_run_code} Error message: {exc}"  # noqa: G004
             )
-            if not who_should_enroll_page and external_course.who_should_enroll_list:
-                create_who_should_enroll_in_page(
-                    course_page, external_course.who_should_enroll_list, keymap
-                )
-                log.info("Created WhoShouldEnrollPage.")
+            stats_collector.add_stat(
+                "course_runs_with_invalid_dates",
+                external_course.course_run_code,
+                external_course.course_title,
+            )
+            invalid_run_keys.add(run_key)
+            continue
+        run_list.append(course_run)
 
-            if external_course.CEUs:
-                log.info(
-                    f"Creating or Updating Certificate Page for title: {external_course.course_title}, course_code: {course.readable_id}, CEUs: {external_course.CEUs}"  # noqa: G004
-                )
-                _, is_certificatepage_created, is_certificatepage_updated = (
-                    create_or_update_certificate_page(course_page, external_course)
-                )
+    CourseRun.objects.bulk_create(new_runs)
+    CourseRun.objects.bulk_update(
+        updated_runs, ["start_date", "end_date", "enrollment_end", "live", "updated_on"]
+    )
+    for stat_key, course_runs in [
+        ("course_runs_created", new_runs),
+        ("course_runs_updated", updated_runs),
+    ]:
+        for course_run in course_runs:
+            stats_collector.add_stat(
+                stat_key, course_run.external_course_run_id, course_run.title
+            )
+    log.info(
+        "Created %d and updated %d external course runs",
+        len(new_runs),
+        len(updated_runs),
+    )
+    return {
+        run_key: course_run
+        for run_key, course_run in existing_runs.items()
+        if run_key not in invalid_run_keys
+    } | {
+        (course_run.course_id, course_run.external_course_run_id): course_run
+        for course_run in new_runs
+    }
+
+
+def _bulk_create_or_update_products(
+    external_courses, courses_by_code, course_runs, stats_collector
+):
+    """
+    Creates a new ProductVersion (and the Product, if needed) for each course run whose price changed,
+    with one query to fetch the current prices and bulk inserts for the changes
 
-                if is_certificatepage_created:
-                    log.info("Certificate Page Created")
-                    stats_collector.add_stat("certificates_created", course.readable_id)
-                elif is_certificatepage_updated:
-                    stats_collector.add_stat("certificates_updated", course.readable_id)
-                    log.info("Certificate Page Updated")
+    Args:
+        external_courses(list[ExternalCourse]): Valid External courses
+        courses_by_code(dict): Courses keyed by external course code
+        course_runs(dict): Course runs keyed by (course id, external course run code)
+        stats_collector(StatsCollector): A StatsCollector object
 
-            overview_page = course_page.get_child_page_of_type_including_draft(
-                CourseOverviewPage
+    Returns:
+        list of Product: The products that got a new version
+    """
+    prices = {}
+    for external_course in external_courses:
+        if external_course.price:
+            run_key = (
+                courses_by_code[external_course.course_code].id,
+                external_course.course_run_code,
+            )
+            prices[run_key] = external_course.price
+        else:
+            log.info(
+                f"Price is Null for course run code: {external_course.course_run_code}"  # noqa: G004
+            )
+            stats_collector.add_stat(
+                "course_runs_without_prices",
+                external_course.course_run_code,
+                external_course.course_title,
             )
-            if not overview_page and external_course.description:
-                create_course_overview_page(course_page, external_course)
-                log.info("Created CourseOverviewPage.")
 
-            create_common_child_pages_for_external_courses(None, course_page)
+    course_run_content_type = ContentType.objects.get_for_model(CourseRun)
+    products_by_run_id = {
+        product.object_id: product
+        for product in Product.all_objects.filter(
+            content_type=course_run_content_type,
+            object_id__in=[course_runs[run_key].id for run_key in prices],
+        )
+    }
+    # The current price of a run is the latest version price of its active product
+    current_prices = dict(
+        ProductVersion.objects.filter(
+            product__in=[
+                product for product in products_by_run_id.values() if product.is_active
+            ]
+        )
+        .order_by("product_id", "-created_on")
+        .distinct("product_id")
+        .values_list("product_id", "price")
+    )
+
+    new_products, reactivated_products, repriced_runs = [], [], []
+    for run_key, price in prices.items():
+        course_run = course_runs[run_key]
+        product = products_by_run_id.get(course_run.id)
+        current_price = current_prices.get(product.id) if product else None
+        # Prices come from the API as floats, so compare them as the 2 decimal place values we store
+        if current_price and current_price == Decimal(str(price)).quantize(
+            current_price
+        ):
+            continue
+        if product is None:
+            product = Product(
+                content_type=course_run_content_type, object_id=course_run.id
+            )
+            products_by_run_id[course_run.id] = product
+            new_products.append(product)
+        elif not product.is_active:
+            product.is_active = True
+            reactivated_products.append(product)
+        repriced_runs.append(course_run)
+
+    Product.all_objects.bulk_create(new_products)
+    _bulk_apply_future_run_coupons(new_products, course_runs)
+    Product.all_objects.filter(
+        id__in=[product.id for product in reactivated_products]
+    ).update(is_active=True, updated_on=now_in_utc())
+    ProductVersion.objects.bulk_create(
+        [
+            ProductVersion(
+                product=products_by_run_id[course_run.id],
+                price=prices[(course_run.course_id, course_run.external_course_run_id)],
+                description=course_run.courseware_id,
+                text_id=course_run.text_id,
+            )
+            for course_run in repriced_runs
+        ]
+    )
+    new_product_ids = {product.id for product in new_products}
+    for course_run in repriced_runs:
+        if products_by_run_id[course_run.id].id in new_product_ids:
+            stats_collector.add_stat(
+                "products_created", course_run.external_course_run_id, course_run.title
+            )
+        stats_collector.add_stat(
+            "product_versions_created",
+            course_run.external_course_run_id,
+            course_run.title,
+        )
+    return [products_by_run_id[course_run.id] for course_run in repriced_runs]
+
+
+def _bulk_apply_future_run_coupons(new_products, course_runs):
+    """
+    Makes the coupons which apply to future runs of a course eligible for the new products of its
+    runs. bulk_create skips the apply_coupon_on_all_runs post_save handler, so this does its work.
+
+    Args:
+        new_products(list of Product): The products which were just created for course runs
+        course_runs(dict): Course runs keyed by (course id, external course run code)
+    """
+    if not new_products:
+        return
+    course_ids_by_run_id = {
+        course_run.id: course_run.course_id for course_run in course_runs.values()
+    }
+    course_ids = {course_ids_by_run_id[product.object_id] for product in new_products}
+    coupon_ids_by_course_id = {}
+    for course_id, coupon_id in (
+        CouponEligibility.objects.filter(
+            product__courseruns__course_id__in=course_ids,
+            coupon__include_future_runs=True,
+        )
+        .exclude(product__in=new_products)
+        .values_list("product__courseruns__course_id", "coupon_id")
+        .distinct()
+    ):
+        coupon_ids_by_course_id.setdefault(course_id, set()).add(coupon_id)
+
+    CouponEligibility.objects.bulk_create(
+        [
+            CouponEligibility(product=product, coupon_id=coupon_id)
+            for product in new_products
+            for coupon_id in coupon_ids_by_course_id.get(
+                course_ids_by_run_id[product.object_id], ()
+            )
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def bulk_update_external_course_runs(external_courses, keymap):
+    """
+    Bulk version of update_external_course_runs. Existing courses, course runs and products are
+    fetched up front in a few queries, and only the rows that changed are written, with bulk
+    operations. Pages are then synced once per course, rather than once per course run.
+
+    Args:
+        external_courses(list[dict]): A list of External Courses as a dict.
+        keymap(ExternalCourseVendorBaseKeyMap): An ExternalCourseVendorBaseKeyMap object
+    Returns:
+        StatsCollector: A StatsCollector object with collected stats
+    """
+    stats_collector = StatsCollector()
+    platform, _ = Platform.objects.get_or_create(
+        name__iexact=keymap.platform_name,
+        defaults={"name": keymap.platform_name},
+    )
+    course_index_page = Page.objects.get(id=CourseIndexPage.objects.first().id).specific
+
+    external_course_run_codes = [
+        course_run.get("course_run_code")
+        for course_run in external_courses
+        if "course_run_code" in course_run
+    ]
+    deactivated_course_run_codes = deactivate_missing_course_runs(
+        external_course_run_codes, platform
+    )
+    stats_collector.add_bulk("course_runs_deactivated", deactivated_course_run_codes)
+
+    valid_external_courses = list(
+        get_valid_external_courses(external_courses, keymap, stats_collector)
+    )
+    with transaction.atomic():
+        courses_by_code = _bulk_get_or_create_external_courses(
+            valid_external_courses, platform, stats_collector
+        )
+        valid_external_courses = [
+            external_course
+            for external_course in valid_external_courses
+            if external_course.course_code in courses_by_code
+        ]
+        course_runs = _bulk_create_or_update_external_course_runs(
+            valid_external_courses, courses_by_code, stats_collector
+        )
+        valid_external_courses = [
+            external_course
+            for external_course in valid_external_courses
+            if (
+                courses_by_code[external_course.course_code].id,
+                external_course.course_run_code,
+            )
+            in course_runs
+        ]
+        repriced_products = _bulk_create_or_update_products(
+            valid_external_courses, courses_by_code, course_runs, stats_collector
+        )
+        # Bulk operations don't send model signals, so do the work of the relevant handlers here
+        update_sellability_for_objects(
+            course_run_ids=[course_run.id for course_run in course_runs.values()]
+        )
+        bump_catalog_version()
+
+    for product in repriced_products:
+        sync_hubspot_product(product)
+
+    # Later rows for a course win, as they would if the rows were synced one by one
+    external_courses_by_code = {
+        external_course.course_code: external_course
+        for external_course in valid_external_courses
+    }
+    for course_code, external_course in external_courses_by_code.items():
+        with transaction.atomic():
+            sync_external_course_pages(
+                course_index_page,
+                courses_by_code[course_code],
+                external_course,
+                keymap,
+                stats_collector,
+            )
 
-    # As we get the API data for course runs, we can have duplicate course codes in course created and updated,
-    # so, we are removing the courses created from the updated courses list.
     stats_collector.remove_duplicates("existing_courses", "courses_created")
     stats_collector.remove_duplicates("course_pages_updated", "course_pages_created")
+    stats_collector.remove_duplicates("course_pages_unchanged", "course_pages_created")
+    stats_collector.remove_duplicates("course_pages_unchanged", "course_pages_updated")
     stats_collector.remove_duplicates(
         "course_pages_kept_as_draft", "course_pages_created"
     )
+    stats_collector.remove_duplicates(
+        "course_pages_unchanged", "course_pages_kept_as_draft"
+    )
 
     return stats_collector
 
@@ -634,19 +1267,7 @@ def create_or_update_external_course_page(  # noqa: C901
         name__icontains=external_course.language
     )
 
-    image = None
-    if external_course.image_name:
-        image = (
-            Image.objects.filter(title=external_course.image_name)
-            .order_by("-created_at")
-            .first()
-        )
-
-        if not image:
-            image_title = Path(external_course.image_name).stem
-            image = (
-                Image.objects.filter(title=image_title).order_by("-created_at").first()
-            )
+    image = get_external_course_image(external_course)
 
     is_created = is_updated = False
     is_published = True
@@ -665,7 +1286,12 @@ def create_or_update_external_course_page(  # noqa: C901
             thumbnail_image=image,
             language=course_language,
         )
-        course_index_page.add_child(instance=course_page)
+        with transaction.atomic():
+            # The platforms are synced concurrently, so lock the index page while adding the child to
+            # it, and refresh its child count, which treebeard uses to compute the new page's path
+            Page.objects.select_for_update().get(id=course_index_page.id)
+            course_index_page.refresh_from_db(fields=["numchild"])
+            course_index_page.add_child(instance=course_page)
         course_page.save_revision().publish()
         is_created = True
     else:
@@ -711,6 +1337,41 @@ def create_or_update_external_course_page(  # noqa: C901
     return course_page, is_created, is_updated, is_published
 
 
+def external_course_run_needs_update(course_run, external_course):
+    """
+    Returns True if an existing course run's dates or live status differ from the External course data
+
+    Args:
+        course_run (CourseRun): CourseRun object
+        external_course (ExternalCourse): ExternalCourse object
+
+    Returns:
+        bool: True if the course run should be updated
+    """
+    return bool(
+        (not course_run.start_date and external_course.start_date)
+        or (
+            course_run.start_date
+            and external_course.start_date
+            and course_run.start_date.date() != external_course.start_date.date()
+        )
+        or (not course_run.end_date and external_course.end_date)
+        or (
+            course_run.end_date
+            and external_course.end_date
+            and course_run.end_date.date() != external_course.end_date.date()
+        )
+        or (not course_run.enrollment_end and external_course.enrollment_end)
+        or (
+            course_run.enrollment_end
+            and external_course.enrollment_end
+            and course_run.enrollment_end.date()
+            != external_course.enrollment_end.date()
+        )
+        or course_run.live is False
+    )
+
+
 def create_or_update_external_course_run(course, external_course):
     """
     Creates or updates the external course run.
@@ -745,28 +1406,7 @@ def create_or_update_external_course_run(course, external_course):
             live=True,
         )
         is_created = True
-    elif (
-        (not course_run.start_date and external_course.start_date)
-        or (
-            course_run.start_date
-            and external_course.start_date
-            and course_run.start_date.date() != external_course.start_date.date()
-        )
-        or (not course_run.end_date and external_course.end_date)
-        or (
-            course_run.end_date
-            and external_course.end_date
-            and course_run.end_date.date() != external_course.end_date.date()
-        )
-        or (not course_run.enrollment_end and external_course.enrollment_end)
-        or (
-            course_run.enrollment_end
-            and external_course.enrollment_end
-            and course_run.enrollment_end.date()
-            != external_course.enrollment_end.date()
-        )
-        or course_run.live is False
-    ):
+    elif external_course_run_needs_update(course_run, external_course):
         course_run.start_date = external_course.start_date
         course_run.end_date = external_course.end_date
         course_run.enrollment_end = external_course.enrollment_end
@@ -18,14 +18,16 @@ from cms.factories import (
     ExternalCoursePageFactory,
     HomePageFactory,
 )
-from cms.models import CertificatePage
+from cms.models import CertificatePage, CourseOverviewPage
 from courses.factories import CourseFactory, CourseRunFactory, PlatformFactory
 from courses.models import Course, CourseRun
+from courses.sync_external_courses import external_course_sync_api
 from courses.sync_external_courses.external_course_sync_api import (
     EMERITUS_PLATFORM_NAME,
     GLOBAL_ALUMNI_PLATFORM_NAME,
     EmeritusKeyMap,
     ExternalCourse,
+    bulk_update_external_course_runs,
     GlobalAlumniKeyMap,
     create_learning_outcomes_page,
     create_or_update_certificate_page,
@@ -36,13 +38,21 @@ from courses.sync_external_courses.external_course_sync_api import (
     fetch_external_courses,
     generate_external_course_run_courseware_id,
     generate_external_course_run_tag,
+    get_external_course_page_sync_hash,
     parse_external_course_data_str,
     save_page_revision,
+    sync_external_course_pages,
     update_external_course_runs,
     deactivate_missing_course_runs,
     validate_courserun_dates,
 )
-from ecommerce.factories import ProductFactory, ProductVersionFactory
+from courses.sync_external_courses.utils import StatsCollector
+from ecommerce.factories import (
+    CouponEligibilityFactory,
+    ProductFactory,
+    ProductVersionFactory,
+)
+from ecommerce.models import CouponEligibility
 from mitxpro.test_utils import MockResponse
 from mitxpro.utils import clean_url, strip_datetime, now_in_utc
 
@@ -703,6 +713,301 @@ def test_update_external_course_runs(  # noqa: PLR0915, PLR0913
             assert certificate_page.CEUs == Decimal(str(external_course_run["ceu"]))
 
 
+@pytest.mark.parametrize(
+    "external_course_data",
+    [{"platform": EMERITUS_PLATFORM_NAME}, {"platform": GLOBAL_ALUMNI_PLATFORM_NAME}],
+    indirect=True,
+)
+@pytest.mark.parametrize("create_existing_data", [True, False])
+@pytest.mark.django_db
+def test_bulk_update_external_course_runs(  # noqa: PLR0913
+    mocker,
+    external_course_data,
+    create_existing_data,
+    external_expired_course_data,
+    external_course_with_bad_data,
+    external_course_data_with_null_price,
+):
+    """
+    Tests that `bulk_update_external_course_runs` creates new courses, runs and products, updates
+    existing ones, and writes nothing when the same data is synced again.
+    """
+    mock_sync_hubspot_product = mocker.patch(
+        "courses.sync_external_courses.external_course_sync_api.sync_hubspot_product"
+    )
+    with Path(
+        "courses/sync_external_courses/test_data/batch_test.json"
+    ).open() as test_data_file:
+        external_course_runs = json.load(test_data_file)["rows"]
+
+    platform_name = get_platform(external_course_data["course_run_code"])
+    platform = PlatformFactory.create(name=platform_name)
+    home_page = HomePageFactory.create(title="Home Page", subhead="<p>subhead</p>")
+    CourseIndexPageFactory.create(parent=home_page, title="Courses")
+
+    if create_existing_data:
+        for run in external_course_runs[:2]:
+            course = CourseFactory.create(
+                title=run["program_name"],
+                platform=platform,
+                external_course_id=run["course_code"],
+                page=None,
+                is_external=True,
+            )
+            course_run = CourseRunFactory.create(
+                course=course,
+                external_course_run_id=run["course_run_code"],
+                enrollment_start=None,
+                enrollment_end=None,
+                expiration_date=None,
+                force_insert=True,
+            )
+            product = ProductFactory.create(content_object=course_run)
+            ProductVersionFactory.create(product=product, price=run["list_price"])
+
+    external_course_runs.append(external_expired_course_data)
+    external_course_runs.append(external_course_with_bad_data)
+    external_course_runs.append(external_course_data_with_null_price)
+    keymap = get_keymap(external_course_data["course_run_code"])
+
+    stats = bulk_update_external_course_runs(
+        external_course_runs, keymap=keymap
+    ).get_unformatted_stats()
+
+    assert Course.objects.filter(platform=platform).count() == 4
+    assert len(stats["courses_created"]) == (2 if create_existing_data else 4)
+    assert len(stats["course_runs_created"]) == (3 if create_existing_data else 5)
+    assert len(stats["course_runs_updated"]) == (2 if create_existing_data else 0)
+    assert len(stats["course_runs_skipped"]) == 1
+    assert len(stats["course_runs_with_invalid_dates"]) == 1
+    assert len(stats["course_runs_without_prices"]) == 1
+    assert len(stats["products_created"]) == (2 if create_existing_data else 4)
+    assert len(stats["product_versions_created"]) == (2 if create_existing_data else 4)
+    assert mock_sync_hubspot_product.call_count == (2 if create_existing_data else 4)
+    for external_course_run in external_course_runs[:4]:
+        course_run = CourseRun.objects.get(
+            course__platform=platform,
+            external_course_run_id=external_course_run["course_run_code"],
+        )
+        assert course_run.current_price == external_course_run["list_price"]
+        assert course_run.products.get().is_sellable is False
+        assert hasattr(course_run.course, "externalcoursepage")
+
+    mock_sync_hubspot_product.reset_mock()
+    stats = bulk_update_external_course_runs(
+        external_course_runs, keymap=keymap
+    ).get_unformatted_stats()
+
+    assert len(stats["courses_created"]) == 0
+    assert len(stats["course_runs_created"]) == 0
+    assert len(stats["course_runs_updated"]) == 0
+    assert len(stats["product_versions_created"]) == 0
+    mock_sync_hubspot_product.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "external_course_data",
+    [{"platform": EMERITUS_PLATFORM_NAME}, {"platform": GLOBAL_ALUMNI_PLATFORM_NAME}],
+    indirect=True,
+)
+@pytest.mark.django_db
+def test_bulk_update_external_course_runs_invalid_course(mocker, external_course_data):
+    """
+    Tests that `bulk_update_external_course_runs` skips the rows of a new course which fails validation,
+    and still syncs the other rows
+    """
+    mocker.patch(
+        "courses.sync_external_courses.external_course_sync_api.sync_hubspot_product"
+    )
+    keymap = get_keymap(external_course_data["course_run_code"])
+    platform = PlatformFactory.create(
+        name=get_platform(external_course_data["course_run_code"])
+    )
+    home_page = HomePageFactory.create(title="Home Page", subhead="<p>subhead</p>")
+    CourseIndexPageFactory.create(parent=home_page, title="Courses")
+    with Path(
+        "courses/sync_external_courses/test_data/batch_test.json"
+    ).open() as test_data_file:
+        other_course_data = json.load(test_data_file)["rows"][1]
+    # A course on another platform already uses the readable id of the first course
+    CourseFactory.create(
+        readable_id=ExternalCourse(
+            external_course_data, keymap=keymap
+        ).course_readable_id,
+        page=None,
+    )
+
+    stats = bulk_update_external_course_runs(
+        [external_course_data, other_course_data], keymap=keymap
+    ).get_unformatted_stats()
+
+    assert {item.code for item in stats["course_runs_skipped"]} == {
+        external_course_data["course_run_code"]
+    }
+    assert not Course.objects.filter(
+        platform=platform, external_course_id=external_course_data["course_code"]
+    ).exists()
+    assert CourseRun.objects.filter(
+        course__platform=platform,
+        course__external_course_id=other_course_data["course_code"],
+        external_course_run_id=other_course_data["course_run_code"],
+    ).exists()
+
+
+@pytest.mark.parametrize(
+    "external_course_data",
+    [{"platform": EMERITUS_PLATFORM_NAME}, {"platform": GLOBAL_ALUMNI_PLATFORM_NAME}],
+    indirect=True,
+)
+@pytest.mark.django_db
+def test_bulk_update_external_course_runs_same_run_code(mocker, external_course_data):
+    """
+    Tests that `bulk_update_external_course_runs` keeps the runs of different courses apart when they
+    share an External course run code
+    """
+    mocker.patch(
+        "courses.sync_external_courses.external_course_sync_api.sync_hubspot_product"
+    )
+    platform = PlatformFactory.create(
+        name=get_platform(external_course_data["course_run_code"])
+    )
+    home_page = HomePageFactory.create(title="Home Page", subhead="<p>subhead</p>")
+    CourseIndexPageFactory.create(parent=home_page, title="Courses")
+    with Path(
+        "courses/sync_external_courses/test_data/batch_test.json"
+    ).open() as test_data_file:
+        other_course_data = json.load(test_data_file)["rows"][1]
+    other_course_data["course_run_code"] = external_course_data["course_run_code"]
+    other_course_data["start_date"] = external_course_data["start_date"]
+    other_course_data["end_date"] = external_course_data["end_date"]
+    other_course_data["list_price"] = external_course_data["list_price"] + 100
+
+    bulk_update_external_course_runs(
+        [external_course_data, other_course_data],
+        keymap=get_keymap(external_course_data["course_run_code"]),
+    )
+
+    for course_data in [external_course_data, other_course_data]:
+        course_run = CourseRun.objects.get(
+            course__platform=platform,
+            course__external_course_id=course_data["course_code"],
+            external_course_run_id=course_data["course_run_code"],
+        )
+        assert course_run.current_price == course_data["list_price"]
+
+
+@pytest.mark.parametrize(
+    "external_course_data",
+    [{"platform": EMERITUS_PLATFORM_NAME}, {"platform": GLOBAL_ALUMNI_PLATFORM_NAME}],
+    indirect=True,
+)
+@pytest.mark.django_db
+def test_bulk_update_external_course_runs_future_run_coupons(
+    mocker, external_course_data
+):
+    """
+    Tests that `bulk_update_external_course_runs` makes the coupons for future runs of a course eligible
+    for the products it creates for new runs of the course
+    """
+    mocker.patch(
+        "courses.sync_external_courses.external_course_sync_api.sync_hubspot_product"
+    )
+    platform = PlatformFactory.create(
+        name=get_platform(external_course_data["course_run_code"])
+    )
+    home_page = HomePageFactory.create(title="Home Page", subhead="<p>subhead</p>")
+    CourseIndexPageFactory.create(parent=home_page, title="Courses")
+    course = CourseFactory.create(
+        platform=platform,
+        external_course_id=external_course_data["course_code"],
+        page=None,
+        is_external=True,
+    )
+    existing_run = CourseRunFactory.create(course=course)
+    future_runs_coupon = CouponEligibilityFactory.create(
+        product=ProductFactory.create(content_object=existing_run),
+        coupon__include_future_runs=True,
+    ).coupon
+    CouponEligibilityFactory.create(
+        product=existing_run.products.get(), coupon__include_future_runs=False
+    )
+
+    bulk_update_external_course_runs(
+        [external_course_data],
+        keymap=get_keymap(external_course_data["course_run_code"]),
+    )
+
+    new_run = CourseRun.objects.get(
+        course=course, external_course_run_id=external_course_data["course_run_code"]
+    )
+    assert list(
+        CouponEligibility.objects.filter(
+            product__in=new_run.products.all()
+        ).values_list("coupon", flat=True)
+    ) == [future_runs_coupon.id]
+
+
+@pytest.mark.parametrize(
+    "external_course_data",
+    [{"platform": EMERITUS_PLATFORM_NAME}, {"platform": GLOBAL_ALUMNI_PLATFORM_NAME}],
+    indirect=True,
+)
+@pytest.mark.django_db
+def test_sync_external_course_pages_skips_unchanged(mocker, external_course_data):
+    """
+    Tests that `sync_external_course_pages` stores the External course data fingerprint on the page,
+    and skips the page sync until the data or the page's child pages change
+    """
+    home_page = HomePageFactory.create(title="Home Page", subhead="<p>subhead</p>")
+    course_index_page = CourseIndexPageFactory.create(parent=home_page, title="Courses")
+    course = CourseFactory.create(is_external=True, page=None)
+    keymap = get_keymap(external_course_data["course_run_code"])
+    external_course = ExternalCourse(external_course_data, keymap=keymap)
+    create_page_spy = mocker.spy(
+        external_course_sync_api, "create_or_update_external_course_page"
+    )
+
+    stats_collector = StatsCollector()
+    sync_external_course_pages(
+        course_index_page, course, external_course, keymap, stats_collector
+    )
+    course_page = course.externalcoursepage
+    course_page.refresh_from_db()
+    assert course_page.external_content_hash == get_external_course_page_sync_hash(
+        course_page, external_course
+    )
+    assert create_page_spy.call_count == 1
+    revision_count = course_page.revisions.count()
+
+    sync_external_course_pages(
+        course_index_page, course, external_course, keymap, stats_collector
+    )
+    assert create_page_spy.call_count == 1
+    assert course_page.revisions.count() == revision_count
+    assert len(stats_collector.get_unformatted_stats()["course_pages_unchanged"]) == 1
+
+    course_page.get_child_page_of_type_including_draft(CourseOverviewPage).delete()
+    sync_external_course_pages(
+        course_index_page, course, external_course, keymap, stats_collector
+    )
+    assert create_page_spy.call_count == 2
+    assert course_page.get_children().type(CourseOverviewPage).exists()
+
+    external_course_data["total_weeks"] = 20
+    changed_external_course = ExternalCourse(external_course_data, keymap=keymap)
+    assert (
+        changed_external_course.page_content_hash != external_course.page_content_hash
+    )
+    sync_external_course_pages(
+        course_index_page, course, changed_external_course, keymap, stats_collector
+    )
+    assert create_page_spy.call_count == 3
+    course_page.refresh_from_db()
+    assert course_page.external_content_hash == get_external_course_page_sync_hash(
+        course_page, changed_external_course
+    )
+
+
 @pytest.mark.parametrize(
     "external_course_vendor_keymap", [EmeritusKeyMap, GlobalAlumniKeyMap]
 )
@@ -717,7 +1022,7 @@ def test_fetch_external_courses_success(
         2. Make a post request for the `Batch` report.
         3. If the results are not ready, wait for the job to complete and make a get request to check the status.
         4. If the results are ready after the post request, return the results.
-        5. If job status is 1 or 2, it is in progress. Wait for 2 seconds and make a get request for Job status.
+        5. If job status is 1 or 2, it is in progress. Wait, backing off exponentially, and make a get request for Job status.
         6. If job status is 3, the results are ready, make a get request to collect the results and return the data.
     """
     settings.EXTERNAL_COURSE_SYNC_API_BASE_URL = (
@@ -726,6 +1031,9 @@ def test_fetch_external_courses_success(
     settings.EXTERNAL_COURSE_SYNC_API_KEY = "test_EXTERNAL_COURSE_SYNC_API_KEY"
     settings.EXTERNAL_COURSE_SYNC_API_REQUEST_TIMEOUT = 60
 
+    mock_sleep = mocker.patch(
+        "courses.sync_external_courses.external_course_sync_api.time.sleep"
+    )
     mock_get = mocker.patch(
         "courses.sync_external_courses.external_course_sync_api_client.requests.get"
     )
@@ -768,6 +1076,8 @@ def test_fetch_external_courses_success(
         timeout=60,
     )
     assert actual_course_runs == external_course_runs["rows"]
+    # The job status is checked again with an exponential backoff
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [2, 4]
 
 
 @pytest.mark.parametrize(
@@ -783,6 +1093,9 @@ def test_fetch_external_courses_error(
         "https://test_external_course_sync_api.com"
     )
     settings.EXTERNAL_COURSE_SYNC_API_KEY = "test_EXTERNAL_COURSE_SYNC_API_KEY"
+    mock_sleep = mocker.patch(
+        "courses.sync_external_courses.external_course_sync_api.time.sleep"
+    )
     mock_get = mocker.patch(
         "courses.sync_external_courses.external_course_sync_api_client.requests.get"
     )
@@ -805,6 +1118,7 @@ def test_fetch_external_courses_error(
     with caplog.at_level(logging.ERROR):
         fetch_external_courses(keymap=keymap)
     assert "Job failed!" in caplog.text
+    assert mock_sleep.call_count == 2
     assert "Something unexpected happened!" in caplog.text
 
 
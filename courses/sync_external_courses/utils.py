@@ -138,6 +138,11 @@ class StatsCollector:
                 "External Course Codes",
                 display_name="Course Pages Updated but set as Draft",
             ),
+            "course_pages_unchanged": StatItemsCollection(
+                "course_pages_unchanged",
+                "External Course Codes",
+                display_name="Course Pages Skipped as Unchanged",
+            ),
             "products_created": StatItemsCollection(
                 "products_created",
                 "Course Run courseware_ids",
@@ -12,10 +12,18 @@ from requests.exceptions import HTTPError
 from courses.models import CourseRun, CourseRunCertificate, Platform
 from courses.sync_external_courses.external_course_sync_api import (
     EXTERNAL_COURSE_VENDOR_KEYMAPS,
-    fetch_external_courses,
+    bulk_update_external_course_runs,
+    get_external_course_job_poll_delay,
+    get_external_course_job_result,
+    get_external_course_query_rows,
+    request_external_course_report,
     update_external_course_runs,
 )
+from courses.sync_external_courses.external_course_sync_api_client import (
+    ExternalCourseSyncAPIClient,
+)
 from courses.utils import (
+    batch_program_certificate_generation,
     ensure_course_run_grade,
     process_course_run_grade_certificate,
     sync_course_runs,
@@ -62,26 +70,28 @@ def generate_course_certificates():
             0,
             0,
         )
-        for edx_grade, user in edx_grade_user_iter:
-            course_run_grade, created, updated = ensure_course_run_grade(
-                user=user, course_run=run, edx_grade=edx_grade, should_update=True
-            )
-
-            if created:
-                created_grades_count += 1
-            elif updated:
-                updated_grades_count += 1
+        # Evaluate the program certificates for all of the run's new certificates together
+        with batch_program_certificate_generation():
+            for edx_grade, user in edx_grade_user_iter:
+                course_run_grade, created, updated = ensure_course_run_grade(
+                    user=user, course_run=run, edx_grade=edx_grade, should_update=True
+                )
 
-            _, created, deleted = process_course_run_grade_certificate(
-                course_run_grade=course_run_grade
-            )
+                if created:
+                    created_grades_count += 1
+                elif updated:
+                    updated_grades_count += 1
 
-            if deleted:
-                log.warning(
-                    "Certificate deleted for user %s and course_run %s", user, run
+                _, created, deleted = process_course_run_grade_certificate(
+                    course_run_grade=course_run_grade
                 )
-            elif created:
-                generated_certificates_count += 1
+
+                if deleted:
+                    log.warning(
+                        "Certificate deleted for user %s and course_run %s", user, run
+                    )
+                elif created:
+                    generated_certificates_count += 1
 
         log.info(
             "Finished processing course run %s: created grades for %d users, "
@@ -125,7 +135,7 @@ def sync_courseruns_data():
 
 @app.task
 def task_sync_external_course_runs():
-    """Task to sync external course runs"""
+    """Task to sync external course runs, with one task per platform so that the platforms are synced concurrently"""
     platforms = Platform.objects.filter(enable_sync=True)
     for platform in platforms:
         keymap = EXTERNAL_COURSE_VENDOR_KEYMAPS.get(platform.name.lower())
@@ -135,14 +145,92 @@ def task_sync_external_course_runs():
                 platform.name,
             )
             continue
-        try:
-            keymap = keymap()
-            external_course_runs = fetch_external_courses(keymap)
-            stats_collector = update_external_course_runs(external_course_runs, keymap)
-            email_stats = stats_collector.get_email_stats()
-            send_external_data_sync_email(
-                vendor_name=platform.name.lower(),
-                stats=email_stats,
+        task_sync_external_course_runs_for_platform.delay(platform.id)
+
+
+def _update_external_course_runs_for_platform(platform, keymap, query_response):
+    """
+    Updates the external course runs of a platform from a report query response and emails the stats
+
+    Args:
+        platform(Platform): The platform that was synced
+        keymap(ExternalCourseVendorBaseKeyMap): An ExternalCourseVendorBaseKeyMap object
+        query_response(dict): The query response with the report results
+    """
+    external_course_runs = get_external_course_query_rows(query_response)
+    if external_course_runs is None:
+        return
+    update_func = (
+        bulk_update_external_course_runs
+        if settings.EXTERNAL_COURSE_SYNC_BULK_MODE
+        else update_external_course_runs
+    )
+    stats_collector = update_func(external_course_runs, keymap)
+    email_stats = stats_collector.get_email_stats()
+    send_external_data_sync_email(
+        vendor_name=platform.name.lower(),
+        stats=email_stats,
+    )
+
+
+@app.task
+def task_sync_external_course_runs_for_platform(platform_id):
+    """
+    Task to request the external course report of a platform. If the report isn't ready yet, the report
+    job is polled by a separately scheduled task, so that no worker is tied up while waiting.
+    """
+    platform = Platform.objects.get(id=platform_id)
+    try:
+        keymap = EXTERNAL_COURSE_VENDOR_KEYMAPS[platform.name.lower()]()
+        query_response = request_external_course_report(
+            keymap, ExternalCourseSyncAPIClient()
+        )
+        if query_response is None:
+            log.error("No report found for platform %s", platform.name)
+            return
+        if "job" in query_response:
+            job_id = query_response["job"]["id"]
+            log.info("Job id: %s found for platform %s", job_id, platform.name)
+            task_poll_external_course_sync_job.apply_async(
+                args=[platform_id, job_id],
+                countdown=get_external_course_job_poll_delay(0),
             )
-        except Exception:
-            log.exception("Some error occurred")
+            return
+        _update_external_course_runs_for_platform(platform, keymap, query_response)
+    except Exception:
+        log.exception("Some error occurred")
+
+
+@app.task
+def task_poll_external_course_sync_job(platform_id, job_id, attempt=0):
+    """
+    Task to check an external course report job once, and sync the platform's course runs if the job is
+    finished. Otherwise the task schedules itself again, backing off exponentially.
+    """
+    platform = Platform.objects.get(id=platform_id)
+    try:
+        keymap = EXTERNAL_COURSE_VENDOR_KEYMAPS[platform.name.lower()]()
+        is_finished, query_response = get_external_course_job_result(
+            ExternalCourseSyncAPIClient(), job_id
+        )
+        if is_finished:
+            _update_external_course_runs_for_platform(platform, keymap, query_response)
+            return
+        attempt += 1
+        if attempt >= settings.EXTERNAL_COURSE_SYNC_JOB_POLL_MAX_ATTEMPTS:
+            log.error(
+                "Job %s for platform %s did not complete after %d checks",
+                job_id,
+                platform.name,
+                attempt,
+            )
+            return
+        delay = get_external_course_job_poll_delay(attempt)
+        log.info(
+            "Job %s not yet complete... checking again in %d seconds", job_id, delay
+        )
+        task_poll_external_course_sync_job.apply_async(
+            args=[platform_id, job_id, attempt], countdown=delay
+        )
+    except Exception:
+        log.exception("Some error occurred")
@@ -14,7 +14,9 @@ from courses.sync_external_courses.external_course_sync_api import (
 )
 from courses.tasks import (
     sync_courseruns_data,
+    task_poll_external_course_sync_job,
     task_sync_external_course_runs,
+    task_sync_external_course_runs_for_platform,
     generate_course_certificates,
 )
 
@@ -38,19 +40,17 @@ def test_sync_courseruns_data(mocker):
 
 def test_task_sync_external_course_runs(mocker, settings):
     """Test task_sync_external_course_runs to call APIs for supported platforms and skip unsupported ones in EXTERNAL_COURSE_VENDOR_KEYMAPS"""
-    mock_fetch_external_courses = mocker.patch("courses.tasks.fetch_external_courses")
-    mock_update_external_course_runs = mocker.patch(
-        "courses.tasks.update_external_course_runs"
+    mock_platform_task = mocker.patch(
+        "courses.tasks.task_sync_external_course_runs_for_platform"
     )
     mock_log = mocker.patch("courses.tasks.log")
 
-    PlatformFactory.create(name=EMERITUS_PLATFORM_NAME, enable_sync=True)
+    platform = PlatformFactory.create(name=EMERITUS_PLATFORM_NAME, enable_sync=True)
     PlatformFactory.create(name="UnknownPlatform", enable_sync=True)
 
     task_sync_external_course_runs.delay()
 
-    mock_fetch_external_courses.assert_called_once()
-    mock_update_external_course_runs.assert_called_once()
+    mock_platform_task.delay.assert_called_once_with(platform.id)
 
     mock_log.exception.assert_called_once_with(
         "The platform '%s' does not have a sync API configured. Please disable the 'enable_sync' setting for this platform.",
@@ -58,6 +58,85 @@ def test_task_sync_external_course_runs(mocker, settings):
     )
 
 
+@pytest.mark.parametrize("is_bulk_mode", [True, False])
+def test_task_sync_external_course_runs_for_platform(mocker, settings, is_bulk_mode):
+    """Test that the platform sync task updates the course runs right away when the report results are ready"""
+    settings.EXTERNAL_COURSE_SYNC_BULK_MODE = is_bulk_mode
+    rows = [{"course_run_code": "MO-DBIP.ELE-99-07#1"}]
+    mocker.patch(
+        "courses.tasks.request_external_course_report",
+        return_value={"query_result": {"data": {"rows": rows}}},
+    )
+    mock_update = mocker.patch("courses.tasks.update_external_course_runs")
+    mock_bulk_update = mocker.patch("courses.tasks.bulk_update_external_course_runs")
+    mock_send_email = mocker.patch("courses.tasks.send_external_data_sync_email")
+    mock_poll_task = mocker.patch("courses.tasks.task_poll_external_course_sync_job")
+    platform = PlatformFactory.create(name=EMERITUS_PLATFORM_NAME, enable_sync=True)
+
+    task_sync_external_course_runs_for_platform.delay(platform.id)
+
+    called_update, not_called_update = (
+        (mock_bulk_update, mock_update)
+        if is_bulk_mode
+        else (mock_update, mock_bulk_update)
+    )
+    called_update.assert_called_once()
+    assert called_update.call_args[0][0] == rows
+    not_called_update.assert_not_called()
+    mock_send_email.assert_called_once()
+    mock_poll_task.apply_async.assert_not_called()
+
+
+def test_task_sync_external_course_runs_for_platform_job(mocker, settings):
+    """Test that the platform sync task polls the report job with backoff, and updates the course runs when it's ready"""
+    settings.EXTERNAL_COURSE_SYNC_JOB_POLL_INITIAL_DELAY = 2
+    settings.EXTERNAL_COURSE_SYNC_JOB_POLL_MAX_DELAY = 60
+    rows = [{"course_run_code": "MO-DBIP.ELE-99-07#1"}]
+    mocker.patch(
+        "courses.tasks.request_external_course_report",
+        return_value={"job": {"id": 1}},
+    )
+    mocker.patch(
+        "courses.tasks.get_external_course_job_result",
+        side_effect=[
+            (False, None),
+            (False, None),
+            (True, {"query_result": {"data": {"rows": rows}}}),
+        ],
+    )
+    mock_apply_async = mocker.spy(task_poll_external_course_sync_job, "apply_async")
+    mock_update = mocker.patch("courses.tasks.update_external_course_runs")
+    mocker.patch("courses.tasks.send_external_data_sync_email")
+    platform = PlatformFactory.create(name=EMERITUS_PLATFORM_NAME, enable_sync=True)
+
+    task_sync_external_course_runs_for_platform.delay(platform.id)
+
+    assert [call.kwargs["countdown"] for call in mock_apply_async.call_args_list] == [
+        2,
+        4,
+        8,
+    ]
+    mock_update.assert_called_once()
+    assert mock_update.call_args[0][0] == rows
+
+
+def test_task_poll_external_course_sync_job_gives_up(mocker, settings):
+    """Test that the job polling task stops after the maximum number of checks"""
+    settings.EXTERNAL_COURSE_SYNC_JOB_POLL_MAX_ATTEMPTS = 3
+    mock_job_result = mocker.patch(
+        "courses.tasks.get_external_course_job_result", return_value=(False, None)
+    )
+    mock_update = mocker.patch("courses.tasks.update_external_course_runs")
+    mock_log = mocker.patch("courses.tasks.log")
+    platform = PlatformFactory.create(name=EMERITUS_PLATFORM_NAME, enable_sync=True)
+
+    task_poll_external_course_sync_job.delay(platform.id, 1)
+
+    assert mock_job_result.call_count == 3
+    mock_update.assert_not_called()
+    mock_log.error.assert_called_once()
+
+
 @pytest.mark.parametrize("has_cert_page", [True, False])
 def test_task_generate_course_certificates(mocker, has_cert_page):
     """Test generate_course_certificates calls the right API functionality making sure external courses are filtered out."""
@@ -3,19 +3,27 @@ Utilities for courses/certificates
 """
 
 import logging
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 
 from django.conf import settings
 from django.db import transaction
 from django.db.models import Q
 import re
 from requests.exceptions import HTTPError
+from wagtail.models import Page
 
+from cms.certificate_cache import invalidate_certificate_pages
+from courses.catalog_cache import bump_catalog_version
 from courses.constants import (
     COURSE_KEY_PATTERN,
     PROGRAM_RUN_ID_PATTERN,
     PROGRAM_TEXT_ID_PREFIX,
 )
 from courses.models import (
+    Course,
     CourseRun,
     CourseRunCertificate,
     CourseRunGrade,
@@ -29,6 +37,19 @@ from mitxpro.utils import has_equal_properties, now_in_utc
 
 log = logging.getLogger(__name__)
 
+# Holds the (user id, program id) pairs whose program certificates are evaluated together,
+# see batch_program_certificate_generation
+_program_certificate_batch = threading.local()
+
+# Open edX course list API fields, and the CourseRun fields they are synced to
+COURSE_RUN_SYNC_FIELD_MAPPING = {
+    "name": "title",
+    "start": "start_date",
+    "end": "end_date",
+    "enrollment_start": "enrollment_start",
+    "enrollment_end": "enrollment_end",
+}
+
 
 def ensure_course_run_grade(user, course_run, edx_grade, should_update=False):  # noqa: FBT002
     """
@@ -161,6 +182,186 @@ def generate_program_certificate(user, program):
     return program_cert, True
 
 
+def get_program_certificate_page_revision_ids(program_ids):
+    """
+    Returns the latest revision of each program's certificate page, as ProgramCertificate.save() sets it
+
+    Args:
+        program_ids (iterable of int): Program ids
+
+    Returns:
+        dict: Revision ids keyed by program id, for the programs with a live certificate page
+    """
+    from cms.models import CertificatePage
+
+    program_ids = set(program_ids)
+    if not program_ids:
+        return {}
+    # Like Program.page, prefer the ProgramPage over the ExternalProgramPage
+    page_paths = {}
+    for path, program_id, external_program_id in Page.objects.filter(
+        Q(programpage__program_id__in=program_ids)
+        | Q(externalprogrampage__program_id__in=program_ids)
+    ).values_list("path", "programpage__program_id", "externalprogrampage__program_id"):
+        if program_id is not None:
+            page_paths[program_id] = path
+        else:
+            page_paths.setdefault(external_program_id, path)
+    if not page_paths:
+        return {}
+    program_ids_by_path = {path: program_id for program_id, path in page_paths.items()}
+
+    child_conditions = Q()
+    for path in page_paths.values():
+        child_conditions |= Q(
+            path__startswith=path, depth=len(path) // Page.steplen + 1
+        )
+    revision_ids = {}
+    # Like ProductPage.certificate_page, use the first live certificate page, so it's iterated last
+    for path, revision_id in (
+        CertificatePage.objects.live()
+        .filter(child_conditions)
+        .order_by("-path")
+        .values_list("path", "latest_revision_id")
+    ):
+        revision_ids[program_ids_by_path[path[: -Page.steplen]]] = revision_id
+    return revision_ids
+
+
+def generate_program_certificates(user_program_pairs):
+    """
+    Batched version of generate_program_certificate. Creates the program certificates (and program
+    enrollments) for all of the given users who have a course certificate for each course in the
+    program, using a fixed number of queries regardless of the number of pairs.
+
+    Args:
+        user_program_pairs (iterable of (int, int)): (user id, program id) pairs to evaluate
+
+    Returns:
+        set of (int, int): The (user id, program id) pairs for which a program certificate was created
+    """
+    from courses.api import invalidate_user_enrollments_cache
+
+    user_program_pairs = set(user_program_pairs)
+    if not user_program_pairs:
+        return set()
+    user_ids = {user_id for user_id, _ in user_program_pairs}
+    program_ids = {program_id for _, program_id in user_program_pairs}
+
+    course_ids_by_program = defaultdict(set)
+    for program_id, course_id in Course.objects.filter(
+        program_id__in=program_ids
+    ).values_list("program_id", "id"):
+        course_ids_by_program[program_id].add(course_id)
+    certified_course_ids_by_user = defaultdict(set)
+    for user_id, course_id in CourseRunCertificate.objects.filter(
+        user_id__in=user_ids, course_run__course__program_id__in=program_ids
+    ).values_list("user_id", "course_run__course_id"):
+        certified_course_ids_by_user[user_id].add(course_id)
+    existing_cert_pairs, revoked_cert_pairs = set(), set()
+    for user_id, program_id, is_revoked in ProgramCertificate.all_objects.filter(
+        user_id__in=user_ids, program_id__in=program_ids
+    ).values_list("user_id", "program_id", "is_revoked"):
+        (revoked_cert_pairs if is_revoked else existing_cert_pairs).add(
+            (user_id, program_id)
+        )
+
+    completed_pairs = {
+        (user_id, program_id)
+        for user_id, program_id in user_program_pairs
+        if course_ids_by_program[program_id]
+        and course_ids_by_program[program_id] <= certified_course_ids_by_user[user_id]
+    }
+    # As in generate_program_certificate, users with an unrevoked certificate get an enrollment too,
+    # and revoked certificates are left alone
+    completed_pairs -= revoked_cert_pairs
+    enrollment_pairs = completed_pairs | (user_program_pairs & existing_cert_pairs)
+    created_cert_pairs = completed_pairs - existing_cert_pairs
+    revision_ids = get_program_certificate_page_revision_ids(
+        {program_id for _, program_id in created_cert_pairs}
+    )
+    ProgramCertificate.objects.bulk_create(
+        [
+            ProgramCertificate(
+                user_id=user_id,
+                program_id=program_id,
+                certificate_page_revision_id=revision_ids.get(program_id),
+            )
+            for user_id, program_id in created_cert_pairs
+        ],
+        ignore_conflicts=True,
+    )
+
+    existing_enrollment_pairs = set(
+        ProgramEnrollment.objects.filter(
+            user_id__in=user_ids, program_id__in=program_ids
+        ).values_list("user_id", "program_id")
+    )
+    created_enrollment_pairs = enrollment_pairs - existing_enrollment_pairs
+    ProgramEnrollment.objects.bulk_create(
+        [
+            ProgramEnrollment(
+                user_id=user_id, program_id=program_id, active=True, change_status=None
+            )
+            for user_id, program_id in created_enrollment_pairs
+        ]
+    )
+
+    # Bulk inserts don't send model signals, so do the work of the relevant handlers here
+    for user_id in {
+        user_id for user_id, _ in created_cert_pairs | created_enrollment_pairs
+    }:
+        invalidate_user_enrollments_cache(user_id)
+    log.info(
+        "Evaluated %d program certificates: created %d program certificates and %d program enrollments",
+        len(user_program_pairs),
+        len(created_cert_pairs),
+        len(created_enrollment_pairs),
+    )
+    return created_cert_pairs
+
+
+@contextmanager
+def batch_program_certificate_generation():
+    """
+    Context manager which defers the program certificate generation for the course run certificates
+    created inside it, and evaluates all of them with generate_program_certificates when it exits,
+    rather than once per course run certificate.
+    """
+    if getattr(_program_certificate_batch, "pairs", None) is not None:
+        # Already batching, the outermost context will evaluate the pairs
+        yield
+        return
+    _program_certificate_batch.pairs = set()
+    try:
+        yield
+    finally:
+        user_program_pairs = _program_certificate_batch.pairs
+        _program_certificate_batch.pairs = None
+        if user_program_pairs:
+            transaction.on_commit(
+                lambda: generate_program_certificates(user_program_pairs)
+            )
+
+
+def defer_program_certificate_generation(user_id, program_id):
+    """
+    Adds a (user, program) pair to the current program certificate batch, if there is one
+
+    Args:
+        user_id (int): A user id
+        program_id (int): A program id
+
+    Returns:
+        bool: True if the pair was added to a batch, False if no batch is active
+    """
+    user_program_pairs = getattr(_program_certificate_batch, "pairs", None)
+    if user_program_pairs is None:
+        return False
+    user_program_pairs.add((user_id, program_id))
+    return True
+
+
 def get_or_create_program_enrollment(user, program):
     """
     Get or create new program enrollment.
@@ -214,9 +415,14 @@ def revoke_program_certificate(
 
     if include_program_courses:
         courses_in_program_ids = set(program.courses.values_list("id", flat=True))
-        CourseRunCertificate.all_objects.filter(
+        course_run_certificates = CourseRunCertificate.all_objects.filter(
             user=user, course_run__course_id__in=courses_in_program_ids
-        ).update(is_revoked=revoke_state)
+        )
+        # The update doesn't send model signals, so clear the cached certificate pages here
+        invalidate_certificate_pages(
+            course_run_certificates.values_list("uuid", flat=True)
+        )
+        course_run_certificates.update(is_revoked=revoke_state)
 
         log.info(
             "Course certificates associated with that program: [%s] are also updated",
@@ -254,9 +460,59 @@ def revoke_course_run_certificate(user, courseware_id, revoke_state):
     return True
 
 
-def sync_course_runs(runs):
+def _fetch_course_details(api_client, course_keys):
     """
-    Sync course run dates and title from Open edX using course list API
+    Fetches the course details for some course keys from the Open edX course list API
+
+    Args:
+        api_client (CourseList): edx api course list client instance
+        course_keys ([str]): The course keys to fetch
+
+    Returns:
+        list: The course details, one per course that was found
+    """
+    return list(
+        api_client.get_courses(
+            course_keys=course_keys,
+            username=settings.OPENEDX_SERVICE_WORKER_USERNAME,
+        )
+    )
+
+
+def _apply_course_detail_changes(run, course_detail):
+    """
+    Sets the values from the Open edX course details on a course run, if they differ
+
+    Args:
+        run (CourseRun): The course run to update
+        course_detail (CourseDetail): The course details from the Open edX course list API
+
+    Returns:
+        [str]: The synced course run fields that changed
+    """
+    changed_fields = []
+    for api_field, model_field in COURSE_RUN_SYNC_FIELD_MAPPING.items():
+        api_value = getattr(course_detail, api_field)
+        model_value = getattr(run, model_field)
+
+        if api_value != model_value:
+            changed_fields.append(model_field)
+            setattr(run, model_field, api_value)
+
+            # Reset the expiration_date so it is calculated automatically and
+            # does not raise a validation error now that the start or end date
+            # has changed.
+            if model_field in ("start_date", "end_date"):
+                run.expiration_date = None
+    return changed_fields
+
+
+def sync_course_runs(runs):  # noqa: C901
+    """
+    Sync course run dates and title from Open edX using course list API.
+
+    The course keys are requested in chunks, concurrently, and the values are compared in memory,
+    so that only the course runs which changed are written, with one bulk update per chunk.
 
     Args:
         runs ([CourseRun]): list of CourseRun objects.
@@ -265,19 +521,14 @@ def sync_course_runs(runs):
         (int, int, int): A tuple containing the number of successful updates,
         failed updates, and unchanged course runs.
     """
+    from ecommerce.api import update_sellability_for_objects
+
     api_client = get_edx_api_course_list_client()
 
     success_count = 0
     failure_count = 0
     unchanged_count = 0
-
-    field_mapping = {
-        "name": "title",
-        "start": "start_date",
-        "end": "end_date",
-        "enrollment_start": "enrollment_start",
-        "enrollment_end": "enrollment_end",
-    }
+    field_change_counts = Counter()
 
     runs_by_courseware_id = {}
     invalid_course_keys = []
@@ -296,69 +547,105 @@ def sync_course_runs(runs):
         return 0, len(runs), 0
 
     valid_course_keys = list(runs_by_courseware_id.keys())
-
-    try:
-        received_course_ids = set()
-        for course_detail in api_client.get_courses(
-            course_keys=valid_course_keys,
-            username=settings.OPENEDX_SERVICE_WORKER_USERNAME,
-        ):
-            received_course_ids.add(course_detail.course_id)
-
-            if course_detail.course_id not in runs_by_courseware_id:
-                log.warning(
-                    "Course detail received for unrequested course: %s",
-                    course_detail.course_id,
-                )
+    chunk_size = settings.OPENEDX_COURSE_LIST_SYNC_CHUNK_SIZE
+    course_key_chunks = [
+        valid_course_keys[index : index + chunk_size]
+        for index in range(0, len(valid_course_keys), chunk_size)
+    ]
+
+    received_course_ids = set()
+    updated_run_ids = []
+    with ThreadPoolExecutor(
+        max_workers=settings.OPENEDX_COURSE_LIST_MAX_CONCURRENT_REQUESTS
+    ) as executor:
+        future_chunk_map = {
+            executor.submit(_fetch_course_details, api_client, course_keys): course_keys
+            for course_keys in course_key_chunks
+        }
+        # The API requests run in the worker threads, the database writes stay in this one
+        for future in as_completed(future_chunk_map):
+            course_keys = future_chunk_map[future]
+            try:
+                course_details = future.result()
+            except HTTPError as e:
+                failure_count += len(course_keys)
+                log.error("Bulk sync failed with HTTP error: %s", str(e))
                 continue
-
-            run = runs_by_courseware_id[course_detail.course_id]
-
-            has_changes = False
-
-            for api_field, model_field in field_mapping.items():
-                api_value = getattr(course_detail, api_field)
-                model_value = getattr(run, model_field)
-
-                if api_value != model_value:
-                    has_changes = True
-                    setattr(run, model_field, api_value)
-
-                    # Reset the expiration_date so it is calculated automatically and
-                    # does not raise a validation error now that the start or end date
-                    # has changed.
-                    if model_field in ("start_date", "end_date"):
-                        run.expiration_date = None
-
-            if not has_changes:
-                log.info(
-                    "No changes detected for %s, skipping update", run.courseware_id
-                )
-                unchanged_count += 1
+            except Exception as e:  # noqa: BLE001
+                failure_count += len(course_keys)
+                log.error("Bulk sync failed with unexpected error: %s", str(e))
                 continue
 
+            now = now_in_utc()
+            changed_runs = []
+            changed_fields = set()
+            run_field_changes = []
+            for course_detail in course_details:
+                received_course_ids.add(course_detail.course_id)
+
+                if course_detail.course_id not in runs_by_courseware_id:
+                    log.warning(
+                        "Course detail received for unrequested course: %s",
+                        course_detail.course_id,
+                    )
+                    continue
+
+                run = runs_by_courseware_id[course_detail.course_id]
+                run_changed_fields = _apply_course_detail_changes(run, course_detail)
+                if not run_changed_fields:
+                    log.info(
+                        "No changes detected for %s, skipping update", run.courseware_id
+                    )
+                    unchanged_count += 1
+                    continue
+
+                try:
+                    # Bulk updates skip CourseRun.save, so validate the dates here
+                    run.clean()
+                except Exception as e:  # noqa: BLE001
+                    # Report any validation or otherwise model errors
+                    log.error("%s: %s", str(e), run.courseware_id)
+                    failure_count += 1
+                    continue
+                run.updated_on = now
+                changed_runs.append(run)
+                changed_fields.update(run_changed_fields)
+                run_field_changes.extend(run_changed_fields)
+                if (
+                    "start_date" in run_changed_fields
+                    or "end_date" in run_changed_fields
+                ):
+                    changed_fields.add("expiration_date")
+
+            if not changed_runs:
+                continue
             try:
-                run.save()
-                success_count += 1
-                log.info("Updated course run: %s", run.courseware_id)
+                CourseRun.objects.bulk_update(
+                    changed_runs, [*sorted(changed_fields), "updated_on"]
+                )
             except Exception as e:  # noqa: BLE001
-                # Report any validation or otherwise model errors
-                log.error("%s: %s", str(e), run.courseware_id)
-                failure_count += 1
-
-        missing_course_ids = set(valid_course_keys) - received_course_ids
-        if missing_course_ids:
-            log.warning(
-                "No data received for requested courses: %s",
-                list(missing_course_ids),
-            )
+                log.error("%s: %s", str(e), [run.courseware_id for run in changed_runs])
+                failure_count += len(changed_runs)
+                continue
+            success_count += len(changed_runs)
+            field_change_counts.update(run_field_changes)
+            for run in changed_runs:
+                updated_run_ids.append(run.id)
+                log.info("Updated course run: %s", run.courseware_id)
+
+    missing_course_ids = set(valid_course_keys) - received_course_ids
+    if missing_course_ids:
+        log.warning(
+            "No data received for requested courses: %s",
+            list(missing_course_ids),
+        )
 
-    except HTTPError as e:
-        failure_count = len(runs_by_courseware_id)
-        log.error("Bulk sync failed with HTTP error: %s", str(e))
-    except Exception as e:  # noqa: BLE001
-        failure_count = len(runs_by_courseware_id)
-        log.error("Bulk sync failed with unexpected error: %s", str(e))
+    if updated_run_ids:
+        # Bulk updates don't send model signals, so do the work of the relevant handlers here
+        update_sellability_for_objects(course_run_ids=updated_run_ids)
+        bump_catalog_version()
+    for field, count in sorted(field_change_counts.items()):
+        log.info("Number of course runs with a changed %s: %d", field, count)
 
     return success_count, failure_count, unchanged_count
 
@@ -23,9 +23,10 @@ from courses.factories import (
     UserFactory,
     CourseLanguageFactory,
 )
-from courses.models import CourseRun, Program, ProgramCertificate
+from courses.models import CourseRun, Program, ProgramCertificate, ProgramEnrollment
 from courses.utils import (
     generate_program_certificate,
+    generate_program_certificates,
     get_courseware_object_from_text_id,
     process_course_run_grade_certificate,
     sync_course_runs,
@@ -224,6 +225,57 @@ def test_generate_program_certificate_success(user, program):
     assert len(ProgramCertificate.objects.all()) == 1
 
 
+def test_generate_program_certificates(program):
+    """
+    Test that generate_program_certificates creates the missing program certificates and enrollments
+    for the users who have a certificate for each course in the program, leaving revoked certificates alone
+    """
+    course_runs = [
+        CourseRunFactory.create(course=course)
+        for course in CourseFactory.create_batch(2, program=program)
+    ]
+    completed_user, partial_user, certified_user, revoked_user = (
+        UserFactory.create_batch(4)
+    )
+    for course_run in course_runs:
+        for user in [completed_user, certified_user, revoked_user]:
+            CourseRunCertificateFactory.create(user=user, course_run=course_run)
+    CourseRunCertificateFactory.create(user=partial_user, course_run=course_runs[0])
+    existing_certificate = ProgramCertificateFactory.create(
+        user=certified_user, program=program
+    )
+    ProgramCertificateFactory.create(
+        user=revoked_user, program=program, is_revoked=True
+    )
+    revision = program.page.certificate_page.save_revision()
+
+    created_pairs = generate_program_certificates(
+        {
+            (completed_user.id, program.id),
+            (partial_user.id, program.id),
+            (certified_user.id, program.id),
+            (revoked_user.id, program.id),
+        }
+    )
+
+    assert created_pairs == {(completed_user.id, program.id)}
+    assert set(
+        ProgramCertificate.objects.filter(program=program).values_list(
+            "user_id", flat=True
+        )
+    ) == {completed_user.id, certified_user.id}
+    assert ProgramCertificate.objects.get(user=certified_user) == existing_certificate
+    assert (
+        ProgramCertificate.objects.get(user=completed_user).certificate_page_revision
+        == revision
+    )
+    assert set(
+        ProgramEnrollment.objects.filter(program=program).values_list(
+            "user_id", flat=True
+        )
+    ) == {completed_user.id, certified_user.id}
+
+
 @pytest.mark.parametrize(
     "test_scenario, api_response, local_data, expected_success, expected_failure, expected_unchanged, api_error, save_error_index",
     [
@@ -385,6 +437,59 @@ def test_sync_course_runs(
                 assert matching_run.enrollment_end == END_DT
 
 
+def test_sync_course_runs_chunks(settings, mocker, create_course_runs):
+    """
+    Test that sync_course_runs requests the course keys in chunks and only writes the course runs
+    that changed, with one bulk update per chunk
+    """
+    settings.OPENEDX_SERVICE_WORKER_API_TOKEN = "mock_api_token"  # noqa: S105
+    settings.OPENEDX_COURSE_LIST_SYNC_CHUNK_SIZE = 2
+    course_runs = create_course_runs(
+        [
+            make_local_course("course-v1:edX+DemoX+2020_T1", "Old Course 1"),
+            make_local_course("course-v1:edX+DemoX+2020_T2", "Course 2"),
+            make_local_course("course-v1:edX+DemoX+2020_T3", "Old Course 3"),
+        ]
+    )
+    api_courses = {
+        "course-v1:edX+DemoX+2020_T1": make_api_course(
+            "course-v1:edX+DemoX+2020_T1", "Updated Course 1"
+        ),
+        "course-v1:edX+DemoX+2020_T2": make_api_course(
+            "course-v1:edX+DemoX+2020_T2", "Course 2"
+        ),
+        "course-v1:edX+DemoX+2020_T3": {
+            **make_api_course("course-v1:edX+DemoX+2020_T3", "Updated Course 3"),
+            "end": "2099-03-01T00:00:00Z",
+        },
+    }
+    mock_course_list = mock_course_list_api(mocker)
+    mock_course_list.get_courses.side_effect = lambda course_keys, username: [  # noqa: ARG005
+        CourseDetail(api_courses[course_key]) for course_key in course_keys
+    ]
+    bulk_update_spy = mocker.spy(CourseRun.objects, "bulk_update")
+    mock_log = mocker.patch("courses.utils.log")
+
+    assert sync_course_runs(course_runs) == (2, 0, 1)
+
+    assert mock_course_list.get_courses.call_count == 2
+    assert bulk_update_spy.call_count == 2
+    for run in course_runs:
+        run.refresh_from_db()
+    assert [run.title for run in course_runs] == [
+        "Updated Course 1",
+        "Course 2",
+        "Updated Course 3",
+    ]
+    assert course_runs[2].end_date == datetime(2099, 3, 1, tzinfo=timezone.utc)
+    mock_log.info.assert_any_call(
+        "Number of course runs with a changed %s: %d", "title", 2
+    )
+    mock_log.info.assert_any_call(
+        "Number of course runs with a changed %s: %d", "end_date", 1
+    )
+
+
 def test_catalog_visible_languages():
     """Test that get_catalog_languages returns the expected languages"""
 
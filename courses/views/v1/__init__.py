@@ -8,7 +8,13 @@ from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from courses.api import get_user_enrollments
+from courses.api import (
+    get_cached_user_enrollments_data,
+    get_enrollment_certificates,
+    get_user_enrollments,
+    set_cached_user_enrollments_data,
+)
+from courses.catalog_cache import CatalogCacheMixin
 from courses.models import (
     Course,
     CourseRun,
@@ -32,9 +38,30 @@ from courses.sync_external_courses.external_course_sync_api import (
     fetch_external_courses,
 )
 from ecommerce.models import Product
+from mitxpro.pagination import OptionalCursorPagination
+
+
+class SparseFieldsetMixin:
+    """
+    View mixin that limits the serialized fields to a comma-separated `fields` query parameter,
+    e.g. ?fields=id,title,readable_id
+    """
+
+    fields_query_param = "fields"
+
+    def get_serializer(self, *args, **kwargs):
+        """Pass the requested fields (if any) through to the serializer"""
+        fields = self.request.query_params.get(self.fields_query_param)
+        if fields:
+            kwargs["fields"] = [
+                field.strip() for field in fields.split(",") if field.strip()
+            ]
+        return super().get_serializer(*args, **kwargs)
 
 
-class ProgramViewSet(viewsets.ReadOnlyModelViewSet):
+class ProgramViewSet(
+    CatalogCacheMixin, SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet
+):
     """API view set for Programs"""
 
     products_prefetch = Prefetch("products", Product.objects.with_ordered_versions())
@@ -56,6 +83,7 @@ class ProgramViewSet(viewsets.ReadOnlyModelViewSet):
 
     permission_classes = []
     serializer_class = ProgramSerializer
+    pagination_class = OptionalCursorPagination
     queryset = (
         Program.objects.filter(live=True)
         .exclude(products=None)
@@ -71,7 +99,9 @@ class ProgramViewSet(viewsets.ReadOnlyModelViewSet):
     )
 
 
-class CourseViewSet(viewsets.ReadOnlyModelViewSet):
+class CourseViewSet(
+    CatalogCacheMixin, SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet
+):
     """API view set for Courses"""
 
     products_prefetch = Prefetch("products", Product.objects.with_ordered_versions())
@@ -81,6 +111,7 @@ class CourseViewSet(viewsets.ReadOnlyModelViewSet):
 
     permission_classes = []
     serializer_class = CourseSerializer
+    pagination_class = OptionalCursorPagination
 
     def get_queryset(self):
         queryset = (
@@ -131,37 +162,60 @@ class UserEnrollmentsView(APIView):
     def get(self, request, *args, **kwargs):  # noqa: ARG002
         """Read-only access"""
         user = request.user
+        data = get_cached_user_enrollments_data(user.id)
+        if data is None:
+            data = self._serialize_user_enrollments(user)
+            set_cached_user_enrollments_data(user.id, data)
+
+        return Response(status=status.HTTP_200_OK, data=data)
+
+    def _serialize_user_enrollments(self, user):
+        """Helper method to serialize all of a user's enrollments"""
         user_enrollments = get_user_enrollments(user)
+        programs = list(user_enrollments.programs)
+        past_programs = list(user_enrollments.past_programs)
         program_runs = list(user_enrollments.program_runs)
-
-        return Response(
-            status=status.HTTP_200_OK,
-            data={
-                "program_enrollments": self._serialize_program_enrollments(
-                    user_enrollments.programs, program_runs
-                ),
-                "course_run_enrollments": self._serialize_course_enrollments(
-                    user_enrollments.non_program_runs
-                ),
-                "past_course_run_enrollments": self._serialize_course_enrollments(
-                    user_enrollments.past_non_program_runs
-                ),
-                "past_program_enrollments": self._serialize_program_enrollments(
-                    user_enrollments.past_programs, program_runs
-                ),
-            },
+        non_program_runs = list(user_enrollments.non_program_runs)
+        past_non_program_runs = list(user_enrollments.past_non_program_runs)
+        run_certificates, program_certificates = get_enrollment_certificates(
+            user,
+            program_runs + non_program_runs + past_non_program_runs,
+            programs + past_programs,
         )
-
-    def _serialize_course_enrollments(self, enrollments):
+        context = {
+            "course_run_certificates": run_certificates,
+            "program_certificates": program_certificates,
+        }
+
+        return {
+            "program_enrollments": self._serialize_program_enrollments(
+                programs, program_runs, context
+            ),
+            "course_run_enrollments": self._serialize_course_enrollments(
+                non_program_runs, context
+            ),
+            "past_course_run_enrollments": self._serialize_course_enrollments(
+                past_non_program_runs, context
+            ),
+            "past_program_enrollments": self._serialize_program_enrollments(
+                past_programs, program_runs, context
+            ),
+        }
+
+    def _serialize_course_enrollments(self, enrollments, context):
         """Helper method to serialize course enrollments"""
 
-        return CourseRunEnrollmentSerializer(enrollments, many=True).data
+        return CourseRunEnrollmentSerializer(
+            enrollments, many=True, context=context
+        ).data
 
-    def _serialize_program_enrollments(self, programs, program_runs):
+    def _serialize_program_enrollments(self, programs, program_runs, context):
         """Helper method to serialize program enrollments"""
 
         return ProgramEnrollmentSerializer(
-            programs, many=True, context={"course_run_enrollments": list(program_runs)}
+            programs,
+            many=True,
+            context={**context, "course_run_enrollments": program_runs},
         ).data
 
 
@@ -205,7 +259,7 @@ class ProgramCertificateViewSet(
         return certificate.user
 
 
-class CourseTopicViewSet(viewsets.ReadOnlyModelViewSet):
+class CourseTopicViewSet(CatalogCacheMixin, viewsets.ReadOnlyModelViewSet):
     """
     Readonly viewset for parent course topics.
     """
@@ -495,6 +495,42 @@ def test_course_runs_without_product_in_programs_api(client, has_product):
     )
 
 
+@pytest.mark.parametrize("api_name", ["courses_api", "programs_api"])
+def test_catalog_api_sparse_fields(mocker, client, api_name):
+    """The courses and programs APIs should only serialize the fields that were requested"""
+    program = ProgramFactory.create(live=True)
+    ProductVersionFactory.create(product=ProductFactory(content_object=program))
+    CourseFactory.create(live=True, program=program)
+    get_description_mock = mocker.patch(
+        "courses.serializers.BaseProductSerializer.get_description"
+    )
+    resp = client.get(reverse(f"{api_name}-list"), {"fields": "id,title,not_a_field"})
+    assert resp.status_code == status.HTTP_200_OK
+    assert len(resp.json()) == 1
+    assert set(resp.json()[0].keys()) == {"id", "title"}
+    get_description_mock.assert_not_called()
+
+
+def test_courses_api_cursor_pagination(client):
+    """The courses API should paginate with a cursor only when the client asks for it"""
+    courses = sorted(CourseFactory.create_batch(3), key=lambda course: course.id)
+
+    resp = client.get(reverse("courses_api-list"))
+    assert isinstance(resp.json(), list)
+    assert len(resp.json()) == 3
+
+    resp = client.get(reverse("courses_api-list"), {"page_size": 2, "fields": "id"})
+    assert resp.status_code == status.HTTP_200_OK
+    first_page = resp.json()
+    assert first_page["previous"] is None
+    assert first_page["results"] == [{"id": course.id} for course in courses[:2]]
+
+    resp = client.get(first_page["next"])
+    second_page = resp.json()
+    assert second_page["next"] is None
+    assert second_page["results"] == [{"id": courses[2].id}]
+
+
 @pytest.mark.parametrize(
     "factory, serializer_cls, api_name",  # noqa: PT006
     [
@@ -734,11 +734,26 @@ def retry_failed_edx_enrollments():
             log.exception(str(exc))  # noqa: TRY401
             continue
         enrollment.edx_enrolled = True
-        enrollment.save_and_log(None)
         succeeded.append(enrollment)
+    save_edx_enrolled_run_enrollments(succeeded)
     return succeeded
 
 
+def save_edx_enrolled_run_enrollments(run_enrollments):
+    """
+    Saves enrollments which were enrolled in edX, with one audit record each
+
+    Args:
+        run_enrollments (list of CourseRunEnrollment): Enrollments with edx_enrolled set
+    """
+    from courses.api import invalidate_user_enrollments_cache  # noqa: PLC0415
+
+    CourseRunEnrollment.save_and_log_many(run_enrollments, None)
+    # the bulk update doesn't send post_save, which would clear the cached dashboard enrollments
+    for user_id in {enrollment.user_id for enrollment in run_enrollments}:
+        invalidate_user_enrollments_cache(user_id)
+
+
 def unenroll_edx_course_run(run_enrollment):
     """
     Unenrolls/deactivates a user in an edx course run
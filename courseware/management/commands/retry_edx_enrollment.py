@@ -6,7 +6,10 @@ from django.contrib.auth import get_user_model
 from django.core.management import BaseCommand
 
 from courses.models import CourseRunEnrollment
-from courseware.api import enroll_in_edx_course_runs
+from courseware.api import (
+    enroll_in_edx_course_runs,
+    save_edx_enrolled_run_enrollments,
+)
 from users.api import fetch_users
 
 User = get_user_model()
@@ -51,7 +54,9 @@ class Command(BaseCommand):
             enrollment_filter["run__courseware_id"] = options["run"]
         if options["uservalues"]:
             enrollment_filter["user__in"] = fetch_users(options["uservalues"])
-        course_run_enrollments = CourseRunEnrollment.objects.filter(**enrollment_filter)
+        course_run_enrollments = CourseRunEnrollment.objects.select_related(
+            "user", "run"
+        ).filter(**enrollment_filter)
 
         if course_run_enrollments.count() == 0:
             self.stderr.write(
@@ -61,6 +66,7 @@ class Command(BaseCommand):
             )
             return
 
+        edx_enrolled = []
         for enrollment in course_run_enrollments:
             user = enrollment.user
             course_run = enrollment.run
@@ -70,11 +76,12 @@ class Command(BaseCommand):
                 self.stderr.write(self.style.ERROR(str(exc)))
             else:
                 enrollment.edx_enrolled = True
-                enrollment.save_and_log(None)
+                edx_enrolled.append(enrollment)
                 self.stdout.write(
                     self.style.SUCCESS(
                         f"Successfully enrolled user {user.username} ({user.email}) in course run '{course_run.courseware_id}'"
                     )
                 )
 
+        save_edx_enrolled_run_enrollments(edx_enrolled)
         self.stdout.write(self.style.SUCCESS("Done"))
@@ -30,7 +30,11 @@ from ecommerce.models import (
     TaxRate,
 )
 from hubspot_xpro.task_helpers import sync_hubspot_deal
-from mitxpro.admin import AuditableModelAdmin, TimestampedModelAdmin
+from mitxpro.admin import (
+    AuditableModelAdmin,
+    AuditModelAdmin,
+    TimestampedModelAdmin,
+)
 from mitxpro.utils import get_field_names
 
 
@@ -167,7 +171,7 @@ class OrderAdmin(AuditableModelAdmin, TimestampedModelAdmin):
 
 
 @admin.register(OrderAudit)
-class OrderAuditAdmin(TimestampedModelAdmin):
+class OrderAuditAdmin(AuditModelAdmin):
     """Admin for OrderAudit"""
 
     model = OrderAudit
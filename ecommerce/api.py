@@ -7,6 +7,7 @@ import hashlib
 import hmac
 import logging
 import re
+import time
 import uuid
 from base64 import b64encode
 from collections import defaultdict
@@ -16,7 +17,7 @@ from typing import NamedTuple
 from urllib.parse import quote_plus, urljoin
 
 from django.conf import settings
-from django.db import IntegrityError, transaction
+from django.db import IntegrityError, connection, transaction
 from django.db.models import Count, F, Max, Prefetch, Q, Subquery
 from django.http import HttpRequest
 from django.urls import reverse
@@ -32,13 +33,16 @@ from courses.constants import (
     CONTENT_TYPE_MODEL_PROGRAM,
     PROGRAM_RUN_ID_PATTERN,
 )
-from courses.models import CourseRun, Program, ProgramRun
+from courses.models import Course, CourseRun, Program, ProgramRun
 from courses.utils import is_program_text_id
 from ecommerce.constants import (
+    BASKET_DELETION_CHUNK_SIZE,
+    COUPON_CREATION_CHUNK_SIZE,
     CYBERSOURCE_DECISION_ACCEPT,
     CYBERSOURCE_DECISION_CANCEL,
     DISCOUNT_TYPE_DOLLARS_OFF,
     DISCOUNT_TYPE_PERCENT_OFF,
+    PRODUCT_SELLABILITY_BATCH_SIZE,
 )
 from ecommerce.exceptions import EcommerceException
 from ecommerce.mail_api import send_ecommerce_order_receipt
@@ -54,6 +58,7 @@ from ecommerce.models import (
     CouponRedemption,
     CouponSelection,
     CouponVersion,
+    CourseRunSelection,
     DataConsentAgreement,
     DataConsentUser,
     Line,
@@ -69,7 +74,13 @@ from ecommerce.models import (
 from ecommerce.utils import positive_or_zero
 from hubspot_xpro.task_helpers import sync_hubspot_deal
 from maxmind.api import ip_to_country_code
-from mitxpro.utils import case_insensitive_equal, first_or_none, now_in_utc
+from mitxpro.outbox import enqueue_task
+from mitxpro.utils import (
+    case_insensitive_equal,
+    first_or_none,
+    group_into_dict,
+    now_in_utc,
+)
 
 log = logging.getLogger(__name__)
 
@@ -729,56 +740,73 @@ def set_coupons_to_redeemed(redeemed_email, coupon_ids):
             sheet_update_map[assignment.bulk_assignment.assignment_sheet_id][
                 assignment.product_coupon.coupon.coupon_code
             ] = assignment.email
-        sheets.tasks.set_assignment_rows_to_enrolled.delay(sheet_update_map)
+        enqueue_task(
+            sheets.tasks.set_assignment_rows_to_enrolled, args=(dict(sheet_update_map),)
+        )
+
+
+def _delete_baskets_by_id(basket_ids):
+    """
+    Deletes baskets and all of their dependent rows with one set-based DELETE per table
+
+    Args:
+        basket_ids (list of int): Basket ids
+
+    Returns:
+        dict: The number of deleted rows for each model, keyed by model name
+    """
+    deleted_counts = {}
+    for model_cls in (BasketItem, CourseRunSelection, CouponSelection):
+        deleted_counts[model_cls.__name__], _ = model_cls.objects.filter(
+            basket_id__in=basket_ids
+        ).delete()
+    deleted_counts[Basket.__name__], _ = Basket.objects.filter(
+        id__in=basket_ids
+    ).delete()
+    return deleted_counts
 
 
 def clear_and_delete_baskets(user=None):
     """
-    Delete baskets and all the associated items.
+    Delete baskets and all the associated items. Expired baskets are selected and deleted in bounded chunks,
+    each in its own transaction, so locks are only held for the duration of a single chunk.
 
     Args:
        user (User, optional): The user whose baskets should be deleted. If not provided, expired baskets will be deleted.
+
+    Returns:
+        dict: The number of deleted rows for each model, keyed by model name
     """
     cutoff_date = now_in_utc() - timedelta(days=settings.BASKET_EXPIRY_DAYS)
     basket_filter = {"user": user} if user else {"updated_on__lte": cutoff_date}
 
-    with transaction.atomic():
-        baskets = Basket.objects.select_for_update(skip_locked=True).filter(
-            **basket_filter
-        )
+    total_counts = defaultdict(int)
+    start_time = time.monotonic()
+    while True:
+        with transaction.atomic():
+            basket_ids = list(
+                Basket.objects.select_for_update(skip_locked=True)
+                .filter(**basket_filter)
+                .values_list("id", flat=True)[:BASKET_DELETION_CHUNK_SIZE]
+            )
+            if not basket_ids:
+                break
+            for model_name, count in _delete_baskets_by_id(basket_ids).items():
+                total_counts[model_name] += count
+        if len(basket_ids) < BASKET_DELETION_CHUNK_SIZE:
+            break
+
+    if total_counts:
+        elapsed_seconds = time.monotonic() - start_time
+        num_deleted_rows = sum(total_counts.values())
         log.info(
-            "Basket deletion requested for baskets Ids: %s",
-            [basket.id for basket in baskets],
+            "Deleted baskets and associated rows: %s (%d rows in %.2f seconds, %.1f rows/sec)",
+            dict(total_counts),
+            num_deleted_rows,
+            elapsed_seconds,
+            num_deleted_rows / elapsed_seconds if elapsed_seconds else num_deleted_rows,
         )
-        for basket in baskets:
-            log.info("Clearing and deleting basket with Id: %s", basket.id)
-
-            with transaction.atomic():
-                basket_items = basket.basketitems.all()
-                log.info(
-                    "Deleting basket items: %s",
-                    list(basket_items.values_list("id", flat=True)),
-                )
-                basket_items.delete()
-
-                course_run_selections = basket.courserunselection_set.all()
-                course_run_selections_ids = list(
-                    course_run_selections.values_list("id", flat=True)
-                )
-                log.info(
-                    "Deleting course run selections: %s", course_run_selections_ids
-                )
-                course_run_selections.delete()
-
-                coupon_selections = basket.couponselection_set.all()
-                coupon_selections_ids = list(
-                    coupon_selections.values_list("id", flat=True)
-                )
-                log.info("Deleting coupon selections: %s", coupon_selections_ids)
-                coupon_selections.delete()
-
-                log.info("Deleting basket: %s", basket.id)
-                basket.delete()
+    return dict(total_counts)
 
 
 def complete_order(order):
@@ -1015,7 +1043,203 @@ def get_product_courses(product):
         )
 
 
-def bulk_assign_product_coupons(desired_assignments, bulk_assignment=None):
+def _get_enrollable_until(deadlines, now, *, inclusive):
+    """
+    Determines whether any of the given deadlines (None meaning no deadline) is still open, and until when
+
+    Args:
+        deadlines (list of datetime or None): Deadlines
+        now (datetime): The current time
+        inclusive (bool): If True, a deadline equal to now is still open
+
+    Returns:
+        tuple of (bool, datetime or None):
+            Whether a deadline is still open, and the latest open deadline (None if there is no limit)
+    """
+    open_deadlines = [
+        deadline
+        for deadline in deadlines
+        if deadline is None or deadline > now or (inclusive and deadline == now)
+    ]
+    if not open_deadlines:
+        return False, None
+    if None in open_deadlines:
+        return True, None
+    return True, max(open_deadlines)
+
+
+def get_product_sellability(products, now=None):
+    """
+    Determines whether products can currently be sold, and until when. A product is sellable if it has
+    a version, and either
+        - it's for an internal course run whose enrollment hasn't ended, or
+        - it's for an internal program with an unexpired program run, where every course in the
+          program has a course run whose enrollment hasn't ended
+
+    Args:
+        products (django.db.models.query.QuerySet): A queryset of products
+        now (datetime): The current time (defaults to now)
+
+    Returns:
+        dict: Product ids mapped to a tuple of (is_sellable, sellable_until)
+    """
+    now = now or now_in_utc()
+    products = list(products.values_list("id", "content_type__model", "object_id"))
+    product_ids = [product_id for product_id, _, _ in products]
+    run_ids = [
+        object_id
+        for _, model, object_id in products
+        if model == CONTENT_TYPE_MODEL_COURSERUN
+    ]
+    program_ids = [
+        object_id
+        for _, model, object_id in products
+        if model == CONTENT_TYPE_MODEL_PROGRAM
+    ]
+
+    versioned_product_ids = set(
+        ProductVersion.objects.filter(product_id__in=product_ids).values_list(
+            "product_id", flat=True
+        )
+    )
+    runs = {
+        run_id: (enrollment_end, is_external)
+        for run_id, enrollment_end, is_external in CourseRun.objects.filter(
+            id__in=run_ids
+        ).values_list("id", "enrollment_end", "course__is_external")
+    }
+    external_program_ids = set(
+        Program.objects.filter(id__in=program_ids, is_external=True).values_list(
+            "id", flat=True
+        )
+    )
+    program_run_ends = group_into_dict(
+        ProgramRun.objects.filter(program_id__in=program_ids).values_list(
+            "program_id", "end_date"
+        ),
+        key_fn=lambda program_run: program_run[0],
+    )
+    program_course_ids = group_into_dict(
+        Course.objects.filter(program_id__in=program_ids).values_list(
+            "program_id", "id"
+        ),
+        key_fn=lambda course: course[0],
+    )
+    course_run_enrollment_ends = group_into_dict(
+        CourseRun.objects.filter(course__program_id__in=program_ids).values_list(
+            "course_id", "enrollment_end"
+        ),
+        key_fn=lambda course_run: course_run[0],
+    )
+
+    def get_program_sellability(program_id):
+        """Returns (is_sellable, sellable_until) for a program"""
+        if program_id in external_program_ids:
+            return False, None
+        is_sellable, sellable_until = _get_enrollable_until(
+            [end_date for _, end_date in program_run_ends.get(program_id, [])],
+            now,
+            inclusive=False,
+        )
+        deadlines = [sellable_until]
+        for _, course_id in program_course_ids.get(program_id, []):
+            course_enrollable, course_enrollable_until = _get_enrollable_until(
+                [
+                    enrollment_end
+                    for _, enrollment_end in course_run_enrollment_ends.get(
+                        course_id, []
+                    )
+                ],
+                now,
+                inclusive=True,
+            )
+            is_sellable = is_sellable and course_enrollable
+            deadlines.append(course_enrollable_until)
+        if not is_sellable:
+            return False, None
+        deadlines = [deadline for deadline in deadlines if deadline is not None]
+        return True, min(deadlines) if deadlines else None
+
+    sellability = {}
+    for product_id, model, object_id in products:
+        if product_id not in versioned_product_ids:
+            sellability[product_id] = (False, None)
+        elif model == CONTENT_TYPE_MODEL_COURSERUN and object_id in runs:
+            enrollment_end, is_external = runs[object_id]
+            sellability[product_id] = (
+                (False, None)
+                if is_external
+                else _get_enrollable_until([enrollment_end], now, inclusive=True)
+            )
+        elif model == CONTENT_TYPE_MODEL_PROGRAM:
+            sellability[product_id] = get_program_sellability(object_id)
+        else:
+            sellability[product_id] = (False, None)
+    return sellability
+
+
+def update_product_sellability(products=None):
+    """
+    Recomputes and stores Product.is_sellable/Product.sellable_until, only writing the products that changed
+
+    Args:
+        products (django.db.models.query.QuerySet or None):
+            The products to update (defaults to all products, including inactive ones)
+
+    Returns:
+        int: The number of products that were updated
+    """
+    products = Product.all_objects.all() if products is None else products
+    sellability = get_product_sellability(products)
+    current_sellability = Product.all_objects.filter(
+        id__in=sellability.keys()
+    ).values_list("id", "is_sellable", "sellable_until")
+    changed_products = [
+        Product(
+            id=product_id,
+            is_sellable=sellability[product_id][0],
+            sellable_until=sellability[product_id][1],
+        )
+        for product_id, is_sellable, sellable_until in current_sellability
+        if sellability[product_id] != (is_sellable, sellable_until)
+    ]
+    Product.all_objects.bulk_update(
+        changed_products,
+        ["is_sellable", "sellable_until"],
+        batch_size=PRODUCT_SELLABILITY_BATCH_SIZE,
+    )
+    return len(changed_products)
+
+
+def update_sellability_for_objects(*, course_run_ids=(), program_ids=()):
+    """
+    Recomputes the sellability of the products for the given course runs and programs
+
+    Args:
+        course_run_ids (iterable of int): CourseRun ids
+        program_ids (iterable of int): Program ids
+    """
+    course_run_ids = [run_id for run_id in course_run_ids if run_id is not None]
+    program_ids = [program_id for program_id in program_ids if program_id is not None]
+    if not course_run_ids and not program_ids:
+        return
+    update_product_sellability(
+        Product.all_objects.filter(
+            Q(
+                content_type__model=CONTENT_TYPE_MODEL_COURSERUN,
+                object_id__in=course_run_ids,
+            )
+            | Q(
+                content_type__model=CONTENT_TYPE_MODEL_PROGRAM,
+                object_id__in=program_ids,
+            )
+        )
+    )
+
+
+def bulk_assign_product_coupons(
+    desired_assignments, bulk_assignment=None, batch_size=None
+):
     """
     Assign product coupons to emails in bulk and create a record of this bulk creation
 
@@ -1024,6 +1248,7 @@ def bulk_assign_product_coupons(desired_assignments, bulk_assignment=None):
             CouponEligibility id that each email should be assigned
         bulk_assignment (Optional[BulkCouponAssignment]): A BulkCouponAssignment object, or
             None if a new one should be created
+        batch_size (Optional[int]): The maximum number of ProductCouponAssignments created in a single query
 
     Returns:
         (BulkCouponAssignment, List[ProductCouponAssignment]): The BulkCouponAssignment object paired with
@@ -1033,12 +1258,15 @@ def bulk_assign_product_coupons(desired_assignments, bulk_assignment=None):
     return (
         bulk_assignment,
         ProductCouponAssignment.objects.bulk_create(
-            ProductCouponAssignment(
-                email=email,
-                product_coupon_id=product_coupon_id,
-                bulk_assignment=bulk_assignment,
-            )
-            for email, product_coupon_id in desired_assignments
+            [
+                ProductCouponAssignment(
+                    email=email,
+                    product_coupon_id=product_coupon_id,
+                    bulk_assignment=bulk_assignment,
+                )
+                for email, product_coupon_id in desired_assignments
+            ],
+            batch_size=batch_size,
         ),
     )
 
@@ -1336,6 +1564,67 @@ def get_or_create_data_consent_users(basket):
     return data_consents
 
 
+def _bulk_create_coupons(coupons):
+    """
+    Saves new coupons, generating new codes for any coupons whose code collides with an existing one
+
+    Args:
+        coupons (list of Coupon): Unsaved coupon objects
+
+    Returns:
+        list of Coupon: The saved coupon objects
+    """
+    try:
+        with transaction.atomic():
+            return Coupon.objects.bulk_create(coupons)
+    except IntegrityError:
+        log.warning(
+            "Falling back to create Coupons for coupon payment %s", coupons[0].payment
+        )
+        existing_coupon_codes = set(
+            Coupon.objects.filter(
+                coupon_code__in=[coupon.coupon_code for coupon in coupons]
+            ).values_list("coupon_code", flat=True)
+        )
+        for coupon in coupons:
+            if coupon.coupon_code in existing_coupon_codes:
+                coupon.coupon_code = uuid.uuid4().hex
+        return Coupon.objects.bulk_create(coupons)
+
+
+def _bulk_create_coupon_eligibilities(coupon_ids, product_ids, product_program_run_map):
+    """
+    Creates a CouponEligibility for every combination of the given coupons and products with a single
+    set-based INSERT ... SELECT, rather than building every combination in Python.
+
+    Args:
+        coupon_ids (list of int): Coupon ids
+        product_ids (list of int): Product ids
+        product_program_run_map (dict): Maps a product id to an associated ProgramRun id
+    """
+    if not coupon_ids or not product_ids:
+        return
+    now = now_in_utc()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {CouponEligibility._meta.db_table}
+                (created_on, updated_on, coupon_id, product_id, program_run_id)
+            SELECT %s, %s, coupon.id, product.product_id, product.program_run_id
+            FROM unnest(%s::integer[]) AS coupon(id)
+            CROSS JOIN unnest(%s::integer[], %s::integer[]) AS product(product_id, program_run_id)
+            """,  # noqa: S608
+            [
+                now,
+                now,
+                coupon_ids,
+                product_ids,
+                [product_program_run_map.get(product_id) for product_id in product_ids],
+            ],
+        )
+
+
+@transaction.atomic
 def create_coupons(  # noqa: PLR0913
     *,
     name,
@@ -1357,9 +1646,11 @@ def create_coupons(  # noqa: PLR0913
     coupon_code=None,
     product_program_run_map=None,
     include_future_runs=False,
+    progress_callback=None,
 ):
     """
-    Create one or more coupons and whatever instances are needed for them.
+    Create one or more coupons and whatever instances are needed for them. Coupons are generated and saved in
+    chunks so that the memory use and the cost of recovering from a code collision are bounded by the chunk size.
 
     Args:
         name (str): Name of the CouponPayment
@@ -1381,6 +1672,8 @@ def create_coupons(  # noqa: PLR0913
         product_program_run_map (dict): An optional dictionary that maps a product id to an associated ProgramRun id.
             If provided, the CouponEligibility records for those products will be mapped to the given ProgramRuns.
         include_future_runs (bool): Whether or not coupon will available for future runs
+        progress_callback (callable or None): An optional function that is called after each chunk of coupons
+            is created, with the number of coupons created so far and the total number of coupons as arguments
 
 
     Returns:
@@ -1407,52 +1700,34 @@ def create_coupons(  # noqa: PLR0913
         payment_transaction=payment_transaction,
     )
 
-    coupons = [
-        Coupon(
-            coupon_code=(coupon_code or uuid.uuid4().hex),
-            payment=payment,
-            include_future_runs=include_future_runs,
-            is_global=is_global,
+    product_ids = list(product_ids or [])
+    product_program_run_map = product_program_run_map or {}
+    num_created = 0
+    while num_created < num_coupon_codes:
+        chunk_size = min(COUPON_CREATION_CHUNK_SIZE, num_coupon_codes - num_created)
+        coupon_objs = _bulk_create_coupons(
+            [
+                Coupon(
+                    coupon_code=(coupon_code or uuid.uuid4().hex),
+                    payment=payment,
+                    include_future_runs=include_future_runs,
+                    is_global=is_global,
+                )
+                for _ in range(chunk_size)
+            ]
         )
-        for _ in range(num_coupon_codes)
-    ]
-
-    try:
-        with transaction.atomic():
-            coupon_objs = Coupon.objects.bulk_create(coupons)
-    except IntegrityError:
-        log.warning(
-            "Falling back to create Coupons for coupon payment {} and company {}".format(  # noqa: G001, UP032
-                name, company_id
-            )
+        CouponVersion.objects.bulk_create(
+            [
+                CouponVersion(coupon=obj, payment_version=payment_version)
+                for obj in coupon_objs
+            ]
         )
-
-        new_coupon_codes = [coupon.coupon_code for coupon in coupons]
-        existing_coupon_codes = Coupon.objects.filter(
-            coupon_code__in=new_coupon_codes
-        ).values_list("coupon_code", flat=True)
-        if existing_coupon_codes:
-            for coupon in coupons:
-                if coupon.coupon_code in existing_coupon_codes:
-                    coupon.coupon_code = uuid.uuid4().hex
-        coupon_objs = Coupon.objects.bulk_create(coupons)
-
-    versions = [
-        CouponVersion(coupon=obj, payment_version=payment_version)
-        for obj in coupon_objs
-    ]
-    product_program_run_map = product_program_run_map or {}
-    eligibilities = [
-        CouponEligibility(
-            coupon=obj,
-            product_id=product_id,
-            program_run_id=product_program_run_map.get(product_id),
+        _bulk_create_coupon_eligibilities(
+            [obj.id for obj in coupon_objs], product_ids, product_program_run_map
         )
-        for obj in coupon_objs
-        for product_id in product_ids
-    ]
-    CouponVersion.objects.bulk_create(versions)
-    CouponEligibility.objects.bulk_create(eligibilities)
+        num_created += chunk_size
+        if progress_callback is not None:
+            progress_callback(num_created, num_coupon_codes)
     return payment_version
 
 
@@ -8,7 +8,6 @@ import hmac
 import ipaddress
 import uuid
 from base64 import b64encode
-from collections import defaultdict
 from datetime import timedelta
 from decimal import Decimal
 from unittest.mock import PropertyMock, patch
@@ -21,6 +20,7 @@ from django.contrib.auth.models import AnonymousUser
 from django.core.exceptions import ObjectDoesNotExist
 from rest_framework.exceptions import ValidationError
 
+import sheets.tasks
 from affiliate.factories import AffiliateFactory
 from courses.factories import (
     CourseFactory,
@@ -48,6 +48,7 @@ from ecommerce.api import (
     get_product_from_querystring_id,
     get_product_from_text_id,
     get_product_price,
+    get_product_sellability,
     get_product_version_price_with_discount,
     get_readable_id,
     get_valid_coupon_versions,
@@ -56,6 +57,7 @@ from ecommerce.api import (
     latest_product_version,
     make_receipt_url,
     redeem_coupon,
+    update_product_sellability,
     validate_basket_for_checkout,
 )
 from ecommerce.constants import (
@@ -89,6 +91,7 @@ from ecommerce.models import (
     Basket,
     BasketItem,
     Coupon,
+    CouponEligibility,
     CouponPaymentVersion,
     CouponRedemption,
     CouponSelection,
@@ -1159,6 +1162,29 @@ def test_delete_expired_basket(patch_now):
     ]
 
 
+def test_delete_expired_baskets_in_chunks(mocker, basket_and_coupons):
+    """
+    clear_and_delete_baskets should delete expired baskets and their dependent rows in chunks, and
+    return the number of deleted rows for each model
+    """
+    mocker.patch("ecommerce.api.BASKET_DELETION_CHUNK_SIZE", 2)
+    expired_baskets = [basket_and_coupons.basket, *BasketFactory.create_batch(4)]
+    Basket.objects.filter(id__in=[basket.id for basket in expired_baskets]).update(
+        updated_on=now_in_utc() - timedelta(days=settings.BASKET_EXPIRY_DAYS + 1)
+    )
+    unexpired_basket = BasketFactory.create()
+    num_basket_items = BasketItem.objects.filter(
+        basket=basket_and_coupons.basket
+    ).count()
+
+    deleted_counts = clear_and_delete_baskets()
+    assert deleted_counts["Basket"] == len(expired_baskets)
+    assert deleted_counts["BasketItem"] == num_basket_items
+    assert deleted_counts["CourseRunSelection"] == 1
+    assert deleted_counts["CouponSelection"] == 1
+    assert list(Basket.objects.values_list("id", flat=True)) == [unexpired_basket.id]
+
+
 def test_complete_order(mocker, user, basket_and_coupons):
     """
     Test that complete_order enrolls a user in the items in their order and clears out checkout-related objects
@@ -1186,7 +1212,7 @@ def test_complete_order_coupon_assignments(mocker, user, basket_and_coupons):
     Test that complete_order sets relevant product assignments to redeemed
     """
     mocker.patch("ecommerce.api.enroll_user_in_order_items")
-    patched_set_enrolled = mocker.patch("sheets.tasks.set_assignment_rows_to_enrolled")
+    patched_enqueue_task = mocker.patch("ecommerce.api.enqueue_task")
     basket_and_coupons.basket.user = user
     basket_and_coupons.basket.save()
     order = OrderFactory.create(purchaser=user, status=Order.CREATED)
@@ -1212,15 +1238,15 @@ def test_complete_order_coupon_assignments(mocker, user, basket_and_coupons):
     for coupon_assignment in coupon_assignments:
         coupon_assignment.refresh_from_db()
         assert coupon_assignment.redeemed is True
-    patched_set_enrolled.delay.assert_called_once_with(
-        defaultdict(
-            dict,
+    patched_enqueue_task.assert_called_once_with(
+        sheets.tasks.set_assignment_rows_to_enrolled,
+        args=(
             {
                 bulk_assignment.assignment_sheet_id: {
                     order_coupons[2].coupon_code: order.purchaser.email.upper()
                 }
             },
-        )
+        ),
     )
 
 
@@ -1639,6 +1665,40 @@ def test_create_coupons(use_defaults, num_coupon_codes):
             assert coupon.coupon_code == optional["coupon_code"]
 
 
+def test_create_coupons_in_chunks(mocker):
+    """
+    create_coupons should create coupons in chunks, create an eligibility for each coupon/product pair,
+    and report progress after each chunk
+    """
+    mocker.patch("ecommerce.api.COUPON_CREATION_CHUNK_SIZE", 5)
+    products = [ProductVersionFactory.create().product for _ in range(2)]
+    program_run = ProgramRunFactory.create()
+    progress_callback = mocker.Mock()
+
+    payment_version = create_coupons(
+        name="chunked",
+        product_ids=[product.id for product in products],
+        amount=Decimal("1"),
+        num_coupon_codes=12,
+        coupon_type=CouponPaymentVersion.SINGLE_USE,
+        discount_type=DISCOUNT_TYPE_PERCENT_OFF,
+        product_program_run_map={products[0].id: program_run.id},
+        progress_callback=progress_callback,
+    )
+    assert payment_version.couponversion_set.count() == 12
+    eligibilities = CouponEligibility.objects.filter(
+        coupon__payment=payment_version.payment
+    )
+    assert eligibilities.count() == 24
+    assert eligibilities.filter(program_run=program_run).count() == 12
+    assert eligibilities.filter(product=products[1], program_run=None).count() == 12
+    assert [call.args for call in progress_callback.call_args_list] == [
+        (5, 12),
+        (10, 12),
+        (12, 12),
+    ]
+
+
 @pytest.mark.parametrize(
     "input_text_id,run_text_id,program_text_id,prog_run_tag",  # noqa: PT006
     [
@@ -1949,3 +2009,88 @@ def test_is_tax_applicable(  # noqa: PLR0913
         TaxRateFactory.create(country_code=tax_rate_country, active=tax_rate_enabled)
 
     assert is_tax_applicable(request) == expected_taxes_display
+
+
+@pytest.mark.parametrize(
+    "enrollment_end_delta, is_external, expected_sellable",  # noqa: PT006
+    [
+        [None, False, True],  # noqa: PT007
+        [timedelta(days=1), False, True],  # noqa: PT007
+        [timedelta(days=-1), False, False],  # noqa: PT007
+        [timedelta(days=1), True, False],  # noqa: PT007
+    ],
+)
+def test_get_product_sellability_course_run(
+    enrollment_end_delta, is_external, expected_sellable
+):
+    """get_product_sellability should mark course run products sellable until enrollment ends"""
+    now = now_in_utc()
+    enrollment_end = now + enrollment_end_delta if enrollment_end_delta else None
+    run = CourseRunFactory.create(
+        enrollment_end=enrollment_end, course__is_external=is_external
+    )
+    product = ProductVersionFactory.create(product__content_object=run).product
+
+    assert get_product_sellability(Product.objects.filter(id=product.id), now=now) == {
+        product.id: (expected_sellable, enrollment_end if expected_sellable else None)
+    }
+    product.refresh_from_db()
+    assert product.is_sellable is expected_sellable
+
+
+def test_get_product_sellability_program():
+    """
+    get_product_sellability should mark a program product sellable until the earliest of its program run
+    end date and the last enrollment deadline of each of its courses
+    """
+    now = now_in_utc()
+    program = ProgramFactory.create()
+    ProgramRunFactory.create(program=program, end_date=now + timedelta(days=10))
+    first_course, second_course = CourseFactory.create_batch(2, program=program)
+    CourseRunFactory.create(course=first_course, enrollment_end=now + timedelta(days=3))
+    CourseRunFactory.create(course=first_course, enrollment_end=now + timedelta(days=5))
+    CourseRunFactory.create(
+        course=second_course, enrollment_end=now - timedelta(days=1)
+    )
+    product = ProductVersionFactory.create(product__content_object=program).product
+    products = Product.objects.filter(id=product.id)
+
+    assert get_product_sellability(products, now=now) == {product.id: (False, None)}
+
+    CourseRunFactory.create(
+        course=second_course, enrollment_end=now + timedelta(days=7)
+    )
+    assert get_product_sellability(products, now=now) == {
+        product.id: (True, now + timedelta(days=5))
+    }
+
+    CourseRun.objects.filter(course__program=program).update(enrollment_end=None)
+    assert get_product_sellability(products, now=now) == {
+        product.id: (True, now + timedelta(days=10))
+    }
+
+
+def test_get_product_sellability_no_version():
+    """get_product_sellability should not mark a product without versions as sellable"""
+    product = ProductFactory.create(content_object=CourseRunFactory.create())
+    assert get_product_sellability(Product.objects.filter(id=product.id)) == {
+        product.id: (False, None)
+    }
+
+
+def test_update_product_sellability():
+    """update_product_sellability should only write the products whose sellability changed"""
+    run = CourseRunFactory.create(enrollment_end=now_in_utc() + timedelta(days=1))
+    product = ProductVersionFactory.create(product__content_object=run).product
+    product.refresh_from_db()
+    assert product.is_sellable is True
+    assert update_product_sellability() == 0
+
+    # Updates through the queryset skip the signals which keep sellability current
+    CourseRun.objects.filter(id=run.id).update(
+        enrollment_end=now_in_utc() - timedelta(days=1)
+    )
+    assert update_product_sellability() == 1
+    product.refresh_from_db()
+    assert product.is_sellable is False
+    assert product.sellable_until is None
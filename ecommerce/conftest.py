@@ -22,6 +22,7 @@ from ecommerce.factories import (
     ProductVersionFactory,
 )
 from ecommerce.models import CourseRunSelection
+from hubspot_xpro.tasks import sync_deal_with_hubspot, sync_product_with_hubspot
 
 CouponGroup = namedtuple(  # noqa: PYI024
     "CouponGroup", ["coupon", "coupon_version", "payment", "payment_version"]
@@ -173,8 +174,16 @@ def single_use_coupon_json(coupon_product_ids, discount_type):
 
 @pytest.fixture
 def mock_hubspot_syncs(mocker):
-    """Mock the sync_deal_with_hubspot task"""
-    return SimpleNamespace(
-        order=mocker.patch("hubspot_xpro.tasks.sync_deal_with_hubspot.delay"),
-        product=mocker.patch("hubspot_xpro.tasks.sync_product_with_hubspot.delay"),
-    )
+    """Mock the hubspot sync tasks for orders and products, which are called when they're enqueued"""
+    syncs = SimpleNamespace(order=mocker.Mock(), product=mocker.Mock())
+    syncs_by_task_name = {
+        sync_deal_with_hubspot.name: syncs.order,
+        sync_product_with_hubspot.name: syncs.product,
+    }
+
+    def enqueue_task(task, args=(), kwargs=None, **_):
+        if task.name in syncs_by_task_name:
+            syncs_by_task_name[task.name](*args, **(kwargs or {}))
+
+    mocker.patch("hubspot_xpro.task_helpers.enqueue_task", side_effect=enqueue_task)
+    return syncs
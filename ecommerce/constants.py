@@ -55,3 +55,13 @@ DISCOUNT_TYPES = [
 
 COUPON_ADD_PERMISSION = "ecommerce.add_coupon"
 COUPON_UPDATE_PERMISSION = "ecommerce.change_coupon"
+
+# The number of coupon codes generated and written to the database at a time when creating coupons in bulk
+COUPON_CREATION_CHUNK_SIZE = 5000
+COUPON_CREATION_PROGRESS_STATE = "PROGRESS"
+
+# The number of expired baskets that are deleted in a single transaction
+BASKET_DELETION_CHUNK_SIZE = 1000
+
+# The number of products whose sellability is updated in a single query
+PRODUCT_SELLABILITY_BATCH_SIZE = 1000
@@ -0,0 +1,123 @@
+# Generated by Django 5.2.17 on 2026-10-19 12:00
+
+from collections import defaultdict
+from datetime import UTC, datetime
+
+from django.db import migrations, models
+
+
+def _get_enrollable_until(deadlines, now, *, inclusive):
+    """Returns whether any of the deadlines (None meaning no deadline) is open, and the latest open one"""
+    open_deadlines = [
+        deadline
+        for deadline in deadlines
+        if deadline is None or deadline > now or (inclusive and deadline == now)
+    ]
+    if not open_deadlines:
+        return False, None
+    if None in open_deadlines:
+        return True, None
+    return True, max(open_deadlines)
+
+
+def compute_product_sellability(apps, schema_editor):  # noqa: ARG001
+    """
+    Populate the sellability of all existing products, the same way as
+    ecommerce.api.get_product_sellability at the time of this migration
+    """
+    Product = apps.get_model("ecommerce", "Product")
+    ProductVersion = apps.get_model("ecommerce", "ProductVersion")
+    Course = apps.get_model("courses", "Course")
+    CourseRun = apps.get_model("courses", "CourseRun")
+    Program = apps.get_model("courses", "Program")
+    ProgramRun = apps.get_model("courses", "ProgramRun")
+    now = datetime.now(tz=UTC)
+
+    versioned_product_ids = set(
+        ProductVersion.objects.values_list("product_id", flat=True)
+    )
+    runs = {
+        run_id: (enrollment_end, is_external)
+        for run_id, enrollment_end, is_external in CourseRun.objects.values_list(
+            "id", "enrollment_end", "course__is_external"
+        )
+    }
+    enrollment_ends_by_course = defaultdict(list)
+    for course_id, enrollment_end in CourseRun.objects.values_list(
+        "course_id", "enrollment_end"
+    ):
+        enrollment_ends_by_course[course_id].append(enrollment_end)
+    course_ids_by_program = defaultdict(list)
+    for program_id, course_id in Course.objects.filter(
+        program__isnull=False
+    ).values_list("program_id", "id"):
+        course_ids_by_program[program_id].append(course_id)
+    program_run_ends = defaultdict(list)
+    for program_id, end_date in ProgramRun.objects.values_list(
+        "program_id", "end_date"
+    ):
+        program_run_ends[program_id].append(end_date)
+    external_program_ids = set(
+        Program.objects.filter(is_external=True).values_list("id", flat=True)
+    )
+
+    def get_program_sellability(program_id):
+        if program_id in external_program_ids:
+            return False, None
+        is_sellable, sellable_until = _get_enrollable_until(
+            program_run_ends[program_id], now, inclusive=False
+        )
+        deadlines = [sellable_until]
+        for course_id in course_ids_by_program[program_id]:
+            course_enrollable, course_enrollable_until = _get_enrollable_until(
+                enrollment_ends_by_course[course_id], now, inclusive=True
+            )
+            is_sellable = is_sellable and course_enrollable
+            deadlines.append(course_enrollable_until)
+        if not is_sellable:
+            return False, None
+        deadlines = [deadline for deadline in deadlines if deadline is not None]
+        return True, min(deadlines) if deadlines else None
+
+    sellable_products = []
+    for product in Product.objects.select_related("content_type").iterator():
+        model = product.content_type.model
+        if product.id not in versioned_product_ids:
+            continue
+        if model == "courserun" and product.object_id in runs:
+            enrollment_end, is_external = runs[product.object_id]
+            if is_external:
+                continue
+            product.is_sellable, product.sellable_until = _get_enrollable_until(
+                [enrollment_end], now, inclusive=True
+            )
+        elif model == "program":
+            product.is_sellable, product.sellable_until = get_program_sellability(
+                product.object_id
+            )
+        if product.is_sellable:
+            sellable_products.append(product)
+    Product.objects.bulk_update(
+        sellable_products, ["is_sellable", "sellable_until"], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("courses", "0044_add_language_is_active"),
+        ("ecommerce", "0044_only_sellable_products"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="is_sellable",
+            field=models.BooleanField(db_index=True, default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="sellable_until",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(compute_product_sellability, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.17 on 2026-10-19 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ecommerce", "0045_product_sellability"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="orderaudit",
+            name="created_on",
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AddField(
+            model_name="orderaudit",
+            name="data_diff",
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="orderaudit",
+            name="data_hash",
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name="orderaudit",
+            name="checkpoint",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="ecommerce.orderaudit",
+            ),
+        ),
+        migrations.AddField(
+            model_name="orderaudit",
+            name="checkpoint_distance",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
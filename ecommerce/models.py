@@ -106,6 +106,9 @@ class Product(TimestampedModel):
         help_text="Products can be Private or Public. Public products are listed in the "
         "product drop-down on the bulk purchase form at /ecommerce/bulk.",
     )
+    # Maintained by ecommerce.api.update_product_sellability
+    is_sellable = models.BooleanField(default=False, db_index=True, editable=False)
+    sellable_until = models.DateTimeField(null=True, blank=True, editable=False)
     content_object = GenericForeignKey("content_type", "object_id")
     objects = ProductManager()
     all_objects = models.Manager()
@@ -931,9 +931,25 @@ class BaseCouponSerializer(serializers.Serializer):
             coupon_code=validated_data.get("coupon_code"),
             product_ids=validated_data.get("product_ids"),
             include_future_runs=validated_data.get("include_future_runs"),
+            progress_callback=validated_data.get("progress_callback"),
         )
 
 
+def get_coupon_serializer_class(coupon_data):
+    """
+    Returns the serializer class that should be used to create coupons from the given data
+
+    Args:
+        coupon_data (dict): Coupon creation data
+
+    Returns:
+        Type[BaseCouponSerializer]: The serializer class for the type of coupon being created
+    """
+    if coupon_data.get("coupon_type") == models.CouponPaymentVersion.SINGLE_USE:
+        return SingleUseCouponSerializer
+    return PromoCouponSerializer
+
+
 class SingleUseCouponSerializer(BaseCouponSerializer):
     """Serializer for creating single-use coupons"""
 
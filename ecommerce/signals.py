@@ -1,9 +1,10 @@
 """Signals for ecommerce models"""
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from courses.models import CourseRun
+from courses.models import Course, CourseRun, Program, ProgramRun
+from ecommerce.api import update_product_sellability, update_sellability_for_objects
 from ecommerce.models import CouponEligibility, Product, ProductVersion
 from hubspot_xpro.task_helpers import sync_hubspot_product
 
@@ -55,3 +56,58 @@ def apply_coupon_on_all_runs(
         CouponEligibility.objects.update_or_create(
             product=instance, coupon_id=coupon_id
         )
+
+
+@receiver(post_save, sender=Product, dispatch_uid="product_sellability_save")
+@receiver(
+    post_save, sender=ProductVersion, dispatch_uid="product_version_sellability_save"
+)
+@receiver(
+    post_delete,
+    sender=ProductVersion,
+    dispatch_uid="product_version_sellability_delete",
+)
+def update_sellability_for_product(sender, instance, **kwargs):  # noqa: ARG001
+    """
+    Recompute the sellability of a product when it or its versions change
+    """
+    product_id = instance.id if sender is Product else instance.product_id
+    update_product_sellability(Product.all_objects.filter(id=product_id))
+
+
+@receiver(post_save, sender=CourseRun, dispatch_uid="course_run_sellability_save")
+@receiver(post_delete, sender=CourseRun, dispatch_uid="course_run_sellability_delete")
+def update_sellability_for_course_run(sender, instance, **kwargs):  # noqa: ARG001
+    """
+    Recompute the sellability of a course run's product, and of its program's product since a
+    program is only sellable while each of its courses has an enrollable run
+    """
+    update_sellability_for_objects(
+        course_run_ids=[instance.id],
+        program_ids=Course.objects.filter(id=instance.course_id).values_list(
+            "program_id", flat=True
+        ),
+    )
+
+
+@receiver(post_save, sender=Course, dispatch_uid="course_sellability_save")
+def update_sellability_for_course(sender, instance, **kwargs):  # noqa: ARG001
+    """
+    Recompute the sellability of the products for a course's runs and program
+    """
+    update_sellability_for_objects(
+        course_run_ids=instance.courseruns.values_list("id", flat=True),
+        program_ids=[instance.program_id],
+    )
+
+
+@receiver(post_save, sender=Program, dispatch_uid="program_sellability_save")
+@receiver(post_save, sender=ProgramRun, dispatch_uid="program_run_sellability_save")
+@receiver(post_delete, sender=ProgramRun, dispatch_uid="program_run_sellability_delete")
+def update_sellability_for_program(sender, instance, **kwargs):  # noqa: ARG001
+    """
+    Recompute the sellability of a program's product when the program or its runs change
+    """
+    update_sellability_for_objects(
+        program_ids=[instance.id if sender is Program else instance.program_id]
+    )
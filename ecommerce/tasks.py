@@ -2,7 +2,10 @@
 
 import logging
 
-from ecommerce.api import clear_and_delete_baskets
+from courses.catalog_cache import bump_catalog_version
+from ecommerce.api import clear_and_delete_baskets, update_product_sellability
+from ecommerce.constants import COUPON_CREATION_PROGRESS_STATE
+from ecommerce.serializers import get_coupon_serializer_class
 from mitxpro.celery import app
 
 log = logging.getLogger(__name__)
@@ -13,4 +16,46 @@ def delete_expired_baskets(self):
     """Deletes the expired baskets"""
     log.info("Task ID: %s", self.request.id)
 
-    clear_and_delete_baskets()
+    return clear_and_delete_baskets()
+
+
+@app.task(acks_late=True)
+def update_all_product_sellability():
+    """
+    Recomputes the sellability of all products, which expires products as enrollment deadlines pass
+
+    Returns:
+        int: The number of products that were updated
+    """
+    updated = update_product_sellability()
+    if updated:
+        # The bulk update doesn't send model signals, so invalidate the cached catalog responses here
+        bump_catalog_version()
+    return updated
+
+
+@app.task(bind=True)
+def create_coupons_in_background(self, coupon_data):
+    """
+    Creates coupons from coupon creation data (as it would be posted to the coupon API), reporting
+    the number of coupons created so far in the task state
+
+    Args:
+        coupon_data (dict): Coupon creation data
+
+    Returns:
+        int: The id of the created CouponPaymentVersion
+    """
+    coupon_serializer = get_coupon_serializer_class(coupon_data)(data=coupon_data)
+    coupon_serializer.is_valid(raise_exception=True)
+
+    def report_progress(num_created, num_total):
+        if self.request.is_eager:
+            return
+        self.update_state(
+            state=COUPON_CREATION_PROGRESS_STATE,
+            meta={"created": num_created, "total": num_total},
+        )
+
+    payment_version = coupon_serializer.save(progress_callback=report_progress)
+    return payment_version.id
@@ -1,6 +1,10 @@
 """Ecommerce Tasks Tests"""
 
+import pytest
+
 from ecommerce import tasks
+from ecommerce.constants import DISCOUNT_TYPE_PERCENT_OFF
+from ecommerce.models import CouponPaymentVersion
 
 
 def test_delete_expired_baskets(mocker):
@@ -11,3 +15,34 @@ def test_delete_expired_baskets(mocker):
 
     tasks.delete_expired_baskets.delay()
     patched_clear_and_delete_baskets.assert_called_once_with()
+
+
+@pytest.mark.parametrize("num_updated", [0, 2])
+def test_update_all_product_sellability(mocker, num_updated):
+    """
+    Test that the sellability of all products is recomputed on task run, and the catalog version is
+    bumped if any product changed
+    """
+    patched_update_product_sellability = mocker.patch(
+        "ecommerce.tasks.update_product_sellability", return_value=num_updated
+    )
+    patched_bump_catalog_version = mocker.patch("ecommerce.tasks.bump_catalog_version")
+
+    assert tasks.update_all_product_sellability.delay().get() == num_updated
+    patched_update_product_sellability.assert_called_once_with()
+    assert patched_bump_catalog_version.call_count == (1 if num_updated else 0)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("discount_type", [DISCOUNT_TYPE_PERCENT_OFF])
+def test_create_coupons_in_background(single_use_coupon_json):
+    """create_coupons_in_background should create the coupons and return the CouponPaymentVersion id"""
+    payment_version_id = tasks.create_coupons_in_background.delay(
+        single_use_coupon_json
+    ).get()
+    payment_version = CouponPaymentVersion.objects.get(id=payment_version_id)
+    assert payment_version.payment.name == single_use_coupon_json["name"]
+    assert (
+        payment_version.couponversion_set.count()
+        == (single_use_coupon_json["num_coupon_codes"])
+    )
@@ -7,6 +7,7 @@ from ecommerce.views import (
     BasketView,
     CheckoutView,
     CompanyViewSet,
+    CouponCreationTaskView,
     CouponListView,
     PromoCouponView,
     OrderFulfillmentView,
@@ -42,6 +43,11 @@ urlpatterns = [
     ),
     path("api/basket/", BasketView.as_view(), name="basket_api"),
     path("api/coupons/", CouponListView.as_view(), name="coupon_api"),
+    path(
+        "api/coupons/tasks/<str:task_id>/",
+        CouponCreationTaskView.as_view(),
+        name="coupon_task_api",
+    ),
     path("api/promo_coupons/", PromoCouponView.as_view(), name="promo_coupons_api"),
     re_path(
         r"^couponcodes/(?P<version_id>[0-9]+)", coupon_code_csv_view, name="coupons_csv"
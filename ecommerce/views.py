@@ -4,9 +4,10 @@ import json
 import logging
 from urllib.parse import urljoin
 
+from celery.result import AsyncResult
 from django.conf import settings
 from django.core.exceptions import PermissionDenied
-from django.db.models import Count, Q, OuterRef, Subquery, Prefetch
+from django.db.models import Q, OuterRef, Subquery, Prefetch
 from django.http import Http404
 from django.shortcuts import render
 from django_filters import rest_framework as filters
@@ -26,7 +27,8 @@ from rest_framework.viewsets import ReadOnlyModelViewSet
 from affiliate.api import get_affiliate_id_from_request
 from b2b_ecommerce.api import fulfill_b2b_order
 from b2b_ecommerce.models import B2BOrder
-from courses.models import Course, CourseRun, Program, ProgramRun
+from courses.catalog_cache import CatalogCacheMixin
+from courses.models import CourseRun, ProgramRun
 from ecommerce.api import (
     complete_order,
     create_or_update_unfulfilled_order,
@@ -37,6 +39,7 @@ from ecommerce.api import (
 )
 from ecommerce.constants import (
     COUPON_ADD_PERMISSION,
+    COUPON_CREATION_PROGRESS_STATE,
     COUPON_UPDATE_PERMISSION,
 )
 from sheets.constants import (
@@ -68,13 +71,14 @@ from ecommerce.serializers import (
     OrderReceiptSerializer,
     ProductSerializer,
     ProgramRunSerializer,
-    PromoCouponSerializer,
     PromoCouponDetailSerializer,
     PromoCouponUpdateSerializer,
-    SingleUseCouponSerializer,
+    get_coupon_serializer_class,
 )
+from ecommerce.tasks import create_coupons_in_background
 from ecommerce.utils import deactivate_coupons, make_checkout_url
 from hubspot_xpro.task_helpers import sync_hubspot_deal
+from mitxpro.celery import app
 from mitxpro.utils import (
     format_datetime_for_filename,
     make_csv_http_response,
@@ -88,7 +92,7 @@ log = logging.getLogger(__name__)
 COUPON_NAME_FILENAME_LIMIT = 20
 
 
-class ProductViewSet(ReadOnlyModelViewSet):
+class ProductViewSet(CatalogCacheMixin, ReadOnlyModelViewSet):
     """API view set for Products"""
 
     authentication_classes = ()
@@ -98,63 +102,12 @@ class ProductViewSet(ReadOnlyModelViewSet):
     filterset_class = ProductFilter
 
     def get_queryset(self):
-        now = now_in_utc()
-        expired_courseruns = CourseRun.objects.filter(
-            enrollment_end__lt=now
-        ).values_list("id", flat=True)
-
-        expired_courses = (
-            Course.objects.annotate(
-                runs=Count("courseruns", filter=~Q(courseruns__in=expired_courseruns))
-            )
-            .filter(runs=0)
-            .values_list("id", flat=True)
-        )
-
-        unused_program_id = (
-            Program.objects.annotate(
-                valid_runs=Count(
-                    "programruns",
-                    filter=Q(programruns__end_date__gt=now)
-                    | Q(programruns__end_date=None),
-                )
-            )
-            .filter(valid_runs=0)
-            .values_list("id", flat=True)
-        )
-
-        expired_programs = (
-            Program.objects.filter(
-                Q(programruns__isnull=True)
-                | Q(id__in=unused_program_id)
-                | Q(courses__in=expired_courses)
-            )
-            .values_list("id", flat=True)
-            .distinct()
-        )
-
-        external_programs = Program.objects.filter(is_external=True).values_list(
-            "id", flat=True
-        )
-        external_course_runs = CourseRun.objects.filter(
-            course__is_external=True
-        ).values_list("id", flat=True)
-
-        unsellable_course_runs = expired_courseruns.union(external_course_runs)
-        unsellable_programs = expired_programs.union(external_programs)
-
+        # Product sellability is maintained by ecommerce.api.update_product_sellability. Products
+        # whose sellable_until has passed are filtered out too, in case the periodic update hasn't
+        # caught up with them yet.
         return (
-            Product.objects.exclude(
-                Q(productversions=None)
-                | (
-                    Q(object_id__in=unsellable_course_runs)
-                    & Q(content_type__model="courserun")
-                )
-                | (
-                    Q(object_id__in=unsellable_programs)
-                    & Q(content_type__model="program")
-                )
-            )
+            Product.objects.filter(is_sellable=True)
+            .filter(Q(sellable_until=None) | Q(sellable_until__gte=now_in_utc()))
             .order_by("programs__title", "course_run__course__title")
             .select_related("content_type")
             .prefetch_related("content_object")
@@ -322,6 +275,29 @@ class BasketView(RetrieveUpdateAPIView):
         return basket
 
 
+class CouponCreationTaskView(APIView):
+    """
+    Admin view for checking the progress of coupons that are being created in the background
+    """
+
+    permission_classes = (HasCouponPermission,)
+    authentication_classes = (SessionAuthentication,)
+
+    def get(self, request, task_id, *args, **kwargs):  # noqa: ARG002
+        """Return the state of a background coupon creation task"""
+        async_result = AsyncResult(task_id, app=app)
+        data = {"task_id": task_id, "state": async_result.state}
+        if async_result.state == COUPON_CREATION_PROGRESS_STATE:
+            data.update(async_result.info)
+        elif async_result.successful():
+            data["payment_version"] = CouponPaymentVersionDetailSerializer(
+                instance=CouponPaymentVersion.objects.get(id=async_result.result)
+            ).data
+        elif async_result.failed():
+            data["error"] = str(async_result.result)
+        return Response(status=status.HTTP_200_OK, data=data)
+
+
 class PromoCouponView(APIView):
     """
     View for promo coupon creation and management
@@ -395,13 +371,19 @@ class CouponListView(APIView):
     authentication_classes = (SessionAuthentication,)
 
     def post(self, request, *args, **kwargs):  # noqa: ARG002
-        """Create coupon(s) and related objects"""
+        """
+        Create coupon(s) and related objects. If "background" is set in the request data, the coupons are
+        created by a Celery task, and the task id is returned so that its progress can be polled.
+        """
         # Determine what kind of coupon this is.
-        if request.data.get("coupon_type") == CouponPaymentVersion.SINGLE_USE:
-            coupon_serializer = SingleUseCouponSerializer(data=request.data)
-        else:
-            coupon_serializer = PromoCouponSerializer(data=request.data)
+        coupon_serializer = get_coupon_serializer_class(request.data)(data=request.data)
         if coupon_serializer.is_valid():
+            if request.data.get("background"):
+                async_result = create_coupons_in_background.delay(dict(request.data))
+                return Response(
+                    status=status.HTTP_202_ACCEPTED,
+                    data={"task_id": async_result.id},
+                )
             payment_version = coupon_serializer.save()
             return Response(
                 status=status.HTTP_200_OK,
@@ -1115,6 +1115,50 @@ def test_post_singleuse_coupons(admin_drf_client, single_use_coupon_json):
     )
 
 
+@pytest.mark.parametrize("discount_type", [DISCOUNT_TYPE_PERCENT_OFF])
+def test_post_singleuse_coupons_background(
+    mocker, admin_drf_client, single_use_coupon_json
+):
+    """Coupons should be created by a Celery task if the request asks for background creation"""
+    patched_task = mocker.patch("ecommerce.views.create_coupons_in_background")
+    patched_task.delay.return_value.id = "task-id"
+    data = {**single_use_coupon_json, "background": True}
+    resp = admin_drf_client.post(reverse("coupon_api"), type="json", data=data)
+    assert resp.status_code == status.HTTP_202_ACCEPTED
+    assert resp.json() == {"task_id": "task-id"}
+    patched_task.delay.assert_called_once()
+    assert not CouponPaymentVersion.objects.exists()
+
+
+@pytest.mark.parametrize("state", ["PROGRESS", "SUCCESS", "FAILURE"])
+def test_coupon_creation_task_status(mocker, admin_drf_client, state):
+    """The coupon creation task view should report the progress and result of the task"""
+    payment_version = CouponPaymentVersionFactory.create()
+    mocker.patch(
+        "ecommerce.views.AsyncResult",
+        return_value=mocker.Mock(
+            state=state,
+            info={"created": 5, "total": 10},
+            result=payment_version.id if state == "SUCCESS" else "boom",
+            successful=mocker.Mock(return_value=state == "SUCCESS"),
+            failed=mocker.Mock(return_value=state == "FAILURE"),
+        ),
+    )
+    resp = admin_drf_client.get(
+        reverse("coupon_task_api", kwargs={"task_id": "task-id"})
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    resp_data = resp.json()
+    assert resp_data["state"] == state
+    if state == "PROGRESS":
+        assert resp_data["created"] == 5
+        assert resp_data["total"] == 10
+    elif state == "SUCCESS":
+        assert resp_data["payment_version"]["id"] == payment_version.id
+    else:
+        assert resp_data["error"] == "boom"
+
+
 @pytest.mark.parametrize(
     "discount_type",
     (DISCOUNT_TYPE_DOLLARS_OFF, DISCOUNT_TYPE_PERCENT_OFF),  # noqa: PT007
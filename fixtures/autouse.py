@@ -2,8 +2,32 @@
 
 import pytest
 
+from compliance.api import clear_cybersource_client_cache as clear_cybersource_clients
+
 
 @pytest.fixture(autouse=True)
 def disable_hubspot_api(settings):
     """Disable Hubspot API by default for tests"""
     settings.MITOL_HUBSPOT_API_PRIVATE_TOKEN = None
+
+
+@pytest.fixture(autouse=True)
+def disable_api_caches(settings):
+    """Disable the catalog API, user enrollments and certificate page caches by default for tests"""
+    settings.CATALOG_API_CACHE_ENABLED = False
+    settings.USER_ENROLLMENTS_CACHE_ENABLED = False
+    settings.CERTIFICATE_PAGE_CACHE_ENABLED = False
+
+
+@pytest.fixture(autouse=True)
+def disable_blocklist_probe(settings):
+    """Query the blocklist directly by default for tests, since the in-memory copy is only reloaded on commit"""
+    settings.BLOCKLIST_PROBE_ENABLED = False
+
+
+@pytest.fixture(autouse=True)
+def clear_cybersource_client_cache():
+    """Discard CyberSource clients between tests, since each test mocks its own WSDL"""
+    clear_cybersource_clients()
+    yield
+    clear_cybersource_clients()
@@ -1,12 +1,14 @@
 """Generate Hubspot message bodies for various model objects"""
 
+import json
 import logging
 import re
 from decimal import Decimal
 
+import requests
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.db import IntegrityError, transaction
-from django.db.models import Q
 from hubspot.crm.objects import SimplePublicObject, SimplePublicObjectInput
 from mitol.hubspot_api.api import (
     HubspotApi,
@@ -204,12 +206,11 @@ def sync_contact_hubspot_ids_to_db():
     )
     content_type = ContentType.objects.get_for_model(User)
     for contact in contacts:
-        user = User.objects.filter(email__iexact=contact.properties["email"]).first()
+        user = User.objects.by_email(contact.properties["email"]).first()
         if not user and contact.properties["hs_additional_emails"]:
-            alt_email_q = Q()
-            for alt_email in contact.properties["hs_additional_emails"].split(";"):
-                alt_email_q |= Q(email__iexact=alt_email)
-            user = User.objects.filter(alt_email_q).first()
+            user = User.objects.by_emails(
+                contact.properties["hs_additional_emails"].split(";")
+            ).first()
         if user:
             # Skip if this hubspot_id is already mapped to a different user
             existing = (
@@ -673,6 +674,30 @@ def sync_contact_with_hubspot(user_id: int) -> SimplePublicObject:
     )
 
 
+def submit_create_user_form(email: str, hutk: str | None = None):
+    """
+    Create a hubspot contact using the hubspot Forms API
+
+    Args:
+        email(str): The user's email
+        hutk(str): The value of the user's hubspotutk cookie, if any
+    """
+    portal_id = settings.HUBSPOT_CONFIG.get("HUBSPOT_PORTAL_ID")
+    form_id = settings.HUBSPOT_CONFIG.get("HUBSPOT_CREATE_USER_FORM_ID")
+
+    headers = {"Content-Type": "application/x-www-form-urlencoded"}
+
+    data = {"email": email}
+
+    if hutk:
+        data["hs_context"] = json.dumps({"hutk": hutk})
+
+    url = f"https://forms.hubspot.com/uploads/form/v2/{portal_id}/{form_id}?&"
+
+    response = requests.post(url=url, data=data, headers=headers)  # noqa: S113
+    response.raise_for_status()
+
+
 MODEL_FUNCTION_MAPPING = {
     "user": make_contact_sync_message,
     "order": make_deal_sync_message,
@@ -165,6 +165,26 @@ def test_sync_contact_with_hubspot(mock_hubspot_api):
     )
 
 
+@pytest.mark.parametrize("hutk", [None, "somefakedata"])
+def test_submit_create_user_form(mocker, settings, hutk):
+    """Test that submit_create_user_form posts the user's email and hubspotutk cookie to the Forms API"""
+    settings.HUBSPOT_CONFIG["HUBSPOT_PORTAL_ID"] = "123456"
+    settings.HUBSPOT_CONFIG["HUBSPOT_CREATE_USER_FORM_ID"] = "abcdefg"
+    mock_post = mocker.patch("hubspot_xpro.api.requests.post")
+
+    api.submit_create_user_form("test@test.co", hutk=hutk)
+
+    mock_post.assert_called_once_with(
+        url="https://forms.hubspot.com/uploads/form/v2/123456/abcdefg?&",
+        data={
+            "email": "test@test.co",
+            **({"hs_context": '{"hutk": "somefakedata"}'} if hutk else {}),
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    mock_post.return_value.raise_for_status.assert_called_once_with()
+
+
 def test_sync_product_with_hubspot(mock_hubspot_api):
     """Test that the hubspot CRM API is called properly for a product sync"""
     product = ProductVersionFactory.create().product
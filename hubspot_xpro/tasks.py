@@ -174,6 +174,18 @@ def sync_contact_with_hubspot(user_id: int) -> str:
     return api.sync_contact_with_hubspot(user_id).id
 
 
+@app.task(acks_late=True)
+def submit_create_user_form(email: str, hutk: str | None = None):
+    """
+    Create a hubspot contact for a new user using the hubspot Forms API
+
+    Args:
+        email(str): The user's email
+        hutk(str): The value of the user's hubspotutk cookie, if any
+    """
+    api.submit_create_user_form(email, hutk=hutk)
+
+
 @app.task(
     acks_late=True,
     autoretry_for=(BlockingIOError, TooManyRequestsException),
@@ -404,10 +416,11 @@ def batch_create_hubspot_objects_chunked(
                 try:
                     if ct_model_name == "user":
                         try:
-                            object_id = User.objects.get(
-                                email__iexact=result.properties["email"],
-                                is_active=True,
-                            ).id
+                            object_id = (
+                                User.objects.by_email(result.properties["email"])
+                                .get(is_active=True)
+                                .id
+                            )
                         except (User.DoesNotExist, User.MultipleObjectsReturned):
                             log.exception(
                                 "Could not resolve a unique active user for hubspot "
@@ -61,3 +61,26 @@ class TimestampedModelAdmin(admin.ModelAdmin):
     def get_exclude(self, request, obj=None):
         exclude = tuple(super().get_exclude(request, obj=obj) or ())
         return self._join_and_dedupe(exclude, ("created_on", "updated_on"))
+
+
+class AuditModelAdmin(TimestampedModelAdmin):
+    """
+    A ModelAdmin for audit models, which shows the data before and after the change for records that
+    only store a diff
+    """
+
+    @admin.display(description="Data before")
+    def get_data_before(self, obj):
+        """Returns the serialized object before the change"""
+        return obj.get_data_before()
+
+    @admin.display(description="Data after")
+    def get_data_after(self, obj):
+        """Returns the serialized object after the change"""
+        return obj.get_data_after()
+
+    def get_readonly_fields(self, request, obj=None):
+        return self._join_and_dedupe(
+            tuple(super().get_readonly_fields(request, obj=obj)),
+            ("get_data_before", "get_data_after"),
+        )
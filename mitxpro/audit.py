@@ -0,0 +1,336 @@
+"""
+Storage for audit records.
+
+An audit record stores an object as it was serialized before and after a change. Consecutive changes to an
+object only store both snapshots in full once every AUDIT_CHECKPOINT_INTERVAL records: the records in
+between link to that record (their checkpoint), and only store how their data_after differs from the
+checkpoint's data_after. Their data_before is the data_after of the record before them. A hash of each
+record's data_after is kept to tell whether a change follows on from the object's last record. If it
+doesn't (e.g. the object was saved without being audited), a new checkpoint is written.
+
+Records older than a few months can be compacted into diffs, or archived to a file and deleted, one
+calendar month at a time with the compact_audits management command.
+"""
+
+import gzip
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+AUDIT_UPDATE_FIELDS = [
+    "data_before",
+    "data_after",
+    "data_diff",
+    "data_hash",
+    "checkpoint",
+    "checkpoint_distance",
+]
+
+
+def get_audit_data_hash(data):
+    """
+    Returns a hash of an audited object's serialized data
+
+    Args:
+        data (dict or None): The serialized object
+
+    Returns:
+        str: The hash
+    """
+    return hashlib.md5(  # noqa: S324
+        json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder).encode("utf-8")
+    ).hexdigest()
+
+
+def get_audit_diff(base, data):
+    """
+    Returns the difference between two serialized versions of an object
+
+    Args:
+        base (dict): The serialized object which the diff is applied to
+        data (dict): The serialized object which the diff produces
+
+    Returns:
+        dict: The keys which were set or changed, and the keys which were removed
+    """
+    return {
+        "set": {
+            key: value
+            for key, value in data.items()
+            if key not in base or base[key] != value
+        },
+        "unset": [key for key in base if key not in data],
+    }
+
+
+def apply_audit_diff(base, diff):
+    """
+    Applies a diff from get_audit_diff to a serialized object
+
+    Args:
+        base (dict): The serialized object which the diff was made against
+        diff (dict): The diff
+
+    Returns:
+        dict: The serialized object which the diff was made from
+    """
+    unset = set(diff["unset"])
+    return {
+        **{key: value for key, value in base.items() if key not in unset},
+        **diff["set"],
+    }
+
+
+def _get_related_attname(audit_class):
+    """Returns the name of the column which links an audit model to the audited model"""
+    return audit_class._meta.get_field(  # noqa: SLF001
+        audit_class.get_related_field_name()
+    ).attname
+
+
+def build_audits(audit_class, changes, acting_user):
+    """
+    Builds the audit records for some changes, reading the last record of each object in one query
+
+    Args:
+        audit_class (class of AuditModel): The audit model
+        changes (list of (AuditableModel, dict, dict)):
+            The changed objects, along with their serialized data before and after the change
+        acting_user (User): The user who made the changes. May be None if inapplicable.
+
+    Returns:
+        list of AuditModel: The unsaved audit records
+    """
+    related_attname = _get_related_attname(audit_class)
+    latest_audits = {
+        getattr(audit, related_attname): audit
+        for audit in audit_class.objects.filter(
+            id__in=audit_class.objects.filter(
+                **{f"{related_attname}__in": {obj.pk for obj, _, _ in changes}}
+            )
+            .order_by(related_attname, "-id")
+            .distinct(related_attname)
+            .values("id")
+        ).select_related("checkpoint")
+    }
+
+    audits = []
+    for obj, data_before, data_after in changes:
+        audit = audit_class(
+            acting_user=acting_user,
+            data_hash=get_audit_data_hash(data_after),
+            **{related_attname: obj.pk},
+        )
+        # an object which is changed more than once here gets a checkpoint for each later change, since
+        # the records for the earlier changes don't have ids yet
+        previous = latest_audits.pop(obj.pk, None)
+        if (
+            previous is not None
+            and data_before is not None
+            and previous.checkpoint_distance < settings.AUDIT_CHECKPOINT_INTERVAL
+            and previous.data_hash == get_audit_data_hash(data_before)
+        ):
+            checkpoint = previous.checkpoint or previous
+            audit.checkpoint = checkpoint
+            audit.checkpoint_distance = previous.checkpoint_distance + 1
+            audit.data_diff = get_audit_diff(checkpoint.data_after, data_after)
+        else:
+            audit.data_before = data_before
+            audit.data_after = data_after
+        audits.append(audit)
+    return audits
+
+
+def get_audit_months(audit_class, before):
+    """
+    Returns the calendar months which have audit records created before a date
+
+    Args:
+        audit_class (class of AuditModel): The audit model
+        before (datetime): The date, which should be the start of a month
+
+    Returns:
+        list of datetime: The start of each month, in order
+    """
+    created_ons = audit_class.objects.filter(created_on__lt=before).values_list(
+        "created_on", flat=True
+    )
+    first_created_on = created_ons.order_by("created_on").first()
+    if first_created_on is None:
+        return []
+    months = []
+    month = get_month_start(first_created_on)
+    while month < before:
+        if created_ons.filter(
+            created_on__gte=month, created_on__lt=get_next_month_start(month)
+        ).exists():
+            months.append(month)
+        month = get_next_month_start(month)
+    return months
+
+
+def get_month_start(date):
+    """Returns the start of the calendar month of a date"""
+    return date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def get_next_month_start(date):
+    """Returns the start of the calendar month after the month of a date"""
+    month_start = get_month_start(date)
+    if month_start.month == 12:  # noqa: PLR2004
+        return month_start.replace(year=month_start.year + 1, month=1)
+    return month_start.replace(month=month_start.month + 1)
+
+
+def compact_audits(audit_class, month):
+    """
+    Rewrites the full audit records created in a month as diffs, where they follow on from the record
+    before them for the same object
+
+    Args:
+        audit_class (class of AuditModel): The audit model
+        month (datetime): The start of the month
+
+    Returns:
+        int: The number of records which were rewritten as diffs
+    """
+    related_attname = _get_related_attname(audit_class)
+    month_audits = audit_class.objects.filter(
+        created_on__gte=month, created_on__lt=get_next_month_start(month)
+    )
+    referenced_ids = set(
+        audit_class.objects.filter(checkpoint__in=month_audits)
+        .values_list("checkpoint_id", flat=True)
+        .distinct()
+    )
+
+    compacted = 0
+    updated_audits = []
+    related_id = checkpoint = previous_data_after = None
+    distance = 0
+    with transaction.atomic():
+        for audit in (
+            month_audits.exclude(**{f"{related_attname}__isnull": True})
+            .select_related("checkpoint")
+            .order_by(related_attname, "id")
+            .iterator(chunk_size=settings.AUDIT_COMPACT_BATCH_SIZE)
+        ):
+            if getattr(audit, related_attname) != related_id:
+                related_id = getattr(audit, related_attname)
+                checkpoint = previous_data_after = None
+            data_after = audit.get_data_after()
+            if audit.checkpoint_id is not None:
+                # already a diff, which the following records can continue from
+                checkpoint = audit.checkpoint
+                distance = audit.checkpoint_distance
+            elif (
+                checkpoint is not None
+                and audit.id not in referenced_ids
+                and distance < settings.AUDIT_CHECKPOINT_INTERVAL
+                and audit.data_before is not None
+                and get_audit_data_hash(audit.data_before)
+                == get_audit_data_hash(previous_data_after)
+            ):
+                distance += 1
+                audit.checkpoint = checkpoint
+                audit.checkpoint_distance = distance
+                audit.data_diff = get_audit_diff(checkpoint.data_after, data_after)
+                audit.data_before = audit.data_after = None
+                audit.data_hash = get_audit_data_hash(data_after)
+                updated_audits.append(audit)
+                compacted += 1
+            else:
+                checkpoint = audit
+                distance = 0
+                if audit.data_hash is None:
+                    # records from before hashes were kept
+                    audit.data_hash = get_audit_data_hash(data_after)
+                    updated_audits.append(audit)
+            previous_data_after = data_after
+
+        audit_class.objects.bulk_update(
+            updated_audits,
+            AUDIT_UPDATE_FIELDS,
+            batch_size=settings.AUDIT_COMPACT_BATCH_SIZE,
+        )
+    return compacted
+
+
+def archive_audits(audit_class, month, path):
+    """
+    Writes the audit records created in a month to a gzipped JSON lines file, then deletes them. Later
+    records which store a diff against one of the deleted records are rewritten in full.
+
+    Args:
+        audit_class (class of AuditModel): The audit model
+        month (datetime): The start of the month
+        path (str): The path of the file, which must not exist yet
+
+    Returns:
+        int: The number of records which were archived
+    """
+    related_attname = _get_related_attname(audit_class)
+    month_audits = audit_class.objects.filter(
+        created_on__gte=month, created_on__lt=get_next_month_start(month)
+    )
+
+    archived = 0
+    related_id = previous_data_after = None
+    with transaction.atomic(), gzip.open(path, "xt", encoding="utf-8") as archive:
+        for audit in (
+            month_audits.select_related("checkpoint")
+            .order_by(related_attname, "id")
+            .iterator(chunk_size=settings.AUDIT_COMPACT_BATCH_SIZE)
+        ):
+            data_after = audit.get_data_after()
+            if audit.checkpoint_id is None:
+                data_before = audit.data_before
+            elif (
+                related_id is not None and getattr(audit, related_attname) == related_id
+            ):
+                data_before = previous_data_after
+            else:
+                # the record before this one is in an earlier month
+                data_before = audit.get_data_before()
+            archive.write(
+                json.dumps(
+                    {
+                        "id": audit.id,
+                        related_attname: getattr(audit, related_attname),
+                        "acting_user_id": audit.acting_user_id,
+                        "created_on": audit.created_on,
+                        "data_before": data_before,
+                        "data_after": data_after,
+                    },
+                    cls=DjangoJSONEncoder,
+                )
+                + "\n"
+            )
+            related_id = getattr(audit, related_attname)
+            previous_data_after = data_after
+            archived += 1
+
+        dependent_audits = list(
+            audit_class.objects.filter(checkpoint__in=month_audits)
+            .exclude(id__in=month_audits.values("id"))
+            .select_related("checkpoint")
+        )
+        for audit in dependent_audits:
+            audit.data_before = audit.get_data_before()
+        for audit in dependent_audits:
+            audit.data_after = audit.get_data_after()
+            audit.data_hash = get_audit_data_hash(audit.data_after)
+            audit.data_diff = audit.checkpoint = None
+            audit.checkpoint_distance = 0
+        audit_class.objects.bulk_update(
+            dependent_audits,
+            AUDIT_UPDATE_FIELDS,
+            batch_size=settings.AUDIT_COMPACT_BATCH_SIZE,
+        )
+
+        month_audits.update(checkpoint=None)
+        month_audits.delete()
+    return archived
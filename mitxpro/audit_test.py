@@ -0,0 +1,154 @@
+"""Tests for audit record storage"""
+
+import gzip
+import json
+from datetime import timedelta
+
+import pytest
+
+from courses.factories import CourseRunGradeFactory
+from courses.models import CourseRunGrade, CourseRunGradeAudit
+from mitxpro import audit
+from mitxpro.utils import now_in_utc
+
+pytestmark = pytest.mark.django_db
+
+
+def save_grades(course_run_grade, grades):
+    """Saves a course run grade with each grade in turn, and returns the serialized grade after each save"""
+    serialized = []
+    for grade in grades:
+        course_run_grade.grade = grade
+        course_run_grade.save_and_log(None)
+        serialized.append(course_run_grade.to_dict())
+    return serialized
+
+
+def get_audits(course_run_grade):
+    """Returns the audit records for a course run grade in order"""
+    return list(
+        CourseRunGradeAudit.objects.filter(course_run_grade=course_run_grade).order_by(
+            "id"
+        )
+    )
+
+
+def test_audit_diff():
+    """Applying a diff to the object it was made against should produce the other object"""
+    base = {"a": 1, "b": [1, 2], "c": None}
+    data = {"a": 1, "b": [1, 3], "d": "new"}
+    diff = audit.get_audit_diff(base, data)
+    assert diff == {"set": {"b": [1, 3], "d": "new"}, "unset": ["c"]}
+    assert audit.apply_audit_diff(base, diff) == data
+
+
+def test_save_and_log_diffs(settings):
+    """Consecutive changes should be stored as diffs against a checkpoint, up to the checkpoint interval"""
+    settings.AUDIT_CHECKPOINT_INTERVAL = 2
+    course_run_grade = CourseRunGradeFactory.create(grade=0.1)
+    before = course_run_grade.to_dict()
+    afters = save_grades(course_run_grade, [0.2, 0.3, 0.4, 0.5])
+
+    audits = get_audits(course_run_grade)
+    assert [audit_record.checkpoint_id for audit_record in audits] == [
+        None,
+        audits[0].id,
+        audits[0].id,
+        None,
+    ]
+    assert audits[1].data_before is None
+    assert audits[1].data_after is None
+    assert audits[1].data_diff["set"]["grade"] == 0.3  # noqa: PLR2004
+    for audit_record, data_before, data_after in zip(audits, [before, *afters], afters):
+        assert audit_record.get_data_before() == data_before
+        assert audit_record.get_data_after() == data_after
+
+
+def test_save_and_log_unaudited_change():
+    """A change which doesn't follow on from the last audit record should be stored as a checkpoint"""
+    course_run_grade = CourseRunGradeFactory.create(grade=0.1)
+    save_grades(course_run_grade, [0.2])
+    course_run_grade.letter_grade = "Z"
+    course_run_grade.save()
+    save_grades(course_run_grade, [0.3])
+
+    audits = get_audits(course_run_grade)
+    assert [audit_record.checkpoint_id for audit_record in audits] == [None, None]
+    assert audits[1].data_before["letter_grade"] == "Z"
+
+
+def test_save_and_log_many_diffs():
+    """save_and_log_many should store diffs against the records which save_and_log wrote"""
+    course_run_grades = CourseRunGradeFactory.create_batch(2, grade=0.1)
+    for course_run_grade in course_run_grades:
+        save_grades(course_run_grade, [0.2])
+        course_run_grade.grade = 0.3
+
+    CourseRunGrade.save_and_log_many(course_run_grades, None)
+
+    for course_run_grade in course_run_grades:
+        first_audit, second_audit = get_audits(course_run_grade)
+        assert second_audit.checkpoint_id == first_audit.id
+        assert second_audit.get_data_before()["grade"] == 0.2  # noqa: PLR2004
+        assert second_audit.get_data_after()["grade"] == 0.3  # noqa: PLR2004
+
+
+def test_compact_audits():
+    """Full audit records which follow on from each other in a month should be rewritten as diffs"""
+    course_run_grade = CourseRunGradeFactory.create(grade=0.1)
+    before = course_run_grade.to_dict()
+    afters = save_grades(course_run_grade, [0.2, 0.3, 0.4])
+    # records written before diffs were stored
+    CourseRunGradeAudit.objects.update(
+        checkpoint=None, data_diff=None, data_hash=None, checkpoint_distance=0
+    )
+    for audit_record, data_before, data_after in zip(
+        get_audits(course_run_grade), [before, *afters], afters
+    ):
+        CourseRunGradeAudit.objects.filter(id=audit_record.id).update(
+            data_before=data_before, data_after=data_after
+        )
+
+    month = audit.get_month_start(now_in_utc())
+    assert audit.compact_audits(CourseRunGradeAudit, month) == 2  # noqa: PLR2004
+
+    audits = get_audits(course_run_grade)
+    assert [audit_record.checkpoint_id for audit_record in audits] == [
+        None,
+        audits[0].id,
+        audits[0].id,
+    ]
+    assert all(audit_record.data_hash for audit_record in audits)
+    for audit_record, data_before, data_after in zip(audits, [before, *afters], afters):
+        assert audit_record.get_data_before() == data_before
+        assert audit_record.get_data_after() == data_after
+
+
+def test_archive_audits(tmp_path):
+    """Archiving a month should write its records to a file and delete them, keeping later records whole"""
+    course_run_grade = CourseRunGradeFactory.create(grade=0.1)
+    before = course_run_grade.to_dict()
+    afters = save_grades(course_run_grade, [0.2, 0.3, 0.4, 0.5])
+    archived_audits = get_audits(course_run_grade)[:2]
+    month = audit.get_month_start(now_in_utc() - timedelta(days=40))
+    CourseRunGradeAudit.objects.filter(
+        id__in=[audit_record.id for audit_record in archived_audits]
+    ).update(created_on=month)
+
+    path = tmp_path / "audits.jsonl.gz"
+    assert audit.archive_audits(CourseRunGradeAudit, month, path) == 2  # noqa: PLR2004
+
+    with gzip.open(path, "rt") as archive:
+        archived = [json.loads(line) for line in archive]
+    assert [record["id"] for record in archived] == [
+        audit_record.id for audit_record in archived_audits
+    ]
+    assert [record["data_before"] for record in archived] == [before, afters[0]]
+    assert [record["data_after"] for record in archived] == afters[:2]
+
+    audits = get_audits(course_run_grade)
+    assert len(audits) == 2  # noqa: PLR2004
+    assert audits[0].checkpoint_id is None
+    assert audits[0].get_data_before() == afters[1]
+    for audit_record, data_after in zip(audits, afters[2:]):
+        assert audit_record.get_data_after() == data_after
@@ -0,0 +1,116 @@
+"""
+Compacts or archives old audit records, one calendar month at a time
+"""
+
+import os
+from argparse import RawTextHelpFormatter
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from mitxpro.audit import (
+    archive_audits,
+    compact_audits,
+    get_audit_months,
+    get_month_start,
+)
+from mitxpro.models import AuditModel
+from mitxpro.utils import now_in_utc
+
+
+class Command(BaseCommand):
+    """
+    Compacts or archives old audit records, one calendar month at a time
+    """
+
+    help = """
+    Rewrites full audit records as diffs against the records before them, for every month before the last
+    few months. For all audit models, with the default number of months:\n
+    `./manage.py compact_audits`
+
+    For some audit models, leaving the last 12 months alone:\n
+    `./manage.py compact_audits --model ecommerce.OrderAudit --months 12`
+
+    To write the records to a gzipped JSON lines file per model and month in a directory and delete them
+    instead, use --archive-dir:\n
+    `./manage.py compact_audits --months 24 --archive-dir /path/to/archive`
+    """
+
+    def create_parser(self, prog_name, subcommand):
+        """
+        Create parser to add new line in help text.
+        """
+        parser = super().create_parser(prog_name, subcommand)
+        parser.formatter_class = RawTextHelpFormatter
+        return parser
+
+    def add_arguments(self, parser):
+        """Parse arguments"""
+        parser.add_argument(
+            "--model",
+            action="append",
+            default=[],
+            dest="models",
+            help="An audit model to process, as app_label.ModelName. Defaults to all audit models.",
+        )
+        parser.add_argument(
+            "--months",
+            type=int,
+            default=settings.AUDIT_COMPACT_AFTER_MONTHS,
+            help="The number of whole months before the current one to leave alone",
+        )
+        parser.add_argument(
+            "--archive-dir",
+            dest="archive_dir",
+            help="If provided, records are archived to files in this directory and deleted",
+        )
+
+    def get_audit_classes(self, model_labels):
+        """Returns the audit models to process"""
+        if not model_labels:
+            return [
+                model for model in apps.get_models() if issubclass(model, AuditModel)
+            ]
+        audit_classes = []
+        for model_label in model_labels:
+            try:
+                model = apps.get_model(model_label)
+            except (LookupError, ValueError) as exc:
+                raise CommandError(f"Unknown model {model_label}") from exc  # noqa: EM102
+            if not issubclass(model, AuditModel):
+                raise CommandError(f"{model_label} is not an audit model")  # noqa: EM102
+            audit_classes.append(model)
+        return audit_classes
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        """Run the command"""
+        audit_classes = self.get_audit_classes(options["models"])
+        archive_dir = options["archive_dir"]
+        if archive_dir and not os.path.isdir(archive_dir):  # noqa: PTH112
+            raise CommandError(f"{archive_dir} is not a directory")  # noqa: EM102
+
+        before = get_month_start(now_in_utc())
+        for _ in range(options["months"]):
+            before = get_month_start(before - timedelta(days=1))
+
+        for audit_class in audit_classes:
+            label = audit_class._meta.label  # noqa: SLF001
+            for month in get_audit_months(audit_class, before):
+                month_label = month.strftime("%Y-%m")
+                if archive_dir:
+                    path = os.path.join(  # noqa: PTH118
+                        archive_dir,
+                        f"{audit_class._meta.label_lower}-{month_label}.jsonl.gz",  # noqa: SLF001
+                    )
+                    archived = archive_audits(audit_class, month, path)
+                    self.stdout.write(
+                        f"{label} {month_label}: archived {archived} records to {path}"
+                    )
+                else:
+                    compacted = compact_audits(audit_class, month)
+                    self.stdout.write(
+                        f"{label} {month_label}: compacted {compacted} records"
+                    )
+        self.stdout.write(self.style.SUCCESS("Done"))
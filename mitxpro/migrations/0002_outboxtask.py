@@ -0,0 +1,61 @@
+# Generated by Django 5.2.17 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+import mitxpro.utils
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("mitxpro", "0001_create_default_robots_txt"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxTask",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True)),
+                ("updated_on", models.DateTimeField(auto_now=True)),
+                ("task_name", models.CharField(max_length=255)),
+                ("args", models.JSONField(blank=True, default=list)),
+                ("kwargs", models.JSONField(blank=True, default=dict)),
+                (
+                    "idempotency_key",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                (
+                    "available_on",
+                    models.DateTimeField(
+                        blank=True, default=mitxpro.utils.now_in_utc, null=True
+                    ),
+                ),
+                ("last_error", models.TextField(blank=True, default="")),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("available_on__isnull", False)),
+                        fields=("idempotency_key",),
+                        name="outbox_task_pending_idempotency_key",
+                    )
+                ],
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("available_on__isnull", False)),
+                        fields=["available_on"],
+                        name="outbox_task_available_on_idx",
+                    )
+                ],
+            },
+        ),
+    ]
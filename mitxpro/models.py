@@ -4,6 +4,7 @@ Common model classes
 
 import copy
 from collections.abc import Iterable
+from decimal import Decimal
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
@@ -14,10 +15,12 @@ from django.db.models import (
     ForeignKey,
     Manager,
     Model,
+    Q,
     prefetch_related_objects,
 )
 from django.db.models.query import QuerySet
 
+from mitxpro.audit import apply_audit_diff, build_audits
 from mitxpro.utils import now_in_utc
 
 
@@ -69,11 +72,21 @@ class TimestampedModel(Model):
 
 
 class AuditModel(TimestampedModel):
-    """An abstract base class for audit models"""
+    """
+    An abstract base class for audit models. Records which link to a checkpoint only store a diff of
+    data_after, see mitxpro.audit.
+    """
 
+    created_on = DateTimeField(auto_now_add=True, db_index=True)  # UTC
     acting_user = ForeignKey(settings.AUTH_USER_MODEL, null=True, on_delete=PROTECT)
     data_before = models.JSONField(blank=True, null=True)
     data_after = models.JSONField(blank=True, null=True)
+    data_diff = models.JSONField(blank=True, null=True)
+    data_hash = models.CharField(max_length=32, blank=True, null=True)  # noqa: DJ001
+    checkpoint = ForeignKey(
+        "self", null=True, blank=True, on_delete=PROTECT, related_name="+"
+    )
+    checkpoint_distance = models.PositiveIntegerField(default=0)
 
     class Meta:
         abstract = True
@@ -86,6 +99,34 @@ class AuditModel(TimestampedModel):
         """
         raise NotImplementedError
 
+    def get_data_after(self):
+        """
+        Returns:
+            dict: The serialized object after the change
+        """
+        if self.checkpoint_id is None:
+            return self.data_after
+        return apply_audit_diff(self.checkpoint.data_after, self.data_diff)
+
+    def get_data_before(self):
+        """
+        Returns:
+            dict: The serialized object before the change
+        """
+        if self.checkpoint_id is None:
+            return self.data_before
+        previous = (
+            type(self)
+            .objects.filter(
+                Q(id=self.checkpoint_id) | Q(checkpoint_id=self.checkpoint_id),
+                id__lt=self.id,
+            )
+            .select_related("checkpoint")
+            .order_by("-id")
+            .first()
+        )
+        return previous.get_data_after()
+
 
 class AuditableModel(Model):
     """An abstract base class for auditable models"""
@@ -138,12 +179,86 @@ class AuditableModel(Model):
         if before_obj is not None:
             before_dict = before_obj.to_dict()
 
-        audit_kwargs = dict(  # noqa: C408
-            acting_user=acting_user, data_before=before_dict, data_after=self.to_dict()
+        [audit] = build_audits(
+            self.get_audit_class(),
+            [(self, before_dict, self.to_dict())],
+            acting_user,
+        )
+        audit.save()
+
+    @classmethod
+    @transaction.atomic
+    def save_and_log_many(cls, objs, acting_user, fields=None, batch_size=None):
+        """
+        Saves existing objects with a bulk update and creates an audit object for each of them. Unlike
+        save_and_log, this doesn't call save() or send the pre_save/post_save signals.
+
+        Args:
+            objs (iterable of AuditableModel): The objects to save, which must already exist
+            acting_user (User):
+                The user who made the change to the models. May be None if inapplicable.
+            fields (list of str): The fields to update. Defaults to every field except the primary key.
+                Fields with auto_now set are always updated.
+            batch_size (int): The number of objects to update or audit objects to create per query
+
+        Returns:
+            list of AuditModel: The audit objects which were created
+        """
+        objs = list(objs)
+        if not objs:
+            return []
+        if any(obj.pk is None for obj in objs):
+            raise ValueError("save_and_log_many can only save existing objects")  # noqa: EM101
+
+        concrete_fields = [
+            field for field in cls._meta.concrete_fields if not field.primary_key
+        ]
+        update_fields = [
+            field
+            for field in concrete_fields
+            if fields is None
+            or field.name in fields
+            or getattr(field, "auto_now", False)
+        ]
+
+        before_objs = cls.objects_for_audit().in_bulk([obj.pk for obj in objs])
+        before_dicts = {}
+        for obj in objs:
+            before_obj = before_objs.get(obj.pk)
+            if before_obj is None:
+                continue
+            # reuse the related objects which were already loaded, unless they changed
+            for field in concrete_fields:
+                if (
+                    field.is_relation
+                    and field.is_cached(obj)
+                    and getattr(before_obj, field.attname)
+                    == getattr(obj, field.attname)
+                ):
+                    field.set_cached_value(before_obj, field.get_cached_value(obj))
+            before_dicts[obj.pk] = before_obj.to_dict()
+
+        for obj in objs:
+            for field in update_fields:
+                value = field.pre_save(obj, add=False)
+                # normalize the value the same way it would be if it were refetched
+                value = field.to_python(value)
+                if isinstance(field, models.DecimalField) and value is not None:
+                    value = value.quantize(Decimal(1).scaleb(-field.decimal_places))
+                setattr(obj, field.attname, value)
+        cls.objects_for_audit().bulk_update(
+            objs, [field.name for field in update_fields], batch_size=batch_size
+        )
+
+        audit_class = cls.get_audit_class()
+        return audit_class.objects.bulk_create(
+            build_audits(
+                audit_class,
+                [(obj, before_dicts.get(obj.pk), obj.to_dict()) for obj in objs],
+                acting_user,
+            ),
+            batch_size=batch_size,
         )
-        audit_class = self.get_audit_class()
-        audit_kwargs[audit_class.get_related_field_name()] = self
-        audit_class.objects.create(**audit_kwargs)
 
 
 class SingletonModel(Model):
@@ -244,3 +359,39 @@ class PrefetchGenericQuerySet(QuerySet):
             self._prefetch_generic_related_lookups
         )
         return c
+
+
+class OutboxTask(TimestampedModel):
+    """
+    A celery task which was recorded in the same transaction as the changes that require it.
+    The outbox relay dispatches it once that transaction commits, and retries it until it succeeds
+    (see mitxpro.outbox).
+    """
+
+    task_name = models.CharField(max_length=255)
+    args = models.JSONField(default=list, blank=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+    idempotency_key = models.CharField(max_length=255, null=True, blank=True)  # noqa: DJ001
+    attempts = models.PositiveIntegerField(default=0)
+    # when the task is next due to be dispatched, or null once it has run out of attempts
+    available_on = models.DateTimeField(null=True, blank=True, default=now_in_utc)
+    last_error = models.TextField(blank=True, default="")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["idempotency_key"],
+                condition=models.Q(available_on__isnull=False),
+                name="outbox_task_pending_idempotency_key",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["available_on"],
+                condition=models.Q(available_on__isnull=False),
+                name="outbox_task_available_on_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"OutboxTask task_name={self.task_name} args={self.args} kwargs={self.kwargs}"
@@ -0,0 +1,186 @@
+"""
+Transactional outbox for celery tasks.
+
+A task which is enqueued with enqueue_task is written as an OutboxTask row in the caller's transaction,
+so it's only dispatched if that transaction commits, and it isn't lost if the broker is unavailable.
+Once the transaction commits, the relay claims the tasks that are due and dispatches each one through
+the run_outbox_task celery task. That runs the task in the worker and deletes the row when it succeeds.
+If the task fails, it is retried with an exponential backoff until it runs out of attempts. A task which
+is dispatched but never finishes (e.g. the message was lost) is dispatched again once its lease expires,
+by the periodic relay.
+
+Tasks run through the outbox may run more than once, so they must be idempotent. Tasks enqueued with the
+same idempotency key while one of them is waiting to be dispatched are only run once. By default the key
+is derived from the task name and its arguments, so saving the same object several times in a request
+only dispatches one sync. The relay is registered once per transaction, and publishes each batch over a
+single broker connection.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import traceback
+import weakref
+from datetime import timedelta
+
+from celery import current_app
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from mitxpro.models import OutboxTask
+from mitxpro.utils import now_in_utc
+
+log = logging.getLogger(__name__)
+
+_relay_state = threading.local()
+
+
+def enqueue_task(task, args=(), kwargs=None, *, idempotency_key=None, countdown=None):
+    """
+    Records a celery task in the outbox, to be dispatched once the current transaction (if any) commits
+
+    Args:
+        task (celery.Task): The task to run
+        args (iterable): The positional arguments for the task, which must be JSON serializable
+        kwargs (dict): The keyword arguments for the task, which must be JSON serializable
+        idempotency_key (str): The task isn't recorded again while a task with the same key is waiting to be
+            dispatched. Defaults to a hash of the task name and arguments.
+        countdown (int): The number of seconds to wait before running the task
+    """
+    args = list(args)
+    kwargs = kwargs or {}
+    if idempotency_key is None:
+        idempotency_key = get_default_idempotency_key(task, args, kwargs)
+    available_on = now_in_utc()
+    if countdown:
+        available_on += timedelta(seconds=countdown)
+    OutboxTask.objects.bulk_create(
+        [
+            OutboxTask(
+                task_name=task.name,
+                args=args,
+                kwargs=kwargs,
+                idempotency_key=idempotency_key,
+                available_on=available_on,
+            )
+        ],
+        ignore_conflicts=True,
+    )
+    if not countdown:
+        _relay_on_commit()
+
+
+def get_default_idempotency_key(task, args, kwargs):
+    """
+    Returns an idempotency key for a task which is the same for identical dispatches
+
+    Args:
+        task (celery.Task): The task to run
+        args (list): The positional arguments for the task
+        kwargs (dict): The keyword arguments for the task
+
+    Returns:
+        str: The idempotency key
+    """
+    payload = json.dumps([args, kwargs], sort_keys=True, default=str)
+    return f"{task.name}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+def _relay_on_commit():
+    """Relays the outbox once the current transaction (if any) commits, unless that's already scheduled"""
+    # Django only holds on to the callback until it runs or a rollback discards it, so the weak
+    # reference tells us whether a relay is still pending for the current transaction
+    pending_relay = getattr(_relay_state, "pending_relay", None)
+    if pending_relay is not None and pending_relay() is not None:
+        return
+
+    def _relay():
+        _relay_state.pending_relay = None
+        relay_outbox_tasks()
+
+    _relay_state.pending_relay = weakref.ref(_relay)
+    transaction.on_commit(_relay)
+
+
+def get_outbox_retry_delay(attempts):
+    """
+    Returns how long to wait before retrying a task which has failed
+
+    Args:
+        attempts (int): The number of times the task has been dispatched
+
+    Returns:
+        timedelta: The delay before the task is due again
+    """
+    return timedelta(
+        seconds=min(
+            settings.OUTBOX_RETRY_DELAY * 2 ** max(attempts - 1, 0),
+            settings.OUTBOX_MAX_RETRY_DELAY,
+        )
+    )
+
+
+def relay_outbox_tasks():
+    """
+    Claims a batch of the outbox tasks which are due and dispatches them
+
+    Returns:
+        int: The number of tasks dispatched
+    """
+    from mitxpro.tasks import run_outbox_task  # noqa: PLC0415
+
+    now = now_in_utc()
+    with transaction.atomic():
+        outbox_task_ids = list(
+            OutboxTask.objects.select_for_update(skip_locked=True)
+            .filter(available_on__lte=now)
+            .order_by("available_on")
+            .values_list("id", flat=True)[: settings.OUTBOX_RELAY_BATCH_SIZE]
+        )
+        # lease the tasks so they aren't dispatched again unless they don't finish in time. The idempotency
+        # key is released, since a change made once a task has started may not be seen by it.
+        OutboxTask.objects.filter(id__in=outbox_task_ids).update(
+            attempts=F("attempts") + 1,
+            available_on=now + timedelta(seconds=settings.OUTBOX_TASK_LEASE),
+            idempotency_key=None,
+        )
+
+    if outbox_task_ids:
+        with current_app.producer_or_acquire() as producer:
+            for outbox_task_id in outbox_task_ids:
+                run_outbox_task.apply_async((outbox_task_id,), producer=producer)
+    return len(outbox_task_ids)
+
+
+def run_outbox_task(outbox_task_id):
+    """
+    Runs an outbox task, deleting it if it succeeds and scheduling a retry if it fails
+
+    Args:
+        outbox_task_id (int): The OutboxTask id
+    """
+    outbox_task = OutboxTask.objects.filter(
+        id=outbox_task_id, available_on__isnull=False
+    ).first()
+    if outbox_task is None:
+        # it has already run, or has run out of attempts
+        return
+
+    try:
+        current_app.tasks[outbox_task.task_name](
+            *outbox_task.args, **outbox_task.kwargs
+        )
+    except Exception:
+        log.exception("Outbox task %s failed", outbox_task)
+        OutboxTask.objects.filter(id=outbox_task.id).update(
+            last_error=traceback.format_exc(),
+            available_on=(
+                now_in_utc() + get_outbox_retry_delay(outbox_task.attempts)
+                if outbox_task.attempts < settings.OUTBOX_MAX_ATTEMPTS
+                else None
+            ),
+        )
+    else:
+        outbox_task.delete()
@@ -0,0 +1,135 @@
+"""Tests for the transactional outbox"""
+
+from datetime import timedelta
+
+import pytest
+
+from mitxpro import outbox
+from mitxpro.models import OutboxTask
+from mitxpro.utils import now_in_utc
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def mock_task(mocker):
+    """A task registered with the celery app"""
+    task = mocker.Mock()
+    task.name = "mitxpro.tasks.fake_task"
+    mocker.patch.dict(outbox.current_app.tasks, {task.name: task})
+    return task
+
+
+def test_enqueue_task(mock_task, django_capture_on_commit_callbacks):
+    """The task should only run once the transaction commits, and only once per idempotency key"""
+    with django_capture_on_commit_callbacks(execute=True):
+        for _ in range(2):
+            outbox.enqueue_task(
+                mock_task, args=(1,), kwargs={"a": "b"}, idempotency_key="key"
+            )
+        assert OutboxTask.objects.count() == 1
+        mock_task.assert_not_called()
+
+    mock_task.assert_called_once_with(1, a="b")
+    assert not OutboxTask.objects.exists()
+
+
+def test_enqueue_task_identical(mock_task, django_capture_on_commit_callbacks):
+    """Identical dispatches should only be recorded once, and the outbox relayed once per transaction"""
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        for task_id in [1, 2, 1]:
+            outbox.enqueue_task(mock_task, args=(task_id,), kwargs={"a": "b"})
+        assert OutboxTask.objects.count() == 2
+
+    assert len(callbacks) == 1
+    assert mock_task.call_count == 2
+    mock_task.assert_any_call(1, a="b")
+    mock_task.assert_any_call(2, a="b")
+
+
+def test_enqueue_task_after_dispatch(mocker, mock_task):
+    """A task enqueued once an identical one has been dispatched should be recorded again"""
+    mock_apply_async = mocker.patch("mitxpro.tasks.run_outbox_task.apply_async")
+    outbox.enqueue_task(mock_task, args=(1,))
+
+    assert outbox.relay_outbox_tasks() == 1
+    outbox_task = OutboxTask.objects.get()
+    assert outbox_task.idempotency_key is None
+    mock_apply_async.assert_called_once_with((outbox_task.id,), producer=mocker.ANY)
+
+    outbox.enqueue_task(mock_task, args=(1,))
+    assert OutboxTask.objects.count() == 2
+
+
+def test_enqueue_task_rollback(mock_task, django_capture_on_commit_callbacks):
+    """The task should be discarded if the transaction rolls back"""
+    with django_capture_on_commit_callbacks() as callbacks:  # noqa: SIM117
+        with pytest.raises(ZeroDivisionError):  # noqa: PT012
+            with outbox.transaction.atomic():
+                outbox.enqueue_task(mock_task, args=(1,))
+                1 / 0  # noqa: B018
+
+    assert callbacks == []
+    assert not OutboxTask.objects.exists()
+    mock_task.assert_not_called()
+
+
+def test_enqueue_task_savepoint_rollback(mock_task, django_capture_on_commit_callbacks):
+    """The relay should be registered again if a savepoint which registered it rolls back"""
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        with pytest.raises(ZeroDivisionError), outbox.transaction.atomic():  # noqa: PT012
+            outbox.enqueue_task(mock_task, args=(1,))
+            1 / 0  # noqa: B018
+        outbox.enqueue_task(mock_task, args=(2,))
+        outbox.enqueue_task(mock_task, args=(3,))
+
+    assert len(callbacks) == 1
+    assert mock_task.call_count == 2
+    mock_task.assert_any_call(2)
+    mock_task.assert_any_call(3)
+
+
+def test_enqueue_task_countdown(mock_task, django_capture_on_commit_callbacks):
+    """A task with a countdown should be left for the periodic relay"""
+    with django_capture_on_commit_callbacks(execute=True):
+        outbox.enqueue_task(mock_task, args=(1,), countdown=120)
+
+    mock_task.assert_not_called()
+    outbox_task = OutboxTask.objects.get()
+    assert outbox_task.available_on > now_in_utc() + timedelta(seconds=100)
+    assert outbox.relay_outbox_tasks() == 0
+
+
+def test_run_outbox_task_retry(settings, mock_task):
+    """A failed task should be retried with a backoff until it runs out of attempts"""
+    settings.OUTBOX_MAX_ATTEMPTS = 2
+    settings.OUTBOX_RETRY_DELAY = 60
+    mock_task.side_effect = Exception("error")
+    outbox.enqueue_task(mock_task, args=(1,))
+
+    assert outbox.relay_outbox_tasks() == 1
+    outbox_task = OutboxTask.objects.get()
+    assert outbox_task.attempts == 1
+    assert "error" in outbox_task.last_error
+    assert outbox_task.available_on > now_in_utc() + timedelta(seconds=50)
+    assert outbox.relay_outbox_tasks() == 0
+
+    OutboxTask.objects.update(available_on=now_in_utc())
+    assert outbox.relay_outbox_tasks() == 1
+    outbox_task.refresh_from_db()
+    assert outbox_task.attempts == 2
+    assert outbox_task.available_on is None
+    assert mock_task.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "attempts, expected_seconds",  # noqa: PT006
+    [(1, 60), (2, 120), (4, 480), (20, 3600)],
+)
+def test_get_outbox_retry_delay(settings, attempts, expected_seconds):
+    """The retry delay should double for each attempt, up to a maximum"""
+    settings.OUTBOX_RETRY_DELAY = 60
+    settings.OUTBOX_MAX_RETRY_DELAY = 3600
+    assert outbox.get_outbox_retry_delay(attempts) == timedelta(
+        seconds=expected_seconds
+    )
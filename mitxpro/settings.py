@@ -712,6 +712,11 @@ CRON_EXTERNAL_COURSERUN_SYNC_DAYS = get_string(
     default=None,
     description="'day_of_week' value for 'sync-external-course-runs' scheduled task (default will run once a day).",
 )
+EXTERNAL_COURSE_SYNC_BULK_MODE = get_bool(
+    name="EXTERNAL_COURSE_SYNC_BULK_MODE",
+    default=False,
+    description="Use the bulk upsert mode for the scheduled external course sync",
+)
 
 CRON_BASKET_DELETE_HOURS = get_string(
     name="CRON_BASKET_DELETE_HOURS",
@@ -784,6 +789,11 @@ DRIVE_WEBHOOK_ASSIGNMENT_MAX_AGE_DAYS = get_int(
         "considered 'fresh', i.e.: should still be monitored for changes via webhook/file watch."
     ),
 )
+PRODUCT_SELLABILITY_UPDATE_FREQUENCY = get_int(
+    name="PRODUCT_SELLABILITY_UPDATE_FREQUENCY",
+    default=60 * 15,
+    description="How many seconds between recomputing which products can be sold",
+)
 SHEETS_MONITORING_FREQUENCY = get_int(
     name="SHEETS_MONITORING_FREQUENCY",
     default=60 * 60 * 2,
@@ -795,6 +805,53 @@ SHEETS_TASK_OFFSET = get_int(
     description="How many seconds to wait in between executing different Sheets tasks in series",
 )
 
+OUTBOX_RELAY_FREQUENCY = get_int(
+    name="OUTBOX_RELAY_FREQUENCY",
+    default=60,
+    description="How many seconds between dispatches of outbox tasks that are due for a retry or didn't finish",
+)
+OUTBOX_RELAY_BATCH_SIZE = get_int(
+    name="OUTBOX_RELAY_BATCH_SIZE",
+    default=100,
+    description="Maximum number of outbox tasks claimed and dispatched at once",
+)
+OUTBOX_TASK_LEASE = get_int(
+    name="OUTBOX_TASK_LEASE",
+    default=60 * 10,
+    description="Number of seconds a dispatched outbox task has to finish before it's dispatched again",
+)
+OUTBOX_RETRY_DELAY = get_int(
+    name="OUTBOX_RETRY_DELAY",
+    default=60,
+    description="Number of seconds before the first retry of a failed outbox task, doubled for each later retry",
+)
+OUTBOX_MAX_RETRY_DELAY = get_int(
+    name="OUTBOX_MAX_RETRY_DELAY",
+    default=60 * 60,
+    description="Maximum number of seconds between retries of a failed outbox task",
+)
+OUTBOX_MAX_ATTEMPTS = get_int(
+    name="OUTBOX_MAX_ATTEMPTS",
+    default=10,
+    description="Number of times an outbox task is attempted before it's given up on",
+)
+
+AUDIT_CHECKPOINT_INTERVAL = get_int(
+    name="AUDIT_CHECKPOINT_INTERVAL",
+    default=20,
+    description="Maximum number of audit records stored as diffs after each full snapshot of an object",
+)
+AUDIT_COMPACT_AFTER_MONTHS = get_int(
+    name="AUDIT_COMPACT_AFTER_MONTHS",
+    default=3,
+    description="Number of whole months of audit records which the compact_audits command leaves alone by default",
+)
+AUDIT_COMPACT_BATCH_SIZE = get_int(
+    name="AUDIT_COMPACT_BATCH_SIZE",
+    default=1000,
+    description="Number of audit records read or updated per query by the compact_audits command",
+)
+
 CELERY_BEAT_SCHEDULE = {
     "retry-failed-edx-enrollments": {
         "task": "courseware.tasks.retry_failed_edx_enrollments",
@@ -847,6 +904,10 @@ CELERY_BEAT_SCHEDULE = {
             month_of_year="*",
         ),
     },
+    "update-product-sellability": {
+        "task": "ecommerce.tasks.update_all_product_sellability",
+        "schedule": PRODUCT_SELLABILITY_UPDATE_FREQUENCY,
+    },
     "renew_all_file_watches": {
         "task": "sheets.tasks.renew_all_file_watches",
         "schedule": (
@@ -858,6 +919,10 @@ CELERY_BEAT_SCHEDULE = {
         "task": "mitxpro.tasks.clear_expired_tokens",
         "schedule": crontab(minute=0, hour=9, day_of_week=1),
     },
+    "relay-outbox-tasks": {
+        "task": "mitxpro.tasks.relay_outbox_tasks",
+        "schedule": OUTBOX_RELAY_FREQUENCY,
+    },
 }
 
 alt_sheets_processing = FEATURES.get("COUPON_SHEETS_ALT_PROCESSING")
@@ -918,6 +983,68 @@ BLOG_CACHE_TIMEOUT = get_int(
     description="How long the blog should be cached",
 )
 
+CATALOG_API_CACHE_ENABLED = get_bool(
+    name="CATALOG_API_CACHE_ENABLED",
+    default=True,
+    description="Whether anonymous catalog API responses (courses, programs, products, topics) are cached",
+)
+CATALOG_API_CACHE_NAME = get_string(
+    name="CATALOG_API_CACHE_NAME",
+    default="redis",
+    description="The cache backend used for the catalog content version and cached catalog API responses",
+)
+CATALOG_API_CACHE_TIMEOUT = get_int(
+    name="CATALOG_API_CACHE_TIMEOUT",
+    default=60 * 60 * 24,
+    description="How long a rendered catalog API response is cached for a given catalog content version",
+)
+CATALOG_API_CACHE_TIME_BUCKET = get_int(
+    name="CATALOG_API_CACHE_TIME_BUCKET",
+    default=5 * 60,
+    description="The number of seconds after which cached catalog API responses are recomputed even if the catalog content version hasn't changed, so that passed run and enrollment deadlines show up",
+)
+COUNTRIES_API_CACHE_MAX_AGE = get_int(
+    name="COUNTRIES_API_CACHE_MAX_AGE",
+    default=60 * 60 * 24,
+    description="Number of seconds clients may cache the countries/states API response for",
+)
+USER_ENROLLMENTS_CACHE_ENABLED = get_bool(
+    name="USER_ENROLLMENTS_CACHE_ENABLED",
+    default=True,
+    description="Whether the serialized enrollments for the user dashboard are cached per user",
+)
+USER_ENROLLMENTS_CACHE_TIMEOUT = get_int(
+    name="USER_ENROLLMENTS_CACHE_TIMEOUT",
+    default=60 * 15,
+    description="How long a user's serialized dashboard enrollments are cached",
+)
+BLOCKLIST_PROBE_ENABLED = get_bool(
+    name="BLOCKLIST_PROBE_ENABLED",
+    default=True,
+    description="Whether each process keeps the email blocklist in memory instead of querying it on every signup and login",
+)
+BLOCKLIST_CACHE_NAME = get_string(
+    name="BLOCKLIST_CACHE_NAME",
+    default="redis",
+    description="The cache backend used for the email blocklist version, shared by every process",
+)
+USER_RETIREMENT_BATCH_SIZE = get_int(
+    name="USER_RETIREMENT_BATCH_SIZE",
+    default=1000,
+    description="Number of users retired or emails blocked per query by the retire_users and block_users commands",
+)
+
+CERTIFICATE_PAGE_CACHE_ENABLED = get_bool(
+    name="CERTIFICATE_PAGE_CACHE_ENABLED",
+    default=True,
+    description="Whether rendered certificate pages are cached for anonymous views",
+)
+CERTIFICATE_PAGE_CACHE_TIMEOUT = get_int(
+    name="CERTIFICATE_PAGE_CACHE_TIMEOUT",
+    default=60 * 60 * 24,
+    description="How long a rendered certificate page is cached",
+)
+
 # django cache back-ends
 CACHES = {
     "default": {
@@ -1093,6 +1220,16 @@ OPENEDX_SERVICE_WORKER_USERNAME = get_string(
     default=None,
     description="Username of the user whose token has been set in OPENEDX_SERVICE_WORKER_API_TOKEN",
 )
+OPENEDX_COURSE_LIST_SYNC_CHUNK_SIZE = get_int(
+    name="OPENEDX_COURSE_LIST_SYNC_CHUNK_SIZE",
+    default=100,
+    description="Number of course keys requested from the Open edX course list API at a time when syncing course runs",
+)
+OPENEDX_COURSE_LIST_MAX_CONCURRENT_REQUESTS = get_int(
+    name="OPENEDX_COURSE_LIST_MAX_CONCURRENT_REQUESTS",
+    default=4,
+    description="The maximum number of threads used to request course run chunks from the Open edX course list API concurrently",
+)
 EDX_API_CLIENT_TIMEOUT = get_int(
     name="EDX_API_CLIENT_TIMEOUT",
     default=60,
@@ -1115,6 +1252,21 @@ EXTERNAL_COURSE_SYNC_API_REQUEST_TIMEOUT = get_int(
     default=60,
     description="API request timeout for external course sync APIs in seconds",
 )
+EXTERNAL_COURSE_SYNC_JOB_POLL_INITIAL_DELAY = get_int(
+    name="EXTERNAL_COURSE_SYNC_JOB_POLL_INITIAL_DELAY",
+    default=2,
+    description="Seconds to wait before first checking an external course sync report job, doubled on each check",
+)
+EXTERNAL_COURSE_SYNC_JOB_POLL_MAX_DELAY = get_int(
+    name="EXTERNAL_COURSE_SYNC_JOB_POLL_MAX_DELAY",
+    default=60,
+    description="Maximum seconds to wait between checks of an external course sync report job",
+)
+EXTERNAL_COURSE_SYNC_JOB_POLL_MAX_ATTEMPTS = get_int(
+    name="EXTERNAL_COURSE_SYNC_JOB_POLL_MAX_ATTEMPTS",
+    default=60,
+    description="Number of times the scheduled external course sync checks a report job before giving up",
+)
 
 # django debug toolbar only in debug mode
 if DEBUG:
@@ -1152,6 +1304,36 @@ CYBERSOURCE_TRANSACTION_KEY = get_string(
     default=None,
     description="The cybersource transaction key",
 )
+CYBERSOURCE_WSDL_CACHE_PATH = get_string(
+    name="CYBERSOURCE_WSDL_CACHE_PATH",
+    default=None,
+    description="The path of a sqlite file to cache the cybersource WSDL and XSD definitions in across restarts",
+)
+CYBERSOURCE_WSDL_CACHE_TIMEOUT = get_int(
+    name="CYBERSOURCE_WSDL_CACHE_TIMEOUT",
+    default=60 * 60 * 24,
+    description="Number of seconds the cached cybersource WSDL and XSD definitions are valid for",
+)
+CYBERSOURCE_REQUEST_TIMEOUT = get_int(
+    name="CYBERSOURCE_REQUEST_TIMEOUT",
+    default=30,
+    description="Number of seconds to wait for a cybersource exports check to respond",
+)
+CYBERSOURCE_EXPORTS_MAX_CONCURRENT_REQUESTS = get_int(
+    name="CYBERSOURCE_EXPORTS_MAX_CONCURRENT_REQUESTS",
+    default=4,
+    description="Maximum number of concurrent cybersource exports checks when screening a batch of users",
+)
+CYBERSOURCE_EXPORTS_BATCH_SIZE = get_int(
+    name="CYBERSOURCE_EXPORTS_BATCH_SIZE",
+    default=100,
+    description="Number of users screened for exports compliance by each batch task",
+)
+CYBERSOURCE_EXPORTS_RECENT_VERIFICATION_TTL = get_int(
+    name="CYBERSOURCE_EXPORTS_RECENT_VERIFICATION_TTL",
+    default=60 * 15,
+    description="Number of seconds a batch screening reuses an exports check for a user whose legal address hasn't changed since. 0 disables reuse.",
+)
 CYBERSOURCE_INQUIRY_LOG_NACL_ENCRYPTION_KEY = get_string(
     name="CYBERSOURCE_INQUIRY_LOG_NACL_ENCRYPTION_KEY",
     default=None,
@@ -1429,6 +1611,20 @@ SHEETS_DEFERRAL_FIRST_ROW = get_int(
         "processing in the deferral request spreadsheet"
     ),
 )
+SHEETS_ROW_BATCH_SIZE = get_int(
+    name="SHEETS_ROW_BATCH_SIZE",
+    default=20,
+    description=(
+        "The number of coupon request sheet rows that are processed together in a single database "
+        "transaction. Each row still gets its own savepoint, so a failed row does not affect the others. "
+        "Refund and deferral request rows call the edX API, so they are not processed in a transaction."
+    ),
+)
+SHEETS_MAX_CONCURRENT_REQUESTS = get_int(
+    name="SHEETS_MAX_CONCURRENT_REQUESTS",
+    default=4,
+    description="The maximum number of threads used to create and share new coupon assignment sheets concurrently",
+)
 # Specify the zero-based index of certain request sheet columns
 SHEETS_REQ_EMAIL_COL = 7
 SHEETS_REQ_PROCESSED_COL = 8
@@ -3,8 +3,11 @@
 import logging
 
 from celery import shared_task
+from django.conf import settings
 from oauth2_provider.models import clear_expired
 
+from mitxpro import outbox
+
 log = logging.getLogger(__name__)
 
 
@@ -14,3 +17,16 @@ def clear_expired_tokens():
     log.info("Starting clear_expired_tokens...")
     clear_expired()
     log.info("Finished clear_expired_tokens.")
+
+
+@shared_task(acks_late=True)
+def run_outbox_task(outbox_task_id):
+    """Run a task from the transactional outbox"""
+    outbox.run_outbox_task(outbox_task_id)
+
+
+@shared_task
+def relay_outbox_tasks():
+    """Dispatch the outbox tasks which are due, including retries and tasks which didn't finish"""
+    while outbox.relay_outbox_tasks() >= settings.OUTBOX_RELAY_BATCH_SIZE:
+        pass
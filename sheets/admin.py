@@ -12,6 +12,7 @@ from sheets.models import (
     FileWatchRenewalAttempt,
     GoogleApiAuth,
     GoogleFileWatch,
+    MailgunEventCursor,
     RefundRequest,
 )
 
@@ -48,6 +49,14 @@ class GoogleApiAuthAdmin(SingletonModelAdmin):
     list_display = ("id", "requesting_user")
 
 
+@admin.register(MailgunEventCursor)
+class MailgunEventCursorAdmin(SingletonModelAdmin):
+    """Admin for MailgunEventCursor"""
+
+    model = MailgunEventCursor
+    list_display = ("id", "window_start", "window_end")
+
+
 @admin.register(GoogleFileWatch)
 class GoogleFileWatchAdmin(admin.ModelAdmin):
     """Admin for GoogleFileWatch"""
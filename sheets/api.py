@@ -135,14 +135,18 @@ def get_credentials():
     raise ImproperlyConfigured("Authorization with Google has not been completed.")  # noqa: EM101
 
 
-def get_authorized_pygsheets_client():
+def get_authorized_pygsheets_client(credentials=None):
     """
     Instantiates a pygsheets Client and authorizes it with the proper credentials.
 
+    Args:
+        credentials (google.oauth2.credentials.Credentials or None): Credentials to authorize the client with. If
+            not provided, the stored credentials will be fetched.
+
     Returns:
         pygsheets.client.Client: The authorized Client object
     """
-    credentials = get_credentials()
+    credentials = credentials or get_credentials()
     pygsheets_client = pygsheets.authorize(custom_credentials=credentials)
     if settings.DRIVE_SHARED_ID:
         pygsheets_client.drive.enable_team_drive(team_drive_id=settings.DRIVE_SHARED_ID)
@@ -50,6 +50,7 @@ RELEVANT_ASSIGNMENT_EMAIL_EVENTS = {
     MAILGUN_CLICKED,
 }
 ASSIGNMENT_SHEET_MAX_AGE_DAYS = 15
+ASSIGNMENT_BULK_BATCH_SIZE = 1000
 ASSIGNMENT_SHEET_EMAIL_RETRY_MINUTES = 10
 
 ENROLL_CHANGE_SHEET_PROCESSOR_NAME = "MIT xPRO app"
@@ -57,6 +58,10 @@ REFUND_SHEET_ORDER_TYPE_FULL_COUPON = "Enrollment Code"
 REFUND_SHEET_ORDER_TYPE_PAID = "Paid via Cybersource"
 
 MAILGUN_API_TIMEOUT_RETRIES = 3
+# Mailgun does not guarantee that an event is queryable as soon as it happens, so each incremental
+# fetch re-reads a trailing window of this size before the last fetched date.
+MAILGUN_EVENT_CURSOR_OVERLAP_MINUTES = 30
+MAILGUN_EVENT_STORE_CHUNK_SIZE = 500
 UNKNOWN_EMAIL_ERROR_STATUS = "unrecognized error"
 UNSENT_EMAIL_STATUSES = {
     None,
@@ -6,7 +6,9 @@ from datetime import timedelta
 
 from django.conf import settings
 from django.db import transaction
+from django.db.models import prefetch_related_objects
 from django.utils.functional import cached_property
+from mitol.common.utils import chunks
 
 import ecommerce.api
 from ecommerce.mail_api import send_bulk_enroll_emails
@@ -23,13 +25,13 @@ from mitxpro.utils import (
     case_insensitive_equal,
     item_at_index_or_none,
     now_in_utc,
-    partition,
     partition_to_lists,
 )
 from sheets.api import ExpandedSheetsClient, get_authorized_pygsheets_client
 from sheets.constants import (
     ASSIGNMENT_MESSAGES_COMPLETED_DATE_KEY,
     ASSIGNMENT_MESSAGES_COMPLETED_KEY,
+    ASSIGNMENT_BULK_BATCH_SIZE,
     ASSIGNMENT_SHEET_ASSIGNED_STATUS,
     ASSIGNMENT_SHEET_EMAIL_RETRY_MINUTES,
     ASSIGNMENT_SHEET_ENROLLED_STATUS,
@@ -43,7 +45,8 @@ from sheets.constants import (
     UNSENT_EMAIL_STATUSES,
 )
 from sheets.exceptions import SheetRowParsingException, SheetValidationException
-from sheets.mail_api import get_bulk_assignment_messages
+from sheets.mail_api import sync_bulk_assignment_messages
+from sheets.models import BulkAssignmentMessageEvent
 from sheets.utils import (
     AssignmentRowUpdate,
     assign_sheet_metadata,
@@ -51,7 +54,6 @@ from sheets.utils import (
     format_datetime_for_google_api,
     format_datetime_for_sheet_formula,
     get_data_rows,
-    mailgun_timestamp_to_datetime,
     parse_sheet_datetime_str,
 )
 
@@ -388,21 +390,22 @@ def find_bulk_assignment_messages(assignment_status_map, earliest_message_date=N
     Returns:
         AssignmentStatusMap: The assignment status map with updated message statuses
     """
-    # Loop through bulk coupon assignment emails from the Mailgun API and fill in the
-    # delivery or failure date for any matching coupon assignments in the map.
-    message_iter = filter(
-        lambda bulk_assignment_message: (
-            bulk_assignment_message.event in RELEVANT_ASSIGNMENT_EMAIL_EVENTS
-        ),
-        get_bulk_assignment_messages(begin=earliest_message_date, end=now_in_utc()),
-    )
-    for message in message_iter:
+    # Copy any new bulk coupon assignment emails from the Mailgun API into the local event store, then
+    # fill in the delivery or failure date for any matching coupon assignments in the map.
+    sync_bulk_assignment_messages(earliest_date=earliest_message_date)
+    message_events = BulkAssignmentMessageEvent.objects.filter(
+        bulk_assignment_id__in=list(assignment_status_map.bulk_assignment_ids),
+        event__in=RELEVANT_ASSIGNMENT_EMAIL_EVENTS,
+    ).order_by("event_date", "id")
+    if earliest_message_date is not None:
+        message_events = message_events.filter(event_date__gte=earliest_message_date)
+    for message_event in message_events.iterator():
         assignment_status_map.add_potential_event_date(
-            message.bulk_assignment_id,
-            message.coupon_code,
-            recipient_email=message.email,
-            event_type=message.event,
-            event_date=mailgun_timestamp_to_datetime(message.timestamp),
+            message_event.bulk_assignment_id,
+            message_event.coupon_code,
+            recipient_email=message_event.email,
+            event_type=message_event.event,
+            event_date=message_event.event_date,
         )
     return assignment_status_map
 
@@ -845,54 +848,54 @@ class CouponAssignmentHandler:
                 paired with an iterable of ProductCouponAssignment id's that should be deleted.
         """
         existing_tuple_set = set()
-        assignments_to_remove = []
-        # Based on existing ProductCouponAssignments, figure out which assignments should be
-        # created and which ones do not exist in the desired assignments and should therefore be removed.
-        for existing_assignment in existing_assignment_qset.all():
-            assignment_tuple = (
-                existing_assignment.email.lower(),
-                existing_assignment.product_coupon_id,
-            )
+        assignment_ids_to_remove = []
+        redeemed_assignment_ids = []
+        redeemed_product_coupon_ids = set()
+        # Based on existing ProductCouponAssignments, figure out which assignments should be created and which ones
+        # do not exist in the desired assignments and should therefore be removed. The existing assignments are
+        # loaded with a single query and compared against the desired assignments in a single pass.
+        for (
+            assignment_id,
+            email,
+            product_coupon_id,
+            redeemed,
+        ) in existing_assignment_qset.values_list(
+            "id", "email", "product_coupon_id", "redeemed"
+        ).iterator():
+            assignment_tuple = (email.lower(), product_coupon_id)
             if assignment_tuple in desired_assignments:
                 existing_tuple_set.add(assignment_tuple)
+            elif redeemed:
+                # If they have been redeemed already, we can't delete them.
+                redeemed_assignment_ids.append(assignment_id)
+                redeemed_product_coupon_ids.add(product_coupon_id)
             else:
-                assignments_to_remove.append(existing_assignment)
+                assignment_ids_to_remove.append(assignment_id)
         tuple_set_to_create = desired_assignments - existing_tuple_set
 
-        if assignments_to_remove:
-            # Remove any assignments that have already been redeemed from the list of assignments to remove/delete.
-            # If they have been redeemed already, we can't delete them.
-            assignments_to_remove, already_redeemed_assignments = partition_to_lists(
-                assignments_to_remove, lambda assignment: assignment.redeemed
+        if redeemed_assignment_ids:
+            log.info(
+                "Cannot remove ProductCouponAssignments that are already redeemed - "
+                "The following assignments will not be removed: %s",
+                redeemed_assignment_ids,
+            )
+            # If any of the assignments we want to create have the same product coupon as one
+            # of these already-redeemed assignments, filter them out and log an info message.
+            tuple_set_to_create, cannot_create = partition_to_lists(
+                tuple_set_to_create,
+                lambda assignment_tuple: (
+                    assignment_tuple[1] in redeemed_product_coupon_ids
+                ),
             )
-            if already_redeemed_assignments:
+            tuple_set_to_create = set(tuple_set_to_create)
+            if cannot_create:
                 log.info(
-                    "Cannot remove ProductCouponAssignments that are already redeemed - "
-                    "The following assignments will not be removed: %s",
-                    list(already_redeemed_assignments),
+                    "Cannot create ProductCouponAssignments for codes that have already been redeemed. "
+                    "The following assignments will be not be created: %s",
+                    cannot_create,
                 )
-                # If any of the assignments we want to create have the same product coupon as one
-                # of these already-redeemed assignments, filter them out and log an info message.
-                product_coupon_ids = {
-                    assignment.product_coupon_id
-                    for assignment in already_redeemed_assignments
-                }
-                adjusted_create_iter, cannot_create_iter = partition(
-                    tuple_set_to_create,
-                    lambda assignment_tuple: assignment_tuple[1] in product_coupon_ids,
-                )
-                tuple_set_to_create = set(adjusted_create_iter)
-                if cannot_create_iter:
-                    log.info(
-                        "Cannot create ProductCouponAssignments for codes that have already been redeemed. "
-                        "The following assignments will be not be created: %s",
-                        list(cannot_create_iter),
-                    )
 
-        return (
-            tuple_set_to_create,
-            [assignment.id for assignment in assignments_to_remove],
-        )
+        return tuple_set_to_create, assignment_ids_to_remove
 
     def update_coupon_delivery_statuses(self, assignment_status_map):
         """
@@ -966,25 +969,15 @@ class CouponAssignmentHandler:
         # Determine what assignments need to be created and deleted
         desired_assignments = self.get_desired_coupon_assignments(assignment_rows)
         if self.bulk_assignment.assignments_started_date:
-            existing_assignment_qset = self.bulk_assignment.assignments
-            existing_assignment_count = existing_assignment_qset.count()
             (
                 assignments_to_create,
                 assignment_ids_to_remove,
             ) = self.get_assignments_to_create_and_remove(
-                existing_assignment_qset, desired_assignments
+                self.bulk_assignment.assignments, desired_assignments
             )
         else:
             assignments_to_create = desired_assignments
             assignment_ids_to_remove = []
-            existing_assignment_count = 0
-
-        # Delete assignments as necessary
-        if assignment_ids_to_remove:
-            num_assignments_removed, _ = ProductCouponAssignment.objects.filter(
-                id__in=assignment_ids_to_remove
-            ).delete()
-            existing_assignment_count -= num_assignments_removed
 
         # Validate emails before assignment so we can filter out and report on any bad emails
         try:
@@ -993,19 +986,29 @@ class CouponAssignmentHandler:
             )
         except MultiEmailValidationError as exc:
             invalid_emails = exc.invalid_emails
-            assignments_to_create = (
+            assignments_to_create = [
                 assignment_tuple
                 for assignment_tuple in assignments_to_create
                 if assignment_tuple[0] not in invalid_emails
-            )
+            ]
 
-        # Create ProductCouponAssignments and update the BulkCouponAssignment record to reflect the progress
+        # Delete and create ProductCouponAssignments in chunks, and update the BulkCouponAssignment record to
+        # reflect the progress, all in a single transaction
         with transaction.atomic():
             bulk_assignment = BulkCouponAssignment.objects.select_for_update().get(
                 id=self.bulk_assignment.id
             )
+            for assignment_id_chunk in chunks(
+                assignment_ids_to_remove, chunk_size=ASSIGNMENT_BULK_BATCH_SIZE
+            ):
+                num_removed, _ = ProductCouponAssignment.objects.filter(
+                    id__in=assignment_id_chunk
+                ).delete()
+                num_assignments_removed += num_removed
             _, created_assignments = ecommerce.api.bulk_assign_product_coupons(
-                assignments_to_create, bulk_assignment=bulk_assignment
+                assignments_to_create,
+                bulk_assignment=bulk_assignment,
+                batch_size=ASSIGNMENT_BULK_BATCH_SIZE,
             )
             if created_assignments or num_assignments_removed:
                 now = now_in_utc()
@@ -1018,6 +1021,12 @@ class CouponAssignmentHandler:
 
         # Send messages if any assignments were created
         if created_assignments:
+            prefetch_related_objects(
+                created_assignments,
+                "product_coupon__coupon",
+                "product_coupon__program_run",
+                "product_coupon__product__content_object",
+            )
             send_bulk_enroll_emails(self.bulk_assignment.id, created_assignments)
             self.report_assigned_codes(assignment_rows, created_assignments)
 
@@ -0,0 +1,50 @@
+"""Coupon assignment API tests"""
+
+import pytest
+
+from ecommerce.factories import (
+    BulkCouponAssignmentFactory,
+    CouponEligibilityFactory,
+    ProductCouponAssignmentFactory,
+)
+from sheets.coupon_assign_api import CouponAssignmentHandler
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_assignments_to_create_and_remove():
+    """
+    get_assignments_to_create_and_remove should compare existing assignments to the desired assignments
+    (ignoring email case), and never remove or replace redeemed assignments
+    """
+    bulk_assignment = BulkCouponAssignmentFactory.create()
+    product_coupons = CouponEligibilityFactory.create_batch(4)
+    kept_assignment = ProductCouponAssignmentFactory.create(
+        bulk_assignment=bulk_assignment,
+        product_coupon=product_coupons[0],
+        email="Kept@Example.com",
+    )
+    removed_assignment = ProductCouponAssignmentFactory.create(
+        bulk_assignment=bulk_assignment,
+        product_coupon=product_coupons[1],
+        email="removed@example.com",
+    )
+    ProductCouponAssignmentFactory.create(
+        bulk_assignment=bulk_assignment,
+        product_coupon=product_coupons[2],
+        email="redeemed@example.com",
+        redeemed=True,
+    )
+    desired_assignments = {
+        (kept_assignment.email.lower(), product_coupons[0].id),
+        ("new@example.com", product_coupons[2].id),
+        ("new@example.com", product_coupons[3].id),
+    }
+
+    to_create, ids_to_remove = (
+        CouponAssignmentHandler.get_assignments_to_create_and_remove(
+            bulk_assignment.assignments, desired_assignments
+        )
+    )
+    assert to_create == {("new@example.com", product_coupons[3].id)}
+    assert ids_to_remove == [removed_assignment.id]
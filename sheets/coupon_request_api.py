@@ -3,6 +3,7 @@
 import itertools
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from decimal import Decimal
 
 from django.conf import settings
@@ -68,6 +69,12 @@ def create_coupons_for_request_row(row, company_id):
         discount_type=DISCOUNT_TYPE_PERCENT_OFF,  # Default to percent-off, There won't be dollars-off coupons in sheets
         payment_transaction=row.purchase_order_id,
         product_program_run_map=product_program_run_map,
+        progress_callback=lambda num_created, num_total: log.info(
+            "Created %d/%d coupons for coupon request '%s'",
+            num_created,
+            num_total,
+            row.coupon_name,
+        ),
         **BULK_PURCHASE_DEFAULTS,
     )
 
@@ -194,7 +201,7 @@ class CouponRequestHandler(SheetHandler):
         return self.spreadsheet.sheet1
 
     def protect_coupon_assignment_ranges(
-        self, spreadsheet_id, worksheet_id, num_data_rows
+        self, spreadsheet_id, worksheet_id, num_data_rows, pygsheets_client=None
     ):
         """
         Sets the header row, the coupon code column, and the status columns to protected so that they can only be
@@ -204,6 +211,8 @@ class CouponRequestHandler(SheetHandler):
             spreadsheet_id (str): The Spreadsheet id
             worksheet_id (int): The id of the Worksheet that these ranges will be applied to
             num_data_rows (int): The number of data rows (i.e.: all rows except the header) in the sheet
+            pygsheets_client (pygsheets.client.Client or None): The client that should make the request. Defaults
+                to the handler's client.
 
         Returns:
             dict: The response body from the Google Sheets API batch update request
@@ -235,31 +244,45 @@ class CouponRequestHandler(SheetHandler):
             warning_only=True,
             description="Status Columns",
         )
-        return self.pygsheets_client.sheet.batch_update(
+        pygsheets_client = pygsheets_client or self.pygsheets_client
+        return pygsheets_client.sheet.batch_update(
             spreadsheet_id,
             [header_range_req, coupon_code_range_req, status_columns_range_req],
         )
 
-    def create_assignment_sheet(self, coupon_req_row):
+    def get_coupon_codes_for_requests(self, coupon_req_rows):
         """
-        Creates a coupon assignment sheet from a single coupon request row
+        Fetches the coupon codes that were created for each of the given coupon request rows
+
+        Args:
+            coupon_req_rows (Iterable[CouponRequestRow]): Coupon request rows
+
+        Returns:
+            Dict[str, List[str]]: Coupon names mapped to the codes of the coupons created with that name
+        """
+        coupon_names = {
+            coupon_req_row.coupon_name for coupon_req_row in coupon_req_rows
+        }
+        coupon_code_map = {coupon_name: [] for coupon_name in coupon_names}
+        for coupon_name, coupon_code in Coupon.objects.filter(
+            payment__name__in=coupon_names
+        ).values_list("payment__name", "coupon_code"):
+            coupon_code_map[coupon_name].append(coupon_code)
+        return coupon_code_map
+
+    def build_assignment_sheet(self, coupon_req_row, coupon_codes, pygsheets_client):
+        """
+        Creates, fills in, formats and shares a coupon assignment sheet via the Google APIs. This makes no database
+        changes, so it can be run for several rows concurrently.
 
         Args:
             coupon_req_row (CouponRequestRow): The coupon request row
+            coupon_codes (List[str]): The codes of the coupons created for the coupon request
+            pygsheets_client (pygsheets.client.Client): The client that should make the Sheets API requests
 
         Returns:
             pygsheets.Spreadsheet: The Spreadsheet object representing the newly-created sheet
         """
-        # Get coupon codes created by the request
-        coupon_codes = Coupon.objects.filter(
-            payment__name=coupon_req_row.coupon_name
-        ).values_list("coupon_code", flat=True)
-        if not coupon_codes:
-            log.error(
-                "Cannot create bulk coupon sheet - No coupon codes found matching the name '%s'",
-                coupon_req_row.coupon_name,
-            )
-            return  # noqa: RET502
         # Create sheet
         spreadsheet_title = assignment_sheet_file_name(coupon_req_row)
         create_kwargs = (
@@ -267,9 +290,7 @@ class CouponRequestHandler(SheetHandler):
             if settings.DRIVE_OUTPUT_FOLDER_ID
             else {}
         )
-        bulk_coupon_sheet = self.pygsheets_client.create(
-            spreadsheet_title, **create_kwargs
-        )
+        bulk_coupon_sheet = pygsheets_client.create(spreadsheet_title, **create_kwargs)
         worksheet = bulk_coupon_sheet.sheet1
         # Add headers
         worksheet.update_values(
@@ -322,10 +343,8 @@ class CouponRequestHandler(SheetHandler):
             spreadsheet_id=bulk_coupon_sheet.id,
             worksheet_id=worksheet.id,
             num_data_rows=len(coupon_codes),
+            pygsheets_client=pygsheets_client,
         )
-        # If it doesn't exist, create bulk coupon assignment for tracking purposes
-        BulkCouponAssignment.objects.create(assignment_sheet_id=bulk_coupon_sheet.id)
-
         # Share
         if settings.SHEETS_ADMIN_EMAILS:
             share_drive_file_with_emails(
@@ -333,12 +352,107 @@ class CouponRequestHandler(SheetHandler):
                 emails_to_share=settings.SHEETS_ADMIN_EMAILS,
                 credentials=self._credentials,
             )
+        return bulk_coupon_sheet
+
+    def _build_assignment_sheet_in_thread(self, coupon_req_row, coupon_codes):
+        """
+        Builds a coupon assignment sheet with a pygsheets client that is only used by the current thread
+        (the underlying HTTP client is not thread-safe).
+        """
+        pygsheets_client = get_authorized_pygsheets_client(
+            credentials=self._credentials
+        )
+        return self.build_assignment_sheet(
+            coupon_req_row, coupon_codes, pygsheets_client=pygsheets_client
+        )
+
+    @staticmethod
+    def track_assignment_sheet(bulk_coupon_sheet):
+        """
+        Creates a bulk coupon assignment record and a file watch for a newly-created coupon assignment sheet
+
+        Args:
+            bulk_coupon_sheet (pygsheets.Spreadsheet): The newly-created coupon assignment sheet
+        """
+        # If it doesn't exist, create bulk coupon assignment for tracking purposes
+        BulkCouponAssignment.objects.create(assignment_sheet_id=bulk_coupon_sheet.id)
         # Set up webhook to monitor changes to this new assignment sheet
         create_or_renew_sheet_file_watch(
             assign_sheet_metadata, sheet_file_id=bulk_coupon_sheet.id
         )
+
+    def create_assignment_sheet(self, coupon_req_row):
+        """
+        Creates a coupon assignment sheet from a single coupon request row
+
+        Args:
+            coupon_req_row (CouponRequestRow): The coupon request row
+
+        Returns:
+            pygsheets.Spreadsheet: The Spreadsheet object representing the newly-created sheet
+        """
+        # Get coupon codes created by the request
+        coupon_codes = self.get_coupon_codes_for_requests([coupon_req_row])[
+            coupon_req_row.coupon_name
+        ]
+        if not coupon_codes:
+            log.error(
+                "Cannot create bulk coupon sheet - No coupon codes found matching the name '%s'",
+                coupon_req_row.coupon_name,
+            )
+            return  # noqa: RET502
+        bulk_coupon_sheet = self.build_assignment_sheet(
+            coupon_req_row, coupon_codes, pygsheets_client=self.pygsheets_client
+        )
+        self.track_assignment_sheet(bulk_coupon_sheet)
         return bulk_coupon_sheet
 
+    def create_assignment_sheets(self, coupon_req_rows):
+        """
+        Creates coupon assignment sheets for several coupon request rows. The Google API requests for each sheet
+        are made concurrently with a bounded thread pool, and the database records are created afterwards in
+        the current thread.
+
+        Args:
+            coupon_req_rows (List[CouponRequestRow]): The coupon request rows
+
+        Returns:
+            List[pygsheets.Spreadsheet]: The Spreadsheet objects representing the newly-created sheets
+        """
+        coupon_code_map = self.get_coupon_codes_for_requests(coupon_req_rows)
+        buildable_rows = []
+        for coupon_req_row in coupon_req_rows:
+            if coupon_code_map[coupon_req_row.coupon_name]:
+                buildable_rows.append(coupon_req_row)
+            else:
+                log.error(
+                    "Cannot create bulk coupon sheet - No coupon codes found matching the name '%s'",
+                    coupon_req_row.coupon_name,
+                )
+        bulk_coupon_sheets = []
+        with ThreadPoolExecutor(
+            max_workers=settings.SHEETS_MAX_CONCURRENT_REQUESTS
+        ) as executor:
+            future_row_map = {
+                executor.submit(
+                    self._build_assignment_sheet_in_thread,
+                    coupon_req_row,
+                    coupon_code_map[coupon_req_row.coupon_name],
+                ): coupon_req_row
+                for coupon_req_row in buildable_rows
+            }
+            for future in as_completed(future_row_map):
+                try:
+                    bulk_coupon_sheets.append(future.result())
+                except Exception:
+                    log.exception(
+                        "Failed to create bulk coupon sheet for coupon name '%s'",
+                        future_row_map[future].coupon_name,
+                    )
+        for bulk_coupon_sheet in bulk_coupon_sheets:
+            self.track_assignment_sheet(bulk_coupon_sheet)
+        return bulk_coupon_sheets
+
     def update_completed_rows(self, success_row_results):
         for row_result in success_row_results:
             self.worksheet.update_values(
@@ -358,8 +472,16 @@ class CouponRequestHandler(SheetHandler):
     def post_process_results(self, grouped_row_results):
         # Create assignment sheets for all newly-processed rows
         processed_row_results = grouped_row_results.get(ResultType.PROCESSED, [])
-        for row_result in processed_row_results:
-            self.create_assignment_sheet(row_result.row_object)
+        if (
+            len(processed_row_results) > 1
+            and settings.SHEETS_MAX_CONCURRENT_REQUESTS > 1
+        ):
+            self.create_assignment_sheets(
+                [row_result.row_object for row_result in processed_row_results]
+            )
+        else:
+            for row_result in processed_row_results:
+                self.create_assignment_sheet(row_result.row_object)
 
     def get_or_create_request(self, row_data):
         coupon_name = row_data[self.sheet_metadata.COUPON_NAME_COL_INDEX].strip()
@@ -433,11 +555,44 @@ class CouponRequestHandler(SheetHandler):
         )
 
     def process_row(self, row_index, row_data):
+        # The request is saved before the row's savepoint, so that it's kept if the row fails. Otherwise the
+        # row would look new on the next run, and its error would be retried and reported again.
         (
             coupon_gen_request,
             request_created,
             request_updated,
         ) = self.get_or_create_request(row_data)
+        with transaction.atomic():
+            return self.process_request_row(
+                row_index,
+                row_data,
+                coupon_gen_request,
+                request_created=request_created,
+                request_updated=request_updated,
+            )
+
+    def process_request_row(
+        self,
+        row_index,
+        row_data,
+        coupon_gen_request,
+        *,
+        request_created,
+        request_updated,
+    ):
+        """
+        Parses a spreadsheet row and creates the coupons for it, if needed
+
+        Args:
+            row_index (int): The row index according to the spreadsheet
+            row_data (List[str]): The raw data of the given spreadsheet row
+            coupon_gen_request (CouponGenerationRequest): The request record for the row
+            request_created (bool): Whether the request record was just created
+            request_updated (bool): Whether the request record's data was just updated
+
+        Returns:
+            RowResult: An object representing the results of processing the row
+        """
         try:
             coupon_req_row = CouponRequestRow.parse_raw_data(row_index, row_data)
         except SheetRowParsingException as exc:
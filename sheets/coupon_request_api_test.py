@@ -11,7 +11,7 @@ from pygsheets.sheet import SheetAPIWrapper
 
 from courses.factories import CourseRunFactory
 from ecommerce.factories import ProductVersionFactory
-from ecommerce.models import Company, Coupon
+from ecommerce.models import BulkCouponAssignment, Company, Coupon
 from sheets.coupon_request_api import CouponRequestHandler, CouponRequestRow
 from sheets.factories import GoogleApiAuthFactory
 from sheets.models import CouponGenerationRequest
@@ -84,13 +84,20 @@ def patched_sheets_api(mocker):
     )
 
 
-def test_full_sheet_process(
-    db, pygsheets_fixtures, patched_sheets_api, request_csv_rows
+@pytest.mark.parametrize("max_concurrent_requests", [1, 4])
+def test_full_sheet_process(  # noqa: PLR0913
+    settings,
+    db,
+    pygsheets_fixtures,
+    patched_sheets_api,
+    request_csv_rows,
+    max_concurrent_requests,
 ):
     """
     CouponRequestHandler.process_sheet should parse rows, create relevant objects in the database, and report
     on results
     """
+    settings.SHEETS_MAX_CONCURRENT_REQUESTS = max_concurrent_requests
     handler = CouponRequestHandler()
     result = handler.process_sheet()
     expected_processed_rows = {6, 8}
@@ -123,8 +130,44 @@ def test_full_sheet_process(
     assert patched_sheets_api.share_drive_file.call_count == len(
         expected_processed_rows
     )
+    assert BulkCouponAssignment.objects.count() == len(expected_processed_rows)
     # New companies should have been created during the processing
     assert list(Company.objects.order_by("name").values_list("name", flat=True)) == [
         "MIT",
         "MIT Open Learning",
     ]
+
+
+def test_sheet_process_failed_row_kept(
+    mocker,
+    settings,
+    pygsheets_fixtures,  # noqa: ARG001
+    patched_sheets_api,  # noqa: ARG001
+    request_csv_rows,
+):
+    """
+    CouponRequestHandler.process_sheet should keep the request for a row that raised an error, so that
+    the row is ignored on the next run once its error is in the sheet
+    """
+    mocker.patch(
+        "sheets.coupon_request_api.create_coupons_for_request_row",
+        side_effect=Exception("coupon creation failed"),
+    )
+    failed_row_index = 6
+    result = CouponRequestHandler().process_sheet()
+    assert failed_row_index in result[ResultType.FAILED.value]
+    coupon_name = request_csv_rows[failed_row_index - 2][1]
+    coupon_gen_request = CouponGenerationRequest.objects.get(coupon_name=coupon_name)
+    assert coupon_gen_request.date_completed is None
+    assert Coupon.objects.count() == 0
+
+    # The handler writes the error to the sheet, which is read back on the next run
+    request_csv_rows[failed_row_index - 2][settings.SHEETS_REQ_ERROR_COL] = (
+        "Error: coupon creation failed"
+    )
+    result = CouponRequestHandler().process_sheet()
+    assert failed_row_index in result[ResultType.IGNORED.value]
+    assert (
+        CouponGenerationRequest.objects.get(coupon_name=coupon_name)
+        == coupon_gen_request
+    )
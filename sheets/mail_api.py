@@ -2,15 +2,23 @@
 
 import logging
 from collections import namedtuple
+from datetime import timedelta
 from urllib.parse import urlencode
 
 from django.conf import settings
+from django.db import transaction
+from mitol.common.utils import chunks
 
 from ecommerce.constants import BULK_ENROLLMENT_EMAIL_TAG
 from mail.constants import MAILGUN_API_DOMAIN
-from mitxpro.utils import has_all_keys, request_get_with_timeout_retry
-from sheets.constants import MAILGUN_API_TIMEOUT_RETRIES
-from sheets.utils import format_datetime_for_mailgun
+from mitxpro.utils import has_all_keys, now_in_utc, request_get_with_timeout_retry
+from sheets.constants import (
+    MAILGUN_API_TIMEOUT_RETRIES,
+    MAILGUN_EVENT_CURSOR_OVERLAP_MINUTES,
+    MAILGUN_EVENT_STORE_CHUNK_SIZE,
+)
+from sheets.models import BulkAssignmentMessageEvent, MailgunEventCursor
+from sheets.utils import format_datetime_for_mailgun, mailgun_timestamp_to_datetime
 
 log = logging.getLogger(__name__)
 
@@ -79,3 +87,90 @@ def get_bulk_assignment_messages(event=None, begin=None, end=None):
             resp_items = resp_data.get("items")
         else:
             resp_items = None
+
+
+def _store_bulk_assignment_messages(messages):
+    """
+    Saves bulk assignment messages to the local event store, skipping any that were already saved
+
+    Args:
+        messages (Iterable[BulkAssignmentMessage]): Messages fetched from the Mailgun API
+
+    Returns:
+        int: The number of messages that were fetched
+    """
+    num_messages = 0
+    for message_chunk in chunks(messages, chunk_size=MAILGUN_EVENT_STORE_CHUNK_SIZE):
+        BulkAssignmentMessageEvent.objects.bulk_create(
+            [
+                BulkAssignmentMessageEvent(
+                    bulk_assignment_id=message.bulk_assignment_id,
+                    coupon_code=message.coupon_code,
+                    email=message.email,
+                    event=message.event,
+                    event_date=mailgun_timestamp_to_datetime(message.timestamp),
+                )
+                for message in message_chunk
+            ],
+            ignore_conflicts=True,
+        )
+        num_messages += len(message_chunk)
+    return num_messages
+
+
+def sync_bulk_assignment_messages(earliest_date=None):
+    """
+    Copies bulk assignment emails from the Mailgun API into the local event store. Only the events that
+    are not already covered by the stored cursor window are fetched (plus a small trailing overlap, since
+    Mailgun events can take some time to become queryable).
+
+    Args:
+        earliest_date (datetime.datetime or None): The earliest date that the local event store needs to cover
+
+    Returns:
+        int: The number of messages that were fetched from Mailgun
+    """
+    end = now_in_utc()
+    cursor = MailgunEventCursor.objects.first()
+    overlap = timedelta(minutes=MAILGUN_EVENT_CURSOR_OVERLAP_MINUTES)
+    # If the requested date range starts before the stored window, the whole range has to be fetched.
+    if (
+        cursor is None
+        or cursor.window_end is None
+        or (
+            earliest_date is not None
+            and (cursor.window_start is None or earliest_date < cursor.window_start)
+        )
+    ):
+        begin = earliest_date
+        window_start = earliest_date
+    else:
+        begin = cursor.window_end - overlap
+        window_start = cursor.window_start
+    # Fetch the events before taking the cursor lock, so the lock isn't held during the Mailgun requests.
+    # Concurrent syncs may fetch overlapping events, which the unique constraint on the events skips.
+    messages = list(get_bulk_assignment_messages(begin=begin, end=end))
+
+    with transaction.atomic():
+        cursor = MailgunEventCursor.objects.select_for_update().first()
+        if cursor is None:
+            cursor = MailgunEventCursor.objects.create()
+        num_messages = _store_bulk_assignment_messages(messages)
+        # Another sync may have advanced the cursor in the meantime, so only ever widen the window.
+        # A window_start of None means the window covers every event up to window_end.
+        if (
+            cursor.window_end is None
+            or window_start is None
+            or (cursor.window_start is not None and window_start < cursor.window_start)
+        ):
+            cursor.window_start = window_start
+        if cursor.window_end is None or end > cursor.window_end:
+            cursor.window_end = end
+        cursor.save()
+    log.debug(
+        "Fetched %d bulk assignment message(s) from Mailgun (begin=%s, end=%s)",
+        num_messages,
+        begin,
+        end,
+    )
+    return num_messages
@@ -0,0 +1,92 @@
+"""Tests for sheets mail API"""
+
+from datetime import timedelta
+
+import pytest
+
+from mitxpro.utils import now_in_utc
+from sheets.constants import MAILGUN_EVENT_CURSOR_OVERLAP_MINUTES
+from sheets.mail_api import BulkAssignmentMessage, sync_bulk_assignment_messages
+from sheets.models import BulkAssignmentMessageEvent, MailgunEventCursor
+
+pytestmark = pytest.mark.django_db
+
+
+def _message(code, timestamp, event="delivered"):
+    """Builds a BulkAssignmentMessage for testing"""
+    return BulkAssignmentMessage(
+        bulk_assignment_id=1,
+        coupon_code=code,
+        email="a@b.com",
+        event=event,
+        timestamp=timestamp,
+    )
+
+
+def test_sync_bulk_assignment_messages(mocker):
+    """
+    sync_bulk_assignment_messages should store fetched messages, skip duplicates, and only fetch events
+    after the stored cursor window on subsequent runs
+    """
+    now = now_in_utc()
+    earliest_date = now - timedelta(days=3)
+    timestamp = (now - timedelta(days=1)).timestamp()
+    patched_get_messages = mocker.patch(
+        "sheets.mail_api.get_bulk_assignment_messages",
+        return_value=[_message("code1", timestamp), _message("code2", timestamp)],
+    )
+    assert sync_bulk_assignment_messages(earliest_date=earliest_date) == 2
+    assert patched_get_messages.call_args[1]["begin"] == earliest_date
+    cursor = MailgunEventCursor.objects.get()
+    assert cursor.window_start == earliest_date
+
+    patched_get_messages.return_value = [_message("code1", timestamp)]
+    assert sync_bulk_assignment_messages(earliest_date=earliest_date) == 1
+    assert patched_get_messages.call_args[1]["begin"] == cursor.window_end - timedelta(
+        minutes=MAILGUN_EVENT_CURSOR_OVERLAP_MINUTES
+    )
+    assert BulkAssignmentMessageEvent.objects.count() == 2
+
+
+def test_sync_bulk_assignment_messages_earlier_date(mocker):
+    """
+    sync_bulk_assignment_messages should fetch the full date range if the requested date is earlier
+    than the stored cursor window
+    """
+    now = now_in_utc()
+    MailgunEventCursor.objects.create(
+        window_start=now - timedelta(days=1), window_end=now
+    )
+    earliest_date = now - timedelta(days=5)
+    patched_get_messages = mocker.patch(
+        "sheets.mail_api.get_bulk_assignment_messages", return_value=[]
+    )
+    sync_bulk_assignment_messages(earliest_date=earliest_date)
+    assert patched_get_messages.call_args[1]["begin"] == earliest_date
+    assert MailgunEventCursor.objects.get().window_start == earliest_date
+
+
+def test_sync_bulk_assignment_messages_concurrent_sync(mocker):
+    """
+    sync_bulk_assignment_messages should fetch the events before locking the cursor, and keep a window
+    that another sync advanced in the meantime
+    """
+    now = now_in_utc()
+    MailgunEventCursor.objects.create(
+        window_start=now - timedelta(days=2), window_end=now - timedelta(days=1)
+    )
+    later_window_end = now + timedelta(hours=1)
+
+    def advance_cursor(**kwargs):  # noqa: ARG001
+        """Simulates another sync finishing while the events are fetched"""
+        MailgunEventCursor.objects.update(window_end=later_window_end)
+        return [_message("code1", now.timestamp())]
+
+    mocker.patch(
+        "sheets.mail_api.get_bulk_assignment_messages", side_effect=advance_cursor
+    )
+    assert sync_bulk_assignment_messages() == 1
+    cursor = MailgunEventCursor.objects.get()
+    assert cursor.window_start == now - timedelta(days=2)
+    assert cursor.window_end == later_window_end
+    assert BulkAssignmentMessageEvent.objects.count() == 1
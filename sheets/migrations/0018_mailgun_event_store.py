@@ -0,0 +1,68 @@
+# Generated by Django 5.2.17 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [("sheets", "0017_filewatchrenewalattempt")]
+
+    operations = [
+        migrations.CreateModel(
+            name="MailgunEventCursor",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True)),
+                ("updated_on", models.DateTimeField(auto_now=True)),
+                ("window_start", models.DateTimeField(blank=True, null=True)),
+                ("window_end", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={"abstract": False},
+        ),
+        migrations.CreateModel(
+            name="BulkAssignmentMessageEvent",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("bulk_assignment_id", models.IntegerField()),
+                ("coupon_code", models.CharField(max_length=50)),
+                ("email", models.EmailField(max_length=254)),
+                ("event", models.CharField(max_length=30)),
+                ("event_date", models.DateTimeField(db_index=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["bulk_assignment_id", "coupon_code"],
+                        name="sheets_bulkmsg_code_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=(
+                            "bulk_assignment_id",
+                            "coupon_code",
+                            "email",
+                            "event",
+                            "event_date",
+                        ),
+                        name="sheets_bulk_msg_unique_event",
+                    )
+                ],
+            },
+        ),
+    ]
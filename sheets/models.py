@@ -113,3 +113,49 @@ class FileWatchRenewalAttempt(Model):  # noqa: DJ008
     date_attempted = DateTimeField(auto_now_add=True)
     result = models.CharField(max_length=300, null=True, blank=True)  # noqa: DJ001
     result_status_code = PositiveSmallIntegerField(null=True, blank=True)
+
+
+class MailgunEventCursor(TimestampedModel, SingletonModel):
+    """
+    Tracks the window of Mailgun bulk assignment events that have already been copied into the local
+    BulkAssignmentMessageEvent store, so each run only needs to fetch events that are newer than that window.
+    """
+
+    window_start = models.DateTimeField(null=True, blank=True)
+    window_end = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"MailgunEventCursor: window_start={self.window_start}, window_end={self.window_end}"
+
+
+class BulkAssignmentMessageEvent(Model):
+    """Local copy of a Mailgun event for a bulk enrollment code email"""
+
+    bulk_assignment_id = models.IntegerField(null=False)
+    coupon_code = models.CharField(max_length=50, null=False)
+    email = models.EmailField(max_length=254, null=False)
+    event = models.CharField(max_length=30, null=False)
+    event_date = models.DateTimeField(db_index=True, null=False)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["bulk_assignment_id", "coupon_code"],
+                name="sheets_bulkmsg_code_idx",
+            )
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    "bulk_assignment_id",
+                    "coupon_code",
+                    "email",
+                    "event",
+                    "event_date",
+                ],
+                name="sheets_bulk_msg_unique_event",
+            )
+        ]
+
+    def __str__(self):
+        return f"BulkAssignmentMessageEvent: bulk_assignment_id={self.bulk_assignment_id}, coupon_code={self.coupon_code}, event={self.event}, event_date={self.event_date.isoformat()}"
@@ -142,7 +142,7 @@ class RefundRequestHandler(EnrollmentChangeRequestHandler):
             (Order, ProgramEnrollment or CourseRunEnrollment): The order and enrollment associated
                 with this refund request.
         """
-        user = User.objects.get(email__iexact=refund_req_row.learner_email)
+        user = User.objects.by_email(refund_req_row.learner_email).get()
         order = Order.objects.get(id=refund_req_row.order_id, purchaser=user)
         # The product id from the sheet may be a program run readable id (e.g. one
         # with a "+R24" run tag suffix). Resolve it to the underlying Program/CourseRun
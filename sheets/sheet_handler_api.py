@@ -7,6 +7,7 @@ import operator as op
 from django.conf import settings
 from django.db import transaction
 from django.utils.functional import cached_property
+from mitol.common.utils import chunks
 
 from mitxpro.utils import group_into_dict, item_at_index_or_none
 from sheets.api import get_authorized_pygsheets_client
@@ -35,6 +36,10 @@ class SheetHandler:
     pygsheets_client = None
     spreadsheet = None
     sheet_metadata = None
+    # Whether rows are processed in batches that share a transaction. Handlers that batch rows must make
+    # each row's changes in a savepoint (see CouponRequestHandler.process_row), so that a failed row
+    # doesn't break the batch. Rows of handlers that don't batch are processed without a transaction.
+    batch_rows = True
 
     @cached_property
     def worksheet(self):
@@ -186,6 +191,47 @@ class SheetHandler:
         """
         raise NotImplementedError
 
+    def process_row_safely(self, row_index, row_data):
+        """
+        Processes a single spreadsheet row, and returns a failed result if an exception was raised.
+
+        Args:
+            row_index (int): The row index according to the spreadsheet
+            row_data (List[str]): The raw data of the given spreadsheet row
+
+        Returns:
+            Optional[RowResult]: An object representing the results of processing the row, or None if
+                nothing needs to be done with this row.
+        """
+        try:
+            return self.process_row(row_index, row_data)
+        except Exception as exc:  # noqa: BLE001
+            return RowResult(
+                row_index=row_index,
+                row_db_record=None,
+                row_object=None,
+                result_type=ResultType.FAILED,
+                message=f"Error: {exc!s}",
+            )
+
+    def process_rows(self, enumerated_rows):
+        """
+        Processes spreadsheet rows one by one
+
+        Args:
+            enumerated_rows (Iterable[Tuple[int, List[str]]]): Row indices paired with a list of strings
+                representing the data in each row
+
+        Returns:
+            List[RowResult]: The results of the rows that needed something done
+        """
+        row_results = []
+        for row_index, row_data in enumerated_rows:
+            row_result = self.process_row_safely(row_index, row_data)
+            if row_result:
+                row_results.append(row_result)
+        return row_results
+
     def process_sheet(self, limit_row_index=None):
         """
         Ensures that all non-legacy rows in the spreadsheet are correctly represented in the database,
@@ -204,21 +250,14 @@ class SheetHandler:
         filtered_rows = self.filter_ignored_rows(enumerated_rows)
         valid_enumerated_rows, row_results = self.validate_sheet(filtered_rows)
 
-        for row_index, row_data in valid_enumerated_rows:
-            row_result = None
-            try:
-                row_result = self.process_row(row_index, row_data)
-            except Exception as exc:  # noqa: BLE001
-                row_result = RowResult(
-                    row_index=row_index,
-                    row_db_record=None,
-                    row_object=None,
-                    result_type=ResultType.FAILED,
-                    message=f"Error: {exc!s}",
-                )
-            finally:
-                if row_result:
-                    row_results.append(row_result)
+        if self.batch_rows:
+            for row_batch in chunks(
+                valid_enumerated_rows, chunk_size=settings.SHEETS_ROW_BATCH_SIZE
+            ):
+                with transaction.atomic():
+                    row_results.extend(self.process_rows(row_batch))
+        else:
+            row_results.extend(self.process_rows(valid_enumerated_rows))
         if not row_results:
             return {}
         grouped_row_results = group_into_dict(
@@ -237,6 +276,10 @@ class EnrollmentChangeRequestHandler(SheetHandler):
     Base class for managing the processing of enrollment change requests from a spreadsheet
     """
 
+    # Refunds and deferrals change enrollments through the edX API, which a rolled back transaction
+    # couldn't undo, so the rows aren't processed in a transaction
+    batch_rows = False
+
     def __init__(self, worksheet_id, start_row, sheet_metadata, request_model_cls):
         """
 
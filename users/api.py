@@ -1,19 +1,33 @@
 """Users api"""
 
-import operator
-from functools import reduce
+from collections import namedtuple
+from urllib.parse import urlparse
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
-from django.db.models import Q
+from django.db import transaction
+from mitol.common.utils import chunks
+from social_django.models import UserSocialAuth
+from user_util import user_util
 
-from mitxpro.utils import first_or_none, unique, unique_ignore_case
+from authentication.blocklist import bump_blocklist_version
+from authentication.utils import get_md5_hash
+from mitxpro.utils import first_or_none, now_in_utc, unique, unique_ignore_case
+from users.models import BlockList
 
 User = get_user_model()
 
 CASE_INSENSITIVE_SEARCHABLE_FIELDS = {"email"}
 
+RETIRED_USER_SALTS = ["mitxpro-retired-email"]
+
+RetiredUsers = namedtuple(  # noqa: PYI024
+    "RetiredUsers", ["retired", "already_inactive", "blocked_emails"]
+)
+BlockedEmails = namedtuple("BlockedEmails", ["added", "already_blocked"])  # noqa: PYI024
+
 
 def get_user_by_id(user_id):
     """
@@ -73,11 +87,11 @@ def fetch_user(filter_value, ignore_case=True):  # noqa: FBT002
     filter_field = _determine_filter_field(filter_value)
 
     if _is_case_insensitive_searchable(filter_field) and ignore_case:
-        query = {f"{filter_field}__iexact": filter_value}
+        user_qset = User.objects.by_email(filter_value)
     else:
-        query = {filter_field: filter_value}
+        user_qset = User.objects.filter(**{filter_field: filter_value})
     try:
-        return User.objects.get(**query)
+        return user_qset.get()
     except User.DoesNotExist as e:
         raise User.DoesNotExist(
             "Could not find User with {}={} ({})".format(  # noqa: EM103
@@ -120,14 +134,7 @@ def fetch_users(filter_values, ignore_case=True):  # noqa: FBT002
         )
 
     if is_case_insensitive_searchable and ignore_case:
-        query = reduce(
-            operator.or_,
-            (
-                Q(**{f"{filter_field}__iexact": filter_value})
-                for filter_value in filter_values
-            ),
-        )
-        user_qset = User.objects.filter(query)
+        user_qset = User.objects.by_emails(filter_values)
     else:
         user_qset = User.objects.filter(**{f"{filter_field}__in": filter_values})
     if user_qset.count() != len(filter_values):
@@ -141,3 +148,115 @@ def fetch_users(filter_values, ignore_case=True):  # noqa: FBT002
             )
         )
     return user_qset
+
+
+def get_retired_email(email):
+    """Convert user email to retired email format."""
+    return user_util.get_retired_email(
+        email,
+        RETIRED_USER_SALTS,
+        "retired_email_{}@retired." + f"{urlparse(settings.SITE_BASE_URL).netloc}",
+    )
+
+
+def block_emails(emails, *, dry_run=False):
+    """
+    Adds the hashes of some emails to the blocklist
+
+    Args:
+        emails (iterable of str): The emails to block
+        dry_run (bool): If True, only report what would be blocked
+
+    Returns:
+        BlockedEmails: The emails that were added to the blocklist, and the emails that were already on it
+    """
+    emails_by_hash = {}
+    for email in emails:
+        if email:
+            emails_by_hash.setdefault(get_md5_hash(email).hexdigest(), email)
+
+    already_blocked_hashes = set()
+    for hash_chunk in chunks(
+        emails_by_hash, chunk_size=settings.USER_RETIREMENT_BATCH_SIZE
+    ):
+        already_blocked_hashes.update(
+            BlockList.objects.filter(hashed_email__in=hash_chunk).values_list(
+                "hashed_email", flat=True
+            )
+        )
+    new_hashes = [
+        hashed_email
+        for hashed_email in emails_by_hash
+        if hashed_email not in already_blocked_hashes
+    ]
+    if not dry_run and new_hashes:
+        BlockList.objects.bulk_create(
+            [BlockList(hashed_email=hashed_email) for hashed_email in new_hashes],
+            batch_size=settings.USER_RETIREMENT_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        # bulk_create doesn't send post_save
+        bump_blocklist_version()
+    return BlockedEmails(
+        added=[emails_by_hash[hashed_email] for hashed_email in new_hashes],
+        already_blocked=[
+            emails_by_hash[hashed_email] for hashed_email in already_blocked_hashes
+        ],
+    )
+
+
+def retire_users(users, *, block=False, dry_run=False, progress_callback=None):
+    """
+    Retires users in batches of USER_RETIREMENT_BATCH_SIZE: they're deactivated, their emails are replaced
+    with retired emails, their passwords are made unusable and their social auth records are deleted.
+    Each batch is updated with a handful of queries in a single transaction.
+
+    Args:
+        users (iterable of User): The users to retire
+        block (bool): If True, the users' original emails are added to the blocklist
+        dry_run (bool): If True, only report what would be changed
+        progress_callback (callable): Called with the number of users retired so far and the total after each batch
+
+    Returns:
+        RetiredUsers: The retired users with their original emails, the users which were already inactive,
+            and the emails which were newly added to the blocklist
+    """
+    already_inactive = []
+    active_users = []
+    for user in users:
+        (active_users if user.is_active else already_inactive).append(user)
+
+    retired = []
+    blocked_emails = []
+    for user_chunk in chunks(
+        active_users, chunk_size=settings.USER_RETIREMENT_BATCH_SIZE
+    ):
+        original_emails = [user.email for user in user_chunk]
+        with transaction.atomic():
+            if block:
+                blocked_emails.extend(
+                    block_emails(original_emails, dry_run=dry_run).added
+                )
+
+            now = now_in_utc()
+            for user in user_chunk:
+                user.is_active = False
+                user.email = get_retired_email(user.email)
+                user.set_unusable_password()
+                user.updated_on = now
+
+            if not dry_run:
+                User.objects.bulk_update(
+                    user_chunk, ["is_active", "email", "password", "updated_on"]
+                )
+                UserSocialAuth.objects.filter(user__in=user_chunk).delete()
+
+        retired.extend(zip(user_chunk, original_emails))
+        if progress_callback is not None:
+            progress_callback(len(retired), len(active_users))
+
+    return RetiredUsers(
+        retired=retired,
+        already_inactive=already_inactive,
+        blocked_emails=blocked_emails,
+    )
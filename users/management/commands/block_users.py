@@ -7,9 +7,9 @@ from argparse import RawTextHelpFormatter
 
 from django.core.management import BaseCommand
 
-from authentication.utils import block_user_email
 from mail.api import validate_email_addresses
 from mail.exceptions import MultiEmailValidationError
+from users.api import block_emails
 
 
 class Command(BaseCommand):
@@ -25,6 +25,9 @@ class Command(BaseCommand):
 
     For multiple users, add arg `--user` for each user i.e:\n
     `./manage.py block_users --user=foo@email.com --user=bar@email.com --user=abc@email.com` or do \n
+
+    To report what would be blocked without changing anything use --dry-run:\n
+    `./manage.py block_users --user=foo@email.com --dry-run`
     """
 
     def create_parser(self, prog_name, subcommand):
@@ -46,6 +49,13 @@ class Command(BaseCommand):
             help="Single or multiple username(s) or email(s)",
         )
 
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            dest="dry_run",
+            help="If provided, report what would be blocked without changing anything",
+        )
+
     def handle(self, *args, **kwargs):  # noqa: ARG002
         users = kwargs.get("users", [])
         if not users:
@@ -66,7 +76,22 @@ class Command(BaseCommand):
             )
             sys.exit(2)
 
-        for user_email in users:
-            msg = block_user_email(email=user_email)
-            if msg:
-                self.stdout.write(self.style.SUCCESS(msg))
+        if kwargs.get("dry_run"):
+            self.stdout.write(self.style.WARNING("Dry run, no changes will be saved"))
+
+        result = block_emails(users, dry_run=kwargs.get("dry_run"))
+        for email in result.added:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Email {email} is added to the blocklist of MIT xPRO."
+                )
+            )
+        for email in result.already_blocked:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Email {email} is already marked blocked for MIT xPRO."
+                )
+            )
+        self.stdout.write(
+            f"Blocked {len(result.added)} emails, {len(result.already_blocked)} were already blocked"
+        )
@@ -4,24 +4,14 @@ Retire user(s) from MIT xPRO
 
 import sys
 from argparse import RawTextHelpFormatter
-from urllib.parse import urlparse
 
 from django.contrib.auth import get_user_model
 from django.core.management import BaseCommand
-from social_django.models import UserSocialAuth
-from user_util import user_util
 
-from authentication.utils import block_user_email
-from mitxpro import settings
-from users.api import fetch_users
+from users.api import fetch_users, retire_users
 
 User = get_user_model()
 
-RETIRED_USER_SALTS = ["mitxpro-retired-email"]
-RETIRED_EMAIL_FMT = (
-    "retired_email_{}@retired." + f"{urlparse(settings.SITE_BASE_URL).netloc}"
-)
-
 
 class Command(BaseCommand):
     """
@@ -44,6 +34,9 @@ class Command(BaseCommand):
     For blocking user(s) use --block option:\n
     `./manage.py retire_users --user=foo@email.com --block` or do \n
     `./manage.py retire_users -u foo@email.com -b` \n or do \n
+
+    To report what would be changed without changing anything use --dry-run:\n
+    `./manage.py retire_users -u foo -u bar --dry-run`
     """
 
     def create_parser(self, prog_name, subcommand):
@@ -73,9 +66,16 @@ class Command(BaseCommand):
             help="If provided, user's email will be hashed and added to the blocklist",
         )
 
-    def get_retired_email(self, email):
-        """Convert user email to retired email format."""
-        return user_util.get_retired_email(email, RETIRED_USER_SALTS, RETIRED_EMAIL_FMT)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            dest="dry_run",
+            help="If provided, report what would be changed without changing anything",
+        )
+
+    def report_progress(self, retired_count, total_count):
+        """Report how many users have been retired so far"""
+        self.stdout.write(f"Retired {retired_count}/{total_count} users")
 
     def handle(self, *args, **kwargs):  # noqa: ARG002
         users = kwargs.get("users", [])
@@ -90,43 +90,31 @@ class Command(BaseCommand):
             sys.exit(1)
 
         users = fetch_users(kwargs["users"])
+        dry_run = kwargs.get("dry_run")
+        if dry_run:
+            self.stdout.write(self.style.WARNING("Dry run, no changes will be saved"))
+
+        result = retire_users(
+            users,
+            block=block_users,
+            dry_run=dry_run,
+            progress_callback=self.report_progress,
+        )
 
-        for user in users:
-            self.stdout.write(f"Retiring user: {user}")
-            if not user.is_active:
-                self.stdout.write(
-                    self.style.ERROR(
-                        "User: '{user}' is already deactivated in MIT xPRO".format(  # noqa: UP032
-                            user=user
-                        )
-                    )
+        for user in result.already_inactive:
+            self.stdout.write(
+                self.style.ERROR(f"User: '{user}' is already deactivated in MIT xPRO")
+            )
+        for email in result.blocked_emails:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Email {email} is added to the blocklist of MIT xPRO."
                 )
-                continue
-
-            user.is_active = False
-
-            # Change user password & email
-            email = user.email
-
-            if block_users:
-                msg = block_user_email(email=email)
-                if msg:
-                    self.stdout.write(self.style.SUCCESS(msg))
-
-            user.email = self.get_retired_email(user.email)
-            user.set_unusable_password()
-            user.save()
-
+            )
+        for user, email in result.retired:
             self.stdout.write(
                 f"Email changed from {email} to {user.email} and password is not useable now"
             )
-
-            # reset user social auth
-            auth_deleted_count = UserSocialAuth.objects.filter(user=user).delete()
-
-            if auth_deleted_count:
-                self.stdout.write(f"For  user: '{user}' SocialAuth rows deleted")
-
             self.stdout.write(
                 self.style.SUCCESS(f"User: '{user}' is retired from MIT xPRO")
             )
@@ -64,3 +64,21 @@ class TestblockUsers(TestCase):
         test_email = "test.com"
         with self.assertRaises(SystemExit):  # noqa: PT027
             COMMAND.handle("block_users", users=[test_email])
+
+    @pytest.mark.django_db
+    def test_block_users_dry_run(self):
+        """Test block_users command doesn't change anything in a dry run"""
+        COMMAND.handle("block_users", users=["foo@test.com"], dry_run=True)
+        assert BlockList.objects.all().count() == 0
+
+    @pytest.mark.django_db
+    def test_block_users_already_blocked(self):
+        """Test block_users command only adds emails which aren't blocked yet"""
+        BlockList.objects.create(
+            hashed_email=hashlib.md5(b"foo@test.com").hexdigest()  # noqa: S324
+        )
+
+        COMMAND.handle(
+            "block_users", users=["FOO@test.com", "bar@test.com", "Bar@test.com"]
+        )
+        assert BlockList.objects.all().count() == 2
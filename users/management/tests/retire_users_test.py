@@ -147,3 +147,57 @@ def test_user_blocking_if_not_requested():
     assert "retired_email" in user.email
     assert UserSocialAuth.objects.filter(user=user).count() == 0
     assert BlockList.objects.all().count() == 0
+
+
+@pytest.mark.django_db
+def test_retire_users_dry_run():
+    """Test retire_users command doesn't change anything in a dry run"""
+    users = UserFactory.create_batch(2, is_active=True)
+    for user in users:
+        UserSocialAuthFactory.create(user=user, provider="edX")
+
+    COMMAND.handle(
+        "retire_users",
+        users=[user.email for user in users],
+        block_users=True,
+        dry_run=True,
+    )
+
+    for user in users:
+        user.refresh_from_db()
+        assert user.is_active is True
+        assert "retired_email" not in user.email
+        assert user.has_usable_password() is True
+        assert UserSocialAuth.objects.filter(user=user).count() == 1
+    assert BlockList.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_retire_users_in_batches(settings, mocker):
+    """Test retire_users command retires users in batches and reports progress"""
+    settings.USER_RETIREMENT_BATCH_SIZE = 2
+    users = UserFactory.create_batch(3, is_active=True)
+    inactive_user = UserFactory.create(is_active=False)
+    BlockList.objects.create(
+        hashed_email=hashlib.md5(users[0].email.lower().encode("utf-8")).hexdigest()  # noqa: S324
+    )
+    mock_progress = mocker.patch.object(COMMAND, "report_progress")
+
+    COMMAND.handle(
+        "retire_users",
+        users=[user.email.upper() for user in [*users, inactive_user]],
+        block_users=True,
+    )
+
+    assert [call.args for call in mock_progress.call_args_list] == [(2, 3), (3, 3)]
+    assert (
+        User.objects.filter(
+            id__in=[user.id for user in users],
+            is_active=False,
+            email__startswith="retired_email",
+        ).count()
+        == 3
+    )
+    inactive_user.refresh_from_db()
+    assert "retired_email" not in inactive_user.email
+    assert BlockList.objects.count() == 3
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.17 on 2026-10-19 12:00
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicate_hashed_emails(apps, schema_editor):
+    """Keep only the earliest blocklist entry for each hashed email"""
+    BlockList = apps.get_model("users", "BlockList")
+    for duplicate in (
+        BlockList.objects.values("hashed_email")
+        .annotate(min_id=Min("id"), count=Count("id"))
+        .filter(count__gt=1)
+    ):
+        BlockList.objects.filter(hashed_email=duplicate["hashed_email"]).exclude(
+            id=duplicate["min_id"]
+        ).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        (
+            "users",
+            "0017_rename_changeemailrequest_expires_on_confirmed_code_users_chang_expires_dbd4e5_idx",
+        ),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_hashed_emails, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="blocklist",
+            name="hashed_email",
+            field=models.CharField(max_length=128, unique=True),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.17 on 2026-10-19 12:00
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0018_blocklist_unique_hashed_email"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                django.db.models.functions.text.Upper("email"),
+                name="users_user_upper_email_idx",
+            ),
+        ),
+    ]
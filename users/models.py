@@ -10,6 +10,7 @@ from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
 from django.db.models import Count, Q
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
 from affiliate.models import AffiliateReferralAction
@@ -118,6 +119,19 @@ class UserManager(BaseUserManager):
 
         return self._create_user(username, email, password, **extra_fields)
 
+    def by_email(self, email):
+        """
+        Returns a queryset of the user with an email, ignoring case. This is an iexact lookup,
+        which is served by the uppercased email index.
+        """
+        return self.filter(email__iexact=email)
+
+    def by_emails(self, emails):
+        """Returns a queryset of the users with any of some emails, ignoring case"""
+        return self.alias(uppercased_email=Upper("email")).filter(
+            uppercased_email__in={email.upper() for email in emails}
+        )
+
 
 class FaultyCoursewareUserManager(BaseUserManager):
     """User manager that defines a queryset of Users that are incorrectly configured in the courseware"""
@@ -161,6 +175,12 @@ class User(AbstractBaseUser, TimestampedModel, PermissionsMixin):
     objects = UserManager()
     faulty_courseware_users = FaultyCoursewareUserManager()
 
+    class Meta:
+        indexes = (
+            # email__iexact compares UPPER(email), so this index serves case-insensitive email lookups
+            models.Index(Upper("email"), name="users_user_upper_email_idx"),
+        )
+
     def get_full_name(self):
         """Return the user's fullname"""
         return self.name
@@ -320,4 +340,4 @@ class Profile(TimestampedModel):
 class BlockList(TimestampedModel):
     """A user's blocklist model"""
 
-    hashed_email = models.CharField(max_length=128)
+    hashed_email = models.CharField(max_length=128, unique=True)
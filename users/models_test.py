@@ -79,6 +79,19 @@ def test_create_superuser_error(kwargs):
         )
 
 
+def test_user_by_email():
+    """User.objects.by_email and by_emails should match emails regardless of case"""
+    user = UserFactory.create(email="Jane.Doe@Example.com")
+    other_user = UserFactory.create(email="john@example.com")
+    UserFactory.create(email="someone@example.com")
+
+    assert list(User.objects.by_email("jane.doe@EXAMPLE.com")) == [user]
+    assert not User.objects.by_email("jane@example.com").exists()
+    assert set(
+        User.objects.by_emails(["JANE.DOE@example.com", "John@Example.com", "x@y.com"])
+    ) == {user, other_user}
+
+
 @pytest.mark.parametrize(
     "field, value, is_valid",  # noqa: PT006
     [
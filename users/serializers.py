@@ -15,6 +15,7 @@ from courseware.tasks import change_edx_user_email_async
 from ecommerce.api import fetch_and_serialize_unused_coupons
 from hubspot_xpro.task_helpers import sync_hubspot_user
 from mail import verification_api
+from mitxpro.outbox import enqueue_task
 from mitxpro.serializers import WriteableSerializerMethodField
 from users.constants import USER_REGISTRATION_FAILED_MSG
 from users.models import ChangeEmailRequest, LegalAddress, Profile, User
@@ -453,7 +454,7 @@ class ChangeEmailRequestUpdateSerializer(serializers.ModelSerializer):
                 user_social_auth.delete()
             except UserSocialAuth.DoesNotExist:
                 pass
-            change_edx_user_email_async.delay(user.id)
+            enqueue_task(change_edx_user_email_async, args=(user.id,))
 
         return result
 
@@ -4,6 +4,7 @@ import pytest
 from rest_framework.exceptions import ValidationError
 
 from affiliate.factories import AffiliateFactory
+from hubspot_xpro.tasks import sync_contact_with_hubspot
 from users.factories import UserFactory
 from users.models import ChangeEmailRequest
 from users.serializers import (
@@ -15,8 +16,8 @@ from users.serializers import (
 
 @pytest.fixture
 def mock_user_sync(mocker):
-    """Yield a mock hubspot_xpro update task for contacts"""
-    return mocker.patch("hubspot_xpro.tasks.sync_contact_with_hubspot.delay")
+    """Yield a mock for enqueueing the hubspot_xpro update task for contacts"""
+    return mocker.patch("hubspot_xpro.task_helpers.enqueue_task")
 
 
 @pytest.fixture
@@ -152,7 +153,7 @@ def test_update_user_serializer(
     serializer.save()
     assert user.legal_address.street_address_1 == sample_address.get("street_address_1")
     if hubspot_api_key is not None:
-        mock_user_sync.assert_called_with(user.id)
+        mock_user_sync.assert_called_with(sync_contact_with_hubspot, args=(user.id,))
     else:
         mock_user_sync.assert_not_called()
 
@@ -176,7 +177,7 @@ def test_create_user_serializer(
     assert serializer.is_valid()
     user = serializer.save()
     if hubspot_api_key is not None:
-        mock_user_sync.assert_called_with(user.id)
+        mock_user_sync.assert_called_with(sync_contact_with_hubspot, args=(user.id,))
     else:
         mock_user_sync.assert_not_called()
 
@@ -226,7 +227,9 @@ def test_create_email_change_request_same_email(user):
 
 
 @pytest.mark.parametrize("raises_error", [False, True])
-def test_update_user_email(mocker, user, raises_error):
+def test_update_user_email(
+    mocker, user, raises_error, django_capture_on_commit_callbacks
+):
     """Test that update edx user email takes the correct action"""
 
     mock_update_edx_user_email = mocker.patch(
@@ -246,8 +249,9 @@ def test_update_user_email(mocker, user, raises_error):
     change_request = ChangeEmailRequest.objects.create(user=user, new_email=new_email)
     serializer = ChangeEmailRequestUpdateSerializer(change_request, {"confirmed": True})
     try:
-        serializer.is_valid()
-        serializer.save()
+        with django_capture_on_commit_callbacks(execute=True):
+            serializer.is_valid()
+            serializer.save()
     except ValidationError:
         pass
 
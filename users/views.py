@@ -1,13 +1,21 @@
 """User views"""
 
+import hashlib
+from functools import cache
+
 import pycountry
+from django.conf import settings
 from django.db import transaction
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags, quote_etag
 from oauth2_provider.contrib.rest_framework import IsAuthenticatedOrTokenHasScope
 from rest_framework import mixins, viewsets
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.response import Response
+from rest_framework.renderers import JSONRenderer
 
 from courseware import tasks
+from mitxpro.outbox import enqueue_task
 from mitxpro.permissions import UserIsOwnerPermission
 from mitxpro.utils import now_in_utc
 from users.models import ChangeEmailRequest, User
@@ -48,7 +56,7 @@ class CurrentUserRetrieveUpdateViewSet(
             user_name = request.user.name
             update_result = super().update(request, *args, **kwargs)
             if user_name != request.data.get("name"):
-                tasks.change_edx_user_name_async.delay(request.user.id)
+                enqueue_task(tasks.change_edx_user_name_async, args=(request.user.id,))
             return update_result
 
 
@@ -79,13 +87,34 @@ class ChangeEmailRequestViewSet(
             return ChangeEmailRequestUpdateSerializer
 
 
+@cache
+def get_countries_states_payload():
+    """
+    Returns the rendered countries/states list and its ETag. The list only changes when pycountry is
+    upgraded, so it's built once per process.
+
+    Returns:
+        tuple of (bytes, str): The JSON content and its quoted ETag
+    """
+    queryset = sorted(pycountry.countries, key=lambda country: country.name)
+    content = JSONRenderer().render(CountrySerializer(queryset, many=True).data)
+    return content, quote_etag(hashlib.md5(content).hexdigest())  # noqa: S324
+
+
 class CountriesStatesViewSet(viewsets.ViewSet):
     """Retrieve viewset of countries, with states/provinces for US and Canada"""
 
     permission_classes = []
 
-    def list(self, request):  # noqa: ARG002
+    def list(self, request):
         """Get generator for countries/states list"""
-        queryset = sorted(pycountry.countries, key=lambda country: country.name)
-        serializer = CountrySerializer(queryset, many=True)
-        return Response(serializer.data)
+        content, etag = get_countries_states_payload()
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(content, content_type="application/json")
+        response["ETag"] = etag
+        patch_cache_control(
+            response, public=True, max_age=settings.COUNTRIES_API_CACHE_MAX_AGE
+        )
+        return response
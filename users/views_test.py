@@ -126,6 +126,21 @@ def test_countries_states_view(client):
     assert countries.get("TW").get("name") == "Taiwan"
 
 
+@pytest.mark.django_db
+def test_countries_states_view_etag(settings, client):
+    """Test that the countries list is served with cache headers and answers a matching If-None-Match with a 304"""
+    settings.COUNTRIES_API_CACHE_MAX_AGE = 600
+    resp = client.get(reverse("countries_api-list"))
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp["Cache-Control"] == "public, max-age=600"
+    etag = resp["ETag"]
+
+    resp = client.get(reverse("countries_api-list"), HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == status.HTTP_304_NOT_MODIFIED
+    assert resp["ETag"] == etag
+    assert resp.content == b""
+
+
 def test_create_email_change_request_invalid_password(user_drf_client, user):
     """Test that invalid password is returned"""
     resp = user_drf_client.post(
@@ -237,7 +252,9 @@ def test_update_user_name_change(mocker, user_client, user, valid_address_dict):
 
 
 @pytest.mark.usefixtures("mock_validate_user_registration")
-def test_update_user_name_change_edx(mocker, user_client, user, valid_address_dict):
+def test_update_user_name_change_edx(
+    mocker, user_client, user, valid_address_dict, django_capture_on_commit_callbacks
+):
     """Test that PATCH on user/me also calls update user's name api in edX if there is a name change in xPRO"""
     new_name = fuzzy.FuzzyText(prefix="Test-").fuzz()
     update_edx_mock = mocker.patch("courseware.api.update_edx_user_name")
@@ -246,9 +263,10 @@ def test_update_user_name_change_edx(mocker, user_client, user, valid_address_di
         "email": user.email,
         "legal_address": valid_address_dict,
     }
-    resp = user_client.patch(
-        reverse("users_api-me"), content_type="application/json", data=payload
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        resp = user_client.patch(
+            reverse("users_api-me"), content_type="application/json", data=payload
+        )
 
     assert resp.status_code == status.HTTP_200_OK
     # Checks that update edx user was called and only once when there was a change in user's name(Full Name)